@@ -0,0 +1,351 @@
+"""Asyncio Jira client for the high-concurrency seeding path.
+
+AsyncJiraManager mirrors JiraManager's operations as coroutines on one shared
+httpx.AsyncClient, so thousands of requests can be in flight on a single event
+loop without a thread each. Requests go through the same rate limiting, retry,
+per-endpoint accounting and instrumentation as the synchronous client. Requires
+httpx (and h2 for INPUT_HTTP2=true).
+"""
+import asyncio
+import json
+import os
+import time
+
+import httpx
+from jira.exceptions import JIRAError
+
+from async_tasks import run_all
+from instrumentation import Instrumentation, payload_size
+from jira_client import RequestThrottle, endpoint_name
+from metadata_cache import get_metadata_cache
+from ticket_generator import BULK_CREATE_LIMIT, SPRINT_ASSIGN_LIMIT
+from workflow_planner import get_workflow_planner
+
+
+def async_concurrency():
+    """Requests in flight at once on the async path"""
+    return max(1, int(os.getenv('INPUT_ASYNC_CONCURRENCY', 100)))
+
+
+class AsyncRequestThrottle(RequestThrottle):
+    """RequestThrottle for an httpx.AsyncClient: waits for tokens and retries without blocking the loop.
+
+    Pass `limiter` (a synchronous client's RateLimiter) to draw from the same
+    bucket, so requests from both clients together stay within the rate.
+    """
+
+    def __init__(self, requests_per_second=10, max_retries=5, base_delay=0.5, max_delay=30, instrumentation=None,
+                 limiter=None):
+        super().__init__(requests_per_second, max_retries, base_delay, max_delay, instrumentation)
+        if limiter is not None:
+            self.limiter = limiter
+
+    async def request(self, client, method, url, **kwargs):
+        endpoint = endpoint_name(method, url)
+        with self.instrumentation.call('jira', endpoint, request_bytes=payload_size(kwargs)) as record:
+            attempt = 0
+            record['latency_ms'] = 0.0
+            while True:
+                started = time.perf_counter()
+                await self.limiter.acquire_async()
+                sent = time.perf_counter()
+                record['wait_ms'] += (sent - started) * 1000
+                response = None
+                error = None
+                try:
+                    response = await client.request(method, url, **kwargs)
+                    if response.status_code >= 400:
+                        error = JIRAError(response.text, response.status_code, str(response.url), response=response)
+                except httpx.TransportError as e:
+                    error = e
+
+                self._record_attempt(record, attempt, sent, response)
+                if error is None:
+                    return response
+                if attempt >= self.max_retries or not self._is_retryable(method, response):
+                    raise error
+
+                delay = self._retry_delay(response, attempt)
+                record['wait_ms'] += delay * 1000
+                await asyncio.sleep(delay)
+                attempt += 1
+
+
+class AsyncJiraManager:
+    """Coroutine versions of JiraManager's create, sprint, transition, comment, worklog and label operations.
+
+    Use as an async context manager so the connection pool is closed with the
+    run. Pass `metadata` (a synchronous client's MetadataCache) to share its
+    field IDs, boards and transition graph; cache misses are resolved on a
+    worker thread so the loop keeps running.
+    """
+
+    def __init__(self, server=None, email=None, api_token=None, project_key=None, concurrency=None, timeout=None,
+                 metadata=None, instrumentation=None, throttle=None, limiter=None):
+        server = server or os.getenv('JIRA_SERVER')
+        transport = None
+        if server.startswith('memory://') or server.startswith('http://jira.memory'):
+            from fake_jira import MEMORY_SERVER_URL, memory_transport
+            server, transport = MEMORY_SERVER_URL, memory_transport()
+        self.project_key = project_key or os.getenv('JIRA_PROJECT_KEY')
+        self.concurrency = concurrency or async_concurrency()
+        self.metadata = metadata
+        self.instrumentation = instrumentation or Instrumentation.from_env()
+        self.throttle = throttle or AsyncRequestThrottle(
+            requests_per_second=float(os.getenv('INPUT_REQUESTS_PER_SECOND', 10)),
+            max_retries=int(os.getenv('INPUT_MAX_RETRIES', 5)),
+            instrumentation=self.instrumentation,
+            limiter=limiter
+        )
+        self.client = httpx.AsyncClient(
+            base_url=server.rstrip('/'),
+            auth=(email or os.getenv('JIRA_EMAIL') or 'memory', api_token or os.getenv('JIRA_API_TOKEN') or 'memory'),
+            headers={'Content-Type': 'application/json', 'Accept': 'application/json'},
+            # One keep-alive connection per concurrent request; the limiter, not the pool, sets the pace
+            limits=httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency),
+            timeout=httpx.Timeout(timeout or float(os.getenv('INPUT_REQUEST_TIMEOUT', 30))),
+            http2=os.getenv('INPUT_HTTP2', 'false').lower() == 'true',
+            transport=transport
+        )
+        self._fields = None
+
+    @classmethod
+    def for_client(cls, jira, **kwargs):
+        """An async manager on the same server, credentials, caches, counters and rate limit as a synchronous client"""
+        email, api_token = jira._session.auth
+        throttle = getattr(jira, 'throttle', None)
+        return cls(jira.server_url, email, api_token, metadata=get_metadata_cache(jira),
+                   instrumentation=getattr(jira, 'instrumentation', None),
+                   limiter=throttle.limiter if throttle is not None else None, **kwargs)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        await self.client.aclose()
+
+    async def _request(self, method, path, body=None, api='api/2', params=None):
+        response = await self.throttle.request(
+            self.client, method, f"/rest/{api}/{path}",
+            content=json.dumps(body) if body is not None else None, params=params
+        )
+        return response.json() if response.content else None
+
+    async def _in_thread(self, function, *args):
+        return await asyncio.get_running_loop().run_in_executor(None, function, *args)
+
+    async def _field_id(self, name):
+        """Resolve a field ID by name, through the shared metadata cache when there is one"""
+        try:
+            if self.metadata is not None:
+                return await self._in_thread(self.metadata.field_id, name)
+            if self._fields is None:
+                self._fields = {field['name'].lower(): field['id'] for field in await self._request('GET', 'field')}
+            return self._fields.get(name.lower())
+        except Exception as e:
+            print(f"Warning: Could not fetch fields - {str(e)}")
+            return None
+
+    async def _get_scrum_board_id(self):
+        if self.metadata is not None:
+            return await self._in_thread(
+                lambda: self.metadata.find_board(self.project_key, f"{self.project_key} Scrum Board")
+                or self.metadata.board_id(self.project_key)
+            )
+        boards = await self._request('GET', 'board', api='agile/1.0',
+                                     params={'projectKeyOrId': self.project_key, 'type': 'scrum'})
+        values = boards.get('values', [])
+        return values[0]['id'] if values else None
+
+    async def create_epic(self, epic_data):
+        """Create an epic in Jira"""
+        # Handle both string and Message object responses
+        if hasattr(epic_data, 'content'):
+            epic_data = epic_data.content
+        epic_dict = json.loads(epic_data)
+        return await self._request('POST', 'issue', {'fields': {
+            'project': {'key': self.project_key},
+            'summary': epic_dict['summary'],
+            'description': epic_dict['description'],
+            'issuetype': {'name': 'Epic'}
+        }})
+
+    async def create_sprint(self, sprint_data):
+        """Create a sprint on the project's Scrum board"""
+        try:
+            board_id = await self._get_scrum_board_id()
+            return await self._request('POST', 'sprint', {
+                'name': sprint_data['name'],
+                'originBoardId': board_id,
+                'startDate': sprint_data.get('startDate'),
+                'endDate': sprint_data.get('endDate'),
+                'goal': sprint_data.get('goal')
+            }, api='agile/1.0')
+        except Exception as e:
+            print(f"Warning: Could not create sprint - {str(e)}")
+            return None
+
+    async def create_ticket(self, ticket_data, epic_key=None, sprint_id=None):
+        """Create a Story from generated JSON content, optionally under an epic and in a sprint"""
+        # Handle both string and Message object responses
+        if hasattr(ticket_data, 'content'):
+            ticket_data = ticket_data.content
+        ticket_dict = json.loads(ticket_data)
+
+        issue_dict = {
+            'project': {'key': self.project_key},
+            'summary': ticket_dict['summary'],
+            'description': ticket_dict['description'],
+            'issuetype': {'name': 'Story'}
+        }
+        story_points_field = await self._field_id('story points')
+        if story_points_field:
+            try:
+                issue_dict[story_points_field] = float(ticket_dict['story_points'])
+            except Exception:
+                print("Warning: Could not set story points field")
+        if epic_key:
+            epic_link_field = await self._field_id('epic link')
+            if epic_link_field:
+                issue_dict[epic_link_field] = epic_key
+
+        issue = await self._request('POST', 'issue', {'fields': issue_dict})
+        if self.metadata is not None:
+            self.metadata.note_issue(issue['key'], 'Story')
+        if sprint_id:
+            await self.add_issues_to_sprint(sprint_id, [issue['key']])
+        return issue
+
+    async def create_issues(self, field_list):
+        """Bulk-create issues, 50 per request with the requests in flight together.
+
+        Returns one {'status', 'key', 'id', 'error'} entry per input, in input order.
+        """
+        async def create_chunk(chunk):
+            try:
+                result = await self._request('POST', 'issue/bulk', {'issueUpdates': [{'fields': f} for f in chunk]})
+            except JIRAError as e:
+                # A batch in which every issue failed comes back as a 400 listing the errors
+                try:
+                    result = e.response.json()
+                except (AttributeError, ValueError):
+                    result = None
+                if not isinstance(result, dict) or not result.get('errors'):
+                    return [{'status': 'Error', 'error': str(e)} for _ in chunk]
+            issues = iter(result.get('issues', []))
+            failed = {error.get('failedElementNumber'): error for error in result.get('errors', [])}
+            entries = []
+            for number in range(len(chunk)):
+                if number in failed:
+                    entries.append({'status': 'Error', 'error': failed[number].get('elementErrors')})
+                else:
+                    issue = next(issues)
+                    entries.append({'status': 'Success', 'key': issue['key'], 'id': issue['id']})
+            return entries
+
+        chunks = [field_list[i:i + BULK_CREATE_LIMIT] for i in range(0, len(field_list), BULK_CREATE_LIMIT)]
+        return [entry for entries in await run_all([create_chunk(chunk) for chunk in chunks]) for entry in entries]
+
+    async def add_issues_to_sprint(self, sprint_id, issue_keys):
+        """Move issues into a sprint, 50 per request"""
+        await run_all([
+            self._request('POST', f"sprint/{sprint_id}/issue", {'issues': issue_keys[i:i + SPRINT_ASSIGN_LIMIT]},
+                          api='agile/1.0')
+            for i in range(0, len(issue_keys), SPRINT_ASSIGN_LIMIT)
+        ])
+
+    async def add_comment(self, issue_key, comment):
+        """Add a comment to an issue"""
+        try:
+            await self._request('POST', f"issue/{issue_key}/comment", {'body': comment})
+        except Exception as e:
+            print(f"Warning: Could not add comment to {issue_key} - {str(e)}")
+
+    async def add_worklog(self, issue_key, time_spent=None, time_spent_seconds=None, comment=None, started=None):
+        """Add a worklog entry to an issue; `started` is a WORKLOG_TIME_FORMAT string"""
+        worklog = {'timeSpent': time_spent} if time_spent else {'timeSpentSeconds': time_spent_seconds}
+        if comment:
+            worklog['comment'] = comment
+        if started:
+            worklog['started'] = started
+        try:
+            await self._request('POST', f"issue/{issue_key}/worklog", worklog)
+        except Exception as e:
+            print(f"Warning: Could not add worklog to {issue_key} - {str(e)}")
+
+    async def assign_issue(self, issue_key, user):
+        """Set the assignee from a user reference (see ticket_simulator.user_ref)"""
+        await self._request('PUT', f"issue/{issue_key}/assignee", user)
+
+    async def transitions(self, issue_key):
+        """Transitions available to the issue, cached per issue type and status when metadata is shared"""
+        if self.metadata is not None:
+            return await self._in_thread(self.metadata.transitions, issue_key)
+        result = await self._request('GET', f"issue/{issue_key}/transitions")
+        return [{'id': t['id'], 'name': t['name'], 'to': t.get('to', {}).get('name')}
+                for t in result.get('transitions', [])]
+
+    async def apply_transition(self, issue_key, transition, update=None):
+        """Apply a transition, with an optional update block (comments, worklog) in the same request"""
+        body = {'transition': {'id': transition['id']}}
+        if update:
+            body['update'] = update
+        await self._request('POST', f"issue/{issue_key}/transitions", body)
+        if self.metadata is not None:
+            self.metadata.record_transition(issue_key, transition)
+
+    async def walk(self, issue_key, target, limit=20):
+        """WorkflowPlanner.walk with each step planned off the loop, since discovering one may need a GET.
+
+        Requires shared metadata. Yields (transition, last) for the caller to
+        apply with apply_transition; steps back from an unreachable target come
+        with `last` set to None before LookupError is raised.
+        """
+        planner = get_workflow_planner(self.metadata.jira)
+        _, origin = await self._in_thread(self.metadata.issue_state, issue_key)
+        try:
+            for _ in range(limit):
+                step = await self._in_thread(planner.next_step, issue_key, target)
+                if step is None:
+                    return
+                yield step
+                # Stop on the arriving step: another await here would let a cancelled run
+                # lose the step between its request and the caller journaling it
+                if step[1]:
+                    return
+            raise LookupError(f"{issue_key} did not reach {target} within {limit} transitions")
+        except LookupError:
+            for transition in await self._in_thread(planner.path_back, issue_key, origin):
+                yield transition, None
+            raise
+
+    async def transition_issue(self, issue_key, to_status, comment=None):
+        """Move an issue to a status, along the workflow's shortest path when metadata is shared"""
+        try:
+            if self.metadata is not None:
+                try:
+                    async for transition, last in self.walk(issue_key, to_status):
+                        update = {'comment': [{'add': {'body': comment}}]} if comment and last else None
+                        await self.apply_transition(issue_key, transition, update)
+                    return
+                except LookupError:
+                    pass
+            transitions = await self.transitions(issue_key)
+            transition = next((t for t in transitions if to_status.lower() in t['name'].lower()), None)
+            if transition:
+                update = {'comment': [{'add': {'body': comment}}]} if comment else None
+                await self.apply_transition(issue_key, transition, update)
+            else:
+                print(f"Warning: Could not find transition to {to_status} for {issue_key}")
+        except Exception as e:
+            print(f"Warning: Could not transition {issue_key} - {str(e)}")
+
+    async def add_label(self, issue_key, label):
+        """Add a label to an issue"""
+        try:
+            await self._request('PUT', f"issue/{issue_key}", {'update': {'labels': [{'add': label}]}})
+        except Exception as e:
+            print(f"Warning: Could not add label to {issue_key} - {str(e)}")
@@ -0,0 +1,234 @@
+import asyncio
+import os
+import time
+
+from jira.exceptions import JIRAError
+
+from async_jira import AsyncJiraManager, async_concurrency
+from async_tasks import run_all
+from simulation_plan import STATUS_ORDER, WORKLOG_TIME_FORMAT
+from ticket_simulator import user_ref
+from ticket_store import COMPLETE
+
+
+class AsyncSeeder:
+    """Async seeding: content, bulk creation, sprint assignment and simulation on one event loop.
+
+    Each stage is a set of coroutines rather than threads: LLM calls run on
+    AsyncAnthropic, bulk creates and sprint moves are sent together, and every
+    ticket's simulation is its own coroutine, INPUT_ASYNC_CONCURRENCY of them in
+    flight. The generator and simulator supply the plan, journal and comment
+    text, so a run produces the same tickets as the threaded modes and resumes
+    from the same journal. If any stage fails, or the run outlives
+    INPUT_ASYNC_TIMEOUT seconds, everything still in flight is cancelled.
+    """
+
+    def __init__(self, generator, simulator, jira, concurrency=None, llm=None):
+        self.generator = generator
+        self.simulator = simulator
+        self.jira = jira
+        self.concurrency = concurrency or async_concurrency()
+        self.llm = llm
+        self.stats = {'created': 0, 'simulated': 0, 'first_simulated_after': None, 'timed_out': False}
+
+    async def run(self, epic_key, sprints, timeout=None):
+        """Seed and simulate every sprint's tickets; returns the stage counters"""
+        timeout = timeout or float(os.getenv('INPUT_ASYNC_TIMEOUT', 0)) or None
+        self.started = time.monotonic()
+        try:
+            await asyncio.wait_for(self._run(epic_key, sprints), timeout)
+        except asyncio.TimeoutError:
+            print(f"Error: Seeding timed out after {timeout}s and was cancelled; "
+                  f"rerun with the same INPUT_RUN_ID to pick up where it stopped")
+            self.stats['timed_out'] = True
+        return dict(self.stats)
+
+    async def _run(self, epic_key, sprints):
+        generator = self.generator
+        epic_link_field = await self.jira._in_thread(generator._get_epic_link_field)
+        contents = None
+        if self.llm is not None:
+            contents = await generator.generate_sprint_contents_async(len(sprints), self.llm)
+        pending = generator._sprint_payloads(epic_key, epic_link_field, sprints, contents)
+
+        created = await self.create_tickets(pending)
+        self.stats['created'] = len(created)
+        await self.assign_to_sprints(created)
+
+        tickets = [ticket for _, ticket in created]
+        if self.simulator.plan.backdate:
+            await self._replay_by_day(tickets)
+        else:
+            await run_all([self.simulate_ticket(ticket) for ticket in tickets], limit=self.concurrency)
+
+    async def _replay_by_day(self, tickets):
+        """Replay transitions one simulated day at a time, as TicketSimulator does for INPUT_BACKDATE"""
+        plan = self.simulator.plan
+        days = {}
+        for ticket in tickets:
+            planned = plan.ticket(ticket.slot)
+            for status in STATUS_ORDER:
+                at = plan.status_time(planned, status)
+                days.setdefault(at.date(), {}).setdefault(ticket.key, (ticket, []))[1].append((at, status))
+
+        for day in sorted(days):
+            await run_all([
+                self.simulate_ticket(ticket, [status for _, status in sorted(steps)])
+                for ticket, steps in days[day].values()
+            ], limit=self.concurrency)
+
+    async def create_tickets(self, pending):
+        """Create (sprint, slot, label, fields) tickets in concurrent bulk requests; returns (sprint, ticket) pairs"""
+        generator = self.generator
+        created = {}
+        to_create = []
+        for item in pending:
+            ticket = generator._recorded_ticket(item[1])
+            if ticket is not None:
+                created[item[1]] = (item[0], ticket)
+            else:
+                to_create.append(item)
+
+        results = await self.jira.create_issues([ticket_data for _, _, _, ticket_data in to_create])
+        for (sprint, slot, label, ticket_data), result in zip(to_create, results):
+            if result['status'] == 'Success':
+                ticket = generator._record_ticket(slot, sprint, result['key'], result['id'], ticket_data)
+                print(f"Created {label}: {ticket.key}")
+                created[slot] = (sprint, ticket)
+            else:
+                print(f"Error creating {label.lower()} '{ticket_data['summary']}': {result['error']}")
+        return [created[slot] for slot in sorted(created)]
+
+    async def assign_to_sprints(self, created):
+        """Move each sprint's tickets into it, every sprint's requests in flight together"""
+        journal = self.generator.journal
+        sprint_issues = {}
+        for sprint, ticket in created:
+            if not journal.done('sprint_issue', ticket.key):
+                sprint_issues.setdefault(sprint.id, (sprint, []))[1].append(ticket.key)
+
+        async def assign(sprint, issue_keys):
+            try:
+                await self.jira.add_issues_to_sprint(sprint.id, issue_keys)
+            except Exception as e:
+                print(f"Warning: Could not add {len(issue_keys)} tickets to sprint {sprint.name} - {str(e)}")
+                return
+            for key in issue_keys:
+                journal.record('sprint_issue', key, sprint.id)
+
+        await run_all([assign(sprint, issue_keys) for sprint, issue_keys in sprint_issues.values()])
+
+    async def simulate_ticket(self, ticket, statuses=STATUS_ORDER):
+        """TicketSimulator.simulate_ticket as a coroutine: the same journaled steps from the same plan"""
+        simulator = self.simulator
+        journal = simulator.journal
+        if ticket.complete:
+            return
+        plan = simulator.plan
+        planned = plan.ticket(ticket.slot)
+        try:
+            if ticket.assignee is None:
+                member = planned.assignee % len(simulator.team_members)
+                await self.jira.assign_issue(ticket.key, user_ref(simulator.team_members[member]))
+                journal.record('simulation', f"{ticket.key}:assignee", simulator.team_members[member])
+                ticket.assignee = member
+            assignee = simulator.team_members[ticket.assignee]
+
+            worklog = None
+            if not journal.done('simulation', f"{ticket.key}:worklog"):
+                worklog = {
+                    'timeSpentSeconds': planned.worklog_seconds,
+                    'comment': f"{assignee['email'].split('@')[0]} working on implementing the requested changes."
+                }
+                if plan.backdate:
+                    worklog['started'] = planned.started.strftime(WORKLOG_TIME_FORMAT)
+
+            for index, status in enumerate(STATUS_ORDER):
+                step = f"{ticket.key}:{status}"
+                if status not in statuses or journal.done('simulation', step):
+                    continue
+
+                comments = [simulator._get_status_comment(status, assignee, planned.comments[index])]
+                follow_up = simulator._follow_up_comment(status, assignee, planned.blocked, planned.follow_ups[index])
+                if follow_up:
+                    comments.append(follow_up)
+
+                try:
+                    carried_worklog = await self._move_to(ticket, status, comments, worklog, assignee,
+                                                          planned.comments[index])
+                except LookupError:
+                    print(f"Warning: Could not find transition to {status.upper()} for {ticket.key}")
+                    continue
+                if carried_worklog:
+                    journal.record('simulation', f"{ticket.key}:worklog")
+                    worklog = None
+                journal.record('simulation', step)
+                ticket.progress += 1
+                print(f"Moved {ticket.key} to {status.upper()} (Assignee: {assignee['email']})")
+
+            if STATUS_ORDER[-1] not in statuses:
+                return
+
+            # No transition could carry the worklog
+            if worklog:
+                await self.jira.add_worklog(ticket.key, time_spent_seconds=worklog['timeSpentSeconds'],
+                                            comment=worklog['comment'], started=worklog.get('started'))
+                journal.record('simulation', f"{ticket.key}:worklog")
+
+            if not all(journal.done('simulation', f"{ticket.key}:{status}") for status in STATUS_ORDER):
+                return
+            journal.record('simulation', f"{ticket.key}:complete")
+            ticket.progress = COMPLETE
+        except Exception as e:
+            print(f"Error simulating work on {ticket.key}: {str(e)}")
+            return
+        self.stats['simulated'] += 1
+        if self.stats['first_simulated_after'] is None:
+            self.stats['first_simulated_after'] = round(time.monotonic() - self.started, 2)
+
+    async def _move_to(self, ticket, status, comments, worklog, assignee, choice):
+        """TicketSimulator._move_to on AsyncJiraManager.walk"""
+        carried = False
+        async for transition, last in self.jira.walk(ticket.key, status):
+            if last is None:
+                hop_comments = []
+            else:
+                hop_comments = comments if last else [self.simulator._get_status_comment(transition['to'], assignee,
+                                                                                         choice)]
+            carried = await self._transition_with_updates(ticket.key, transition, hop_comments,
+                                                          worklog if last and not carried else None) or carried
+            ticket.moved(transition['to'])
+        return carried
+
+    async def _transition_with_updates(self, issue_key, transition, comments, worklog=None):
+        """Transition, comment and optionally log work in one request; returns whether the worklog went with it"""
+        update = {'comment': [{'add': {'body': comment}} for comment in comments]}
+        fold = worklog is not None and self.simulator.fold_worklog
+        if fold:
+            update['worklog'] = [{'add': worklog}]
+        try:
+            await self.jira.apply_transition(issue_key, transition, update)
+        except JIRAError as e:
+            # Transitions whose screen lacks time tracking reject worklogs; log work separately from now on
+            if not fold or e.status_code != 400:
+                raise
+            self.simulator.fold_worklog = False
+            print("Warning: Jira refused a worklog on a transition; logging work with separate requests")
+            return await self._transition_with_updates(issue_key, transition, comments)
+        return fold
+
+
+def run_async_seeding(jira, generator, simulator, epic_key, sprints):
+    """Seed on an event loop of its own, sharing the synchronous client's caches, journal and counters"""
+
+    async def seed():
+        llm = None
+        if generator._uses_llm():
+            from anthropic import AsyncAnthropic
+            from llm_pipeline import AsyncContentPipeline
+            llm = AsyncContentPipeline(AsyncAnthropic(api_key=os.getenv('CLAUDE_API_KEY')),
+                                       instrumentation=jira.instrumentation)
+        async with AsyncJiraManager.for_client(jira, project_key=generator.project_key) as async_jira:
+            return await AsyncSeeder(generator, simulator, async_jira, llm=llm).run(epic_key, sprints)
+
+    return asyncio.run(seed())
@@ -0,0 +1,35 @@
+import asyncio
+
+
+async def run_all(coroutines, limit=None):
+    """Run coroutines concurrently and return their results in order.
+
+    At most `limit` run at once. If any of them raises, the others are cancelled
+    and awaited before the error propagates, so nothing outlives the call; the
+    same happens to all of them if the caller itself is cancelled or times out.
+    """
+    semaphore = asyncio.Semaphore(limit) if limit else None
+
+    async def bounded(coroutine):
+        if semaphore is None:
+            return await coroutine
+        async with semaphore:
+            return await coroutine
+
+    coroutines = list(coroutines)
+    tasks = [asyncio.ensure_future(bounded(coroutine)) for coroutine in coroutines]
+    if not tasks:
+        return []
+    try:
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in done:
+            if task.exception() is not None:
+                raise task.exception()
+        return [task.result() for task in tasks]
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for coroutine in coroutines:
+            # Ones cancelled while waiting for the semaphore never started
+            coroutine.close()
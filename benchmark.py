@@ -0,0 +1,171 @@
+"""End-to-end seeding benchmark against the in-memory Jira stand-in.
+
+Runs main.main() with JIRA_SERVER=memory:// and simulated latency, then reports
+tickets/sec, API calls per ticket, per-call latency percentiles and peak memory
+as JSON so results can be compared across commits. The latency percentiles are
+measured in the backend, not around the client's round trip: they include the
+injected latency when the backend sleeps it (the threaded pipeline), but not in
+INPUT_PIPELINE_MODE=async, where the transport awaits it before handing the
+request over. Client-side timings are in the INPUT_TRACE_LOG call records.
+
+    python benchmark.py --sprints 4 --tickets-per-sprint 50 --latency-ms 40 --output after.json
+    python benchmark.py ... --compare before.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import subprocess
+import threading
+import time
+import tracemalloc
+
+from fake_jira import FakeJiraBackend, reset_memory_backend
+from instrumentation import percentile
+from jira_client import endpoint_name
+
+
+class TimedBackend(FakeJiraBackend):
+    """FakeJiraBackend that records how long each request took to serve (server side only)"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.durations = []
+        self.endpoint_calls = {}
+        self.timing_lock = threading.Lock()
+
+    def handle(self, method, path, params=None, body=None, delay=True):
+        started = time.perf_counter()
+        result = super().handle(method, path, params, body, delay=delay)
+        elapsed = time.perf_counter() - started
+        endpoint = endpoint_name(method, path)
+        with self.timing_lock:
+            self.durations.append(elapsed)
+            self.endpoint_calls[endpoint] = self.endpoint_calls.get(endpoint, 0) + 1
+        return result
+
+
+def current_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def configure_environment(args):
+    """Map benchmark arguments onto the INPUT_* variables main.py reads"""
+    os.environ.update({
+        'JIRA_SERVER': 'memory://',
+        'JIRA_PROJECT_KEY': args.project_key,
+        'JIRA_METADATA_CACHE': '',  # every run starts cold
+        'CLAUDE_API_KEY': os.getenv('CLAUDE_API_KEY') or 'benchmark',
+        'INPUT_NUM_SPRINTS': str(args.sprints),
+        'INPUT_TICKETS_PER_SPRINT': str(args.tickets_per_sprint),
+        'INPUT_INCOMPLETE_TICKETS_PER_SPRINT': str(args.incomplete_per_sprint),
+        'INPUT_NUM_DEVELOPERS': str(args.developers),
+        'INPUT_NUM_QA': str(args.qa),
+        'INPUT_NUM_TECH_LEADS': str(args.tech_leads),
+        'INPUT_NUM_PRODUCT_OWNERS': str(args.product_owners),
+        'INPUT_NUM_SCRUM_MASTERS': str(args.scrum_masters),
+        'INPUT_SIMULATION_CONCURRENCY': str(args.concurrency),
+        'INPUT_REQUESTS_PER_SECOND': str(args.requests_per_second),
+        'INPUT_CONTENT_SOURCE': 'faker'
+    })
+
+
+def run_benchmark(args):
+    configure_environment(args)
+    backend = reset_memory_backend(TimedBackend(
+        latency_ms=args.latency_ms,
+        throttle_rate=args.throttle_rate,
+        rate_limit=args.rate_limit,
+        workflow=args.workflow
+    ))
+
+    import main
+
+    output = io.StringIO()
+    tracemalloc.start()
+    started = time.perf_counter()
+    with contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(output):
+        main.main([])
+    elapsed = time.perf_counter() - started
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    tickets = sum(1 for issue in backend.issues.values() if issue['issuetype']['name'] != 'Epic')
+    calls = len(backend.durations)
+    return {
+        'commit': current_commit(),
+        'config': {
+            'sprints': args.sprints,
+            'tickets_per_sprint': args.tickets_per_sprint,
+            'incomplete_per_sprint': args.incomplete_per_sprint,
+            'team': [args.developers, args.qa, args.tech_leads, args.product_owners, args.scrum_masters],
+            'latency_ms': args.latency_ms,
+            'throttle_rate': args.throttle_rate,
+            'rate_limit': args.rate_limit,
+            'workflow': args.workflow,
+            'concurrency': args.concurrency,
+            'requests_per_second': args.requests_per_second
+        },
+        'results': {
+            'wall_seconds': round(elapsed, 3),
+            'tickets': tickets,
+            'tickets_per_second': round(tickets / elapsed, 3) if elapsed else 0.0,
+            'api_calls': calls,
+            'api_calls_per_ticket': round(calls / tickets, 2) if tickets else None,
+            'throttled_calls': backend.throttled_count,
+            'latency_p50_ms': round(percentile(backend.durations, 0.50) * 1000, 2),
+            'latency_p95_ms': round(percentile(backend.durations, 0.95) * 1000, 2),
+            'peak_memory_mb': round(peak_memory / (1024 * 1024), 2)
+        },
+        'endpoints': dict(sorted(backend.endpoint_calls.items(), key=lambda item: item[1], reverse=True))
+    }
+
+
+def print_comparison(report, baseline):
+    print(f"\nCompared with {baseline.get('commit') or 'baseline'}:")
+    for name, value in report['results'].items():
+        before = baseline.get('results', {}).get(name)
+        if isinstance(value, (int, float)) and isinstance(before, (int, float)) and before:
+            print(f"  {name}: {before} -> {value} ({(value - before) / before * 100:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark end-to-end seeding against the in-memory Jira stand-in")
+    parser.add_argument('--sprints', type=int, default=int(os.getenv('INPUT_NUM_SPRINTS', 2)))
+    parser.add_argument('--tickets-per-sprint', type=int, default=int(os.getenv('INPUT_TICKETS_PER_SPRINT', 5)))
+    parser.add_argument('--incomplete-per-sprint', type=int, default=int(os.getenv('INPUT_INCOMPLETE_TICKETS_PER_SPRINT', 1)))
+    parser.add_argument('--developers', type=int, default=int(os.getenv('INPUT_NUM_DEVELOPERS', 4)))
+    parser.add_argument('--qa', type=int, default=int(os.getenv('INPUT_NUM_QA', 2)))
+    parser.add_argument('--tech-leads', type=int, default=int(os.getenv('INPUT_NUM_TECH_LEADS', 1)))
+    parser.add_argument('--product-owners', type=int, default=int(os.getenv('INPUT_NUM_PRODUCT_OWNERS', 1)))
+    parser.add_argument('--scrum-masters', type=int, default=int(os.getenv('INPUT_NUM_SCRUM_MASTERS', 1)))
+    parser.add_argument('--concurrency', type=int, default=int(os.getenv('INPUT_SIMULATION_CONCURRENCY', 4)))
+    parser.add_argument('--requests-per-second', type=float, default=float(os.getenv('INPUT_REQUESTS_PER_SECOND', 0)),
+                        help="client-side request rate; 0 disables client pacing")
+    parser.add_argument('--latency-ms', type=float, default=20.0, help="mean simulated latency per request")
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help="fraction of requests answered with 429")
+    parser.add_argument('--rate-limit', type=float, default=0.0, help="server-side requests per second before 429s")
+    parser.add_argument('--workflow', choices=['simple', 'review'], default='simple')
+    parser.add_argument('--project-key', default='BENCH')
+    parser.add_argument('--output', help="write the JSON report to this file as well as stdout")
+    parser.add_argument('--compare', help="previous JSON report to compare against")
+    parser.add_argument('--verbose', action='store_true', help="show main.py's own output")
+    args = parser.parse_args()
+
+    report = run_benchmark(args)
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            print_comparison(report, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+import json
+import os
+import threading
+import time
+
+# Dollars per million tokens, for the cost estimate in the content report
+DEFAULT_INPUT_PRICE = 3.0
+DEFAULT_OUTPUT_PRICE = 15.0
+
+
+class ContentRouter:
+    """Hybrid ticket content: a budgeted number of Claude-written seed tickets, expanded with templates.
+
+    Each ticket type gets one seed per `variants_per_seed` tickets. Seeds are
+    requested in waves of batched calls until the token budget (input plus
+    output tokens actually billed; cached replies are free) or the latency
+    budget (seconds spent waiting on Claude) would be exceeded; both budgets
+    cover the whole run, however many calls to `contents` it takes. Every seed is
+    used once as written and then rewritten into variants by the content
+    engine's variant templates. Types that got no seed fall back to plain
+    template content. Seed cost and latency are spread over the tickets made
+    from the seed and reported per ticket.
+    """
+
+    def __init__(self, generator, llm, engine, token_budget=20000, latency_budget=0, variants_per_seed=10,
+                 report_path=None):
+        self.generator = generator
+        self.llm = llm
+        self.engine = engine
+        self.token_budget = token_budget
+        self.latency_budget = latency_budget
+        self.variants_per_seed = max(1, variants_per_seed)
+        self.report_path = report_path
+        self.input_price = float(os.getenv('INPUT_LLM_INPUT_PRICE', DEFAULT_INPUT_PRICE))
+        self.output_price = float(os.getenv('INPUT_LLM_OUTPUT_PRICE', DEFAULT_OUTPUT_PRICE))
+        # Budget use across every call, including the tokens reserved by waves still in flight
+        self.lock = threading.Lock()
+        self.spent = 0
+        self.reserved = 0
+        self.waited = 0.0
+        self.per_call = None
+        self.totals = {'tickets': 0, 'llm': 0, 'variant': 0, 'template': 0, 'seeds': 0, 'calls': 0,
+                       'input_tokens': 0, 'output_tokens': 0, 'llm_seconds': 0.0, 'template_seconds': 0.0}
+
+    @classmethod
+    def from_env(cls, generator):
+        return cls(
+            generator,
+            generator.llm,
+            generator.templates,
+            token_budget=int(os.getenv('INPUT_LLM_TOKEN_BUDGET', 20000)),
+            latency_budget=float(os.getenv('INPUT_LLM_LATENCY_BUDGET', 0)),
+            variants_per_seed=int(os.getenv('INPUT_VARIANTS_PER_SEED', 10)),
+            report_path=os.getenv('INPUT_CONTENT_REPORT')
+        )
+
+    def contents(self, ticket_types):
+        """(type, summary, description) for each ticket type, in order"""
+        needed = {}
+        for ticket_type in ticket_types:
+            needed[ticket_type] = needed.get(ticket_type, 0) + 1
+        seeds = self._fetch_seeds({
+            ticket_type: -(-count // self.variants_per_seed) for ticket_type, count in needed.items()
+        })
+
+        started = time.perf_counter()
+        uses = {}
+        routed = []
+        for ticket_type in ticket_types:
+            type_seeds = seeds.get(ticket_type)
+            if not type_seeds:
+                routed.append((ticket_type, 'template', None) + self.engine.ticket(ticket_type))
+                continue
+            # Seeds are used in turn, each once as written before any is rewritten
+            n = uses.get(ticket_type, 0)
+            uses[ticket_type] = n + 1
+            seed = type_seeds[n % len(type_seeds)]
+            if n < len(type_seeds):
+                routed.append((ticket_type, 'llm', seed, seed['summary'], seed['description']))
+            else:
+                routed.append((ticket_type, 'variant', seed)
+                              + self.engine.variant(ticket_type, seed['summary'], seed['description']))
+        template_seconds = time.perf_counter() - started
+        self.totals['template_seconds'] += template_seconds
+
+        self._report(routed, uses, seeds, template_seconds)
+        return [(ticket_type, summary, description) for ticket_type, _, _, summary, description in routed]
+
+    def _fetch_seeds(self, wanted):
+        """Up to `wanted[type]` seed tickets per type, as long as the budgets last"""
+        # Interleave types so a budget that runs out early still covers every type
+        seed_types = []
+        remaining = dict(wanted)
+        while any(remaining.values()):
+            for ticket_type in wanted:
+                if remaining[ticket_type]:
+                    seed_types.append(ticket_type)
+                    remaining[ticket_type] -= 1
+
+        requests, chunks = self.generator._ticket_batch_requests(seed_types, self.llm)
+        # The batch requests come back grouped by type; restore the interleaved order
+        order = sorted(range(len(requests)), key=lambda i: chunks[i][0])
+        seeds = {}
+        wave_size = max(1, self.llm.concurrency)
+        position = 0
+        while position < len(order):
+            wave = order[position:position + wave_size]
+            with self.lock:
+                if self.latency_budget and self.waited >= self.latency_budget:
+                    break
+                reserved = 0
+                if self.token_budget:
+                    # Before any call has been billed, assume each one uses its full max_tokens
+                    estimates = [self.per_call or requests[i][1] for i in wave]
+                    affordable = 0
+                    while (affordable < len(wave) and self.spent + self.reserved + sum(estimates[:affordable + 1])
+                           <= self.token_budget):
+                        affordable += 1
+                    wave = wave[:affordable]
+                    if not wave:
+                        break
+                    reserved = sum(estimates[:affordable])
+                    self.reserved += reserved
+
+            before = dict(self.llm.usage)
+            started = time.perf_counter()
+            try:
+                batches = self.llm.map([requests[i] for i in wave])
+            except Exception as e:
+                print(f"Warning: Could not generate seed tickets, using templates for the rest - {str(e)}")
+                self._count_wave(self.llm.usage['calls'] - before['calls'], before, time.perf_counter() - started,
+                                 reserved)
+                break
+            elapsed = time.perf_counter() - started
+            calls = self.llm.usage['calls'] - before['calls']
+            tokens = (self.llm.usage['input_tokens'] - before['input_tokens']
+                      + self.llm.usage['output_tokens'] - before['output_tokens'])
+            self._count_wave(calls, before, elapsed, reserved)
+
+            # Spread the wave's cost evenly over the seeds it produced
+            produced = [(i, item) for i, batch in zip(wave, batches) for item in (batch or [])[:len(chunks[i])]]
+            for i, item in produced:
+                if not isinstance(item, dict) or not item.get('summary') or not item.get('description'):
+                    continue
+                seeds.setdefault(seed_types[chunks[i][0]], []).append({
+                    'summary': str(item['summary']),
+                    'description': str(item['description']),
+                    'tokens': tokens / len(produced),
+                    'seconds': elapsed / len(produced)
+                })
+            position += len(wave)
+        self.totals['seeds'] += sum(len(type_seeds) for type_seeds in seeds.values())
+        return seeds
+
+    def _count_wave(self, calls, before, elapsed, reserved):
+        """Charge a finished wave to the budgets, releasing the tokens reserved for it"""
+        input_tokens = self.llm.usage['input_tokens'] - before['input_tokens']
+        output_tokens = self.llm.usage['output_tokens'] - before['output_tokens']
+        with self.lock:
+            self.reserved -= reserved
+            self.spent += input_tokens + output_tokens
+            self.waited += elapsed
+            if calls:
+                self.per_call = max(1, (input_tokens + output_tokens) // calls)
+            self.totals['calls'] += calls
+            self.totals['input_tokens'] += input_tokens
+            self.totals['output_tokens'] += output_tokens
+            self.totals['llm_seconds'] += elapsed
+
+    def _cost(self, input_tokens, output_tokens):
+        return (input_tokens * self.input_price + output_tokens * self.output_price) / 1_000_000
+
+    def _report(self, routed, uses, seeds, template_seconds):
+        """Count tickets per source and optionally write one JSON line of amortized cost per ticket"""
+        tickets = len(routed)
+        template_share = template_seconds / tickets if tickets else 0
+        totals = self.totals
+        billed = totals['input_tokens'] + totals['output_tokens']
+        dollars_per_token = self._cost(totals['input_tokens'], totals['output_tokens']) / billed if billed else 0
+        report_file = open(self.report_path, 'a') if self.report_path else None
+        try:
+            for index, (ticket_type, source, seed, summary, _) in enumerate(routed):
+                totals['tickets'] += 1
+                totals[source] += 1
+                if report_file is None:
+                    continue
+                row = {'index': index, 'type': ticket_type, 'source': source, 'summary': summary,
+                       'tokens': 0.0, 'cost_usd': 0.0, 'latency_ms': round(template_share * 1000, 4)}
+                if seed is not None:
+                    # A seed's cost is shared by every ticket made from it
+                    share = max(1, -(-uses[ticket_type] // len(seeds[ticket_type])))
+                    row['tokens'] = round(seed['tokens'] / share, 2)
+                    row['cost_usd'] = round(seed['tokens'] / share * dollars_per_token, 6)
+                    row['latency_ms'] = round((seed['seconds'] / share + template_share) * 1000, 4)
+                report_file.write(json.dumps(row) + '\n')
+        finally:
+            if report_file is not None:
+                report_file.close()
+
+    def summary(self):
+        """Totals plus average tokens, cost and latency per ticket"""
+        totals = dict(self.totals)
+        tickets = totals['tickets'] or 1
+        cost = self._cost(totals['input_tokens'], totals['output_tokens'])
+        totals.update(
+            cost_usd=round(cost, 4),
+            tokens_per_ticket=round((totals['input_tokens'] + totals['output_tokens']) / tickets, 2),
+            cost_per_ticket_usd=round(cost / tickets, 6),
+            ms_per_ticket=round((totals['llm_seconds'] + totals['template_seconds']) * 1000 / tickets, 3)
+        )
+        return totals
+
+    def print_summary(self):
+        totals = self.summary()
+        if not totals['tickets']:
+            return
+        print(f"\nContent: {totals['seeds']} LLM seeds from {totals['calls']} calls "
+              f"({totals['input_tokens'] + totals['output_tokens']} tokens, ${totals['cost_usd']:.4f}, "
+              f"{totals['llm_seconds']:.1f}s) -> {totals['tickets']} tickets: {totals['llm']} as written, "
+              f"{totals['variant']} variants, {totals['template']} template-only")
+        print(f"  per ticket: {totals['tokens_per_ticket']} tokens, ${totals['cost_per_ticket_usd']:.6f}, "
+              f"{totals['ms_per_ticket']} ms")
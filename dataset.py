@@ -0,0 +1,198 @@
+"""Generated datasets: generate a project's content and plan once, replay it into any project.
+
+A dataset holds everything a run decides before it talks to Jira: the epic,
+the sprints, every ticket's type, summary and description, the team roster and
+the simulation plan's per-ticket columns (assignee, worklog, comment choices,
+blockers, timing). Comments and worklogs are replayed from those columns, so
+importing a dataset creates the same tickets and history as the run that
+would have generated it, without Faker, templates or Claude calls.
+
+The file is JSON lines with a length prefix, written once and read through
+mmap:
+
+    JIRADATASET 1\\n
+    <8 hex digits: length> <header JSON>\\n
+    <8 hex digits: length> <record JSON>\\n        one per epic, sprint and ticket
+    ...
+    <8 hex digits: length> <index JSON>\\n         byte offsets of every record
+    <16 hex digits: offset of the index>\\n
+
+Readers find the index from the fixed-size trailer and read any record
+without parsing the others; tickets are stored in slot order, grouped by
+sprint. Generate one from the current INPUT_* config and import it with
+INPUT_DATASET:
+
+    python dataset.py export --output sprint-history.jds
+    python dataset.py info sprint-history.jds
+    INPUT_DATASET=sprint-history.jds JIRA_PROJECT_KEY=OTHER python main.py
+"""
+import argparse
+import json
+import mmap
+import os
+import time
+
+from simulation_plan import SimulationPlan, history_origin
+
+MAGIC = b'JIRADATASET 1\n'
+FORMAT_VERSION = 1
+TRAILER_SIZE = 17
+
+EPIC_SUMMARY = 'Q2 2024 Development Initiative'
+EPIC_DESCRIPTION = ('Strategic development initiative for Q2 2024 focusing on core platform improvements '
+                    'and feature additions.')
+
+
+class DatasetWriter:
+    """Append length-prefixed records and finish with the offset index"""
+
+    def __init__(self, path, header):
+        self.path = path
+        self.file = open(path, 'wb')
+        self.file.write(MAGIC)
+        self.offsets = {'epic': None, 'sprints': [], 'tickets': []}
+        self._write(header)
+
+    def _write(self, record):
+        offset = self.file.tell()
+        data = json.dumps(record, separators=(',', ':')).encode()
+        self.file.write(b'%08x ' % len(data) + data + b'\n')
+        return offset
+
+    def epic(self, summary, description):
+        self.offsets['epic'] = self._write({'summary': summary, 'description': description})
+
+    def sprint(self, record):
+        self.offsets['sprints'].append(self._write(record))
+
+    def ticket(self, record):
+        self.offsets['tickets'].append(self._write(record))
+
+    def close(self):
+        index_offset = self._write(self.offsets)
+        self.file.write(b'%016x\n' % index_offset)
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class Dataset:
+    """A dataset file opened for reading; records are parsed on access"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.data[:len(MAGIC)] != MAGIC or len(self.data) < len(MAGIC) + TRAILER_SIZE:
+            raise ValueError(f"{path} is not a dataset file")
+        self.header = self._read(len(MAGIC))
+        if self.header.get('version') != FORMAT_VERSION:
+            raise ValueError(f"{path} has dataset version {self.header.get('version')}, expected {FORMAT_VERSION}")
+        self.index = self._read(int(self.data[-TRAILER_SIZE:-1], 16))
+        self.epic = self._read(self.index['epic'])
+        self.sprints = [self._read(offset) for offset in self.index['sprints']]
+
+    @classmethod
+    def from_env(cls):
+        """The dataset named by INPUT_DATASET, or None"""
+        path = os.getenv('INPUT_DATASET')
+        return cls(path) if path else None
+
+    def _read(self, offset):
+        length = int(self.data[offset:offset + 8], 16)
+        return json.loads(self.data[offset + 9:offset + 9 + length])
+
+    @property
+    def roster(self):
+        return self.header['roster']
+
+    def __len__(self):
+        return len(self.index['tickets'])
+
+    def ticket(self, slot):
+        return self._read(self.index['tickets'][slot])
+
+    def tickets(self):
+        return (self.ticket(slot) for slot in range(len(self)))
+
+    def sprint_tickets(self, sprint_index):
+        """Ticket records of one sprint, in slot order"""
+        first, count = self.sprints[sprint_index]['first_slot'], self.sprints[sprint_index]['tickets']
+        return [self.ticket(slot) for slot in range(first, first + count)]
+
+    def plan(self, origin=None):
+        """The saved simulation plan, on a clock starting at `origin` (by default laid out from now)"""
+        settings = dict(self.header['plan'])
+        backdate = settings.pop('backdate', False)
+        origin = origin or history_origin(len(self.sprints), settings['sprint_length_days'], backdate)
+        return SimulationPlan(origin=origin, backdate=backdate,
+                              columns=[ticket['plan'] for ticket in self.tickets()], **settings)
+
+    def close(self):
+        self.data.close()
+
+
+def export_dataset(path, generator, roster, plan, num_sprints):
+    """Generate content for `num_sprints` sprints and write it with `plan` and `roster` to `path`"""
+    sprint_contents = generator._generate_sprint_contents(num_sprints)
+    header = {'version': FORMAT_VERSION, 'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+              'seed': generator.seed, 'content_source': os.getenv('INPUT_CONTENT_SOURCE', 'faker').lower(),
+              'roster': roster, 'plan': plan.settings()}
+    slot = 0
+    with DatasetWriter(path, header) as writer:
+        writer.epic(EPIC_SUMMARY, EPIC_DESCRIPTION)
+        for index, contents in enumerate(sprint_contents):
+            tickets = generator._build_sprint_tickets(None, None, contents)
+            writer.sprint({'index': index, 'name': f"Sprint {index + 1}", 'first_slot': slot, 'tickets': len(tickets)})
+            for label, ticket_data in tickets:
+                writer.ticket({'slot': slot, 'sprint': index, 'label': label,
+                               'type': ticket_data['issuetype']['name'], 'summary': ticket_data['summary'],
+                               'description': ticket_data['description'], 'plan': plan.columns(slot)})
+                slot += 1
+    return slot
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export generated datasets and inspect them")
+    commands = parser.add_subparsers(dest='command', required=True)
+    export = commands.add_parser('export', help="generate content and a plan from the INPUT_* config")
+    export.add_argument('--output', required=True)
+    info = commands.add_parser('info', help="summarize a dataset file")
+    info.add_argument('path')
+    args = parser.parse_args()
+
+    if args.command == 'export':
+        from dotenv import load_dotenv
+        from team_roster import roster_from_env
+        from ticket_generator import TicketGenerator
+
+        load_dotenv()
+        started = time.perf_counter()
+        roster = roster_from_env()
+        plan = SimulationPlan.from_env(len(roster))
+        generator = TicketGenerator(None, os.getenv('JIRA_PROJECT_KEY', 'DATASET'))
+        tickets = export_dataset(args.output, generator, roster, plan, int(os.getenv('INPUT_NUM_SPRINTS', 2)))
+        generator.print_content_summary()
+        print(f"Wrote {tickets} tickets to {args.output} ({os.path.getsize(args.output):,} bytes) "
+              f"in {time.perf_counter() - started:.3f}s")
+        return
+
+    dataset = Dataset(args.path)
+    header = dataset.header
+    types = {}
+    for ticket in dataset.tickets():
+        types[ticket['type']] = types.get(ticket['type'], 0) + 1
+    print(f"{args.path}: {len(dataset)} tickets in {len(dataset.sprints)} sprints, "
+          f"{len(dataset.roster)} team members")
+    print(f"  Created {header['created']} from seed {header['seed']} ({header['content_source']} content)")
+    print(f"  Types: {', '.join(f'{count} {ticket_type}' for ticket_type, count in sorted(types.items()))}")
+    print(f"  Epic: {dataset.epic['summary']}")
+    dataset.close()
+
+
+if __name__ == "__main__":
+    main()
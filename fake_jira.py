@@ -0,0 +1,617 @@
+"""In-memory stand-in for the parts of the Jira REST API this project uses.
+
+The backend speaks HTTP-shaped requests, so the real `jira` client, the request
+throttle and everything above them run unchanged against it. Select it with
+`JIRA_SERVER=memory://`, or serve it over HTTP with `python fake_jira.py --port 8080`.
+
+Latency and throttling can be injected to exercise the throughput features:
+
+    FAKE_JIRA_LATENCY_MS    mean latency added to every request (default 0)
+    FAKE_JIRA_429_RATE      fraction of requests rejected with 429 (default 0)
+    FAKE_JIRA_RATE_LIMIT    server-side requests per second before 429s (default unlimited)
+    FAKE_JIRA_WORKFLOW      'simple' (any status to any status) or 'review'
+                            (To Do -> In Progress -> In Review -> QA -> Done)
+"""
+import argparse
+import json
+import os
+import random
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+MEMORY_SCHEME = 'memory://'
+# requests only applies query parameters to http(s) URLs, so memory:// maps onto this host
+MEMORY_SERVER_URL = 'http://jira.memory'
+
+STATUS_CATEGORIES = {
+    'To Do': 'new',
+    'In Progress': 'indeterminate',
+    'In Review': 'indeterminate',
+    'QA': 'indeterminate',
+    'Done': 'done'
+}
+
+WORKFLOWS = {
+    'simple': {
+        'To Do': ['In Progress', 'Done'],
+        'In Progress': ['To Do', 'Done'],
+        'Done': ['To Do', 'In Progress']
+    },
+    'review': {
+        'To Do': ['In Progress'],
+        'In Progress': ['To Do', 'In Review'],
+        'In Review': ['In Progress', 'QA'],
+        'QA': ['In Progress', 'Done'],
+        'Done': ['To Do']
+    }
+}
+
+FIELDS = [
+    {'id': 'summary', 'name': 'Summary', 'custom': False},
+    {'id': 'description', 'name': 'Description', 'custom': False},
+    {'id': 'issuetype', 'name': 'Issue Type', 'custom': False},
+    {'id': 'status', 'name': 'Status', 'custom': False},
+    {'id': 'assignee', 'name': 'Assignee', 'custom': False},
+    {'id': 'labels', 'name': 'Labels', 'custom': False},
+    {'id': 'customfield_10014', 'name': 'Epic Link', 'custom': True},
+    {'id': 'customfield_10016', 'name': 'Story Points', 'custom': True},
+    {'id': 'customfield_10020', 'name': 'Sprint', 'custom': True}
+]
+
+
+class FakeJiraError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class FakeJiraBackend:
+    """Thread-safe in-memory Jira: issues, sprints, boards, filters, users and workflows"""
+
+    def __init__(self, latency_ms=0, throttle_rate=0, rate_limit=0, workflow='simple', base_url=MEMORY_SERVER_URL):
+        self.latency = latency_ms / 1000.0
+        self.throttle_rate = throttle_rate
+        self.rate_limit = rate_limit
+        self.workflow = WORKFLOWS[workflow]
+        self.base_url = base_url
+        self.lock = threading.Lock()
+        self.request_count = 0
+        self.throttled_count = 0
+        self._window_start = time.monotonic()
+        self._window_count = 0
+
+        self.projects = {}
+        self.issues = {}
+        self.issue_ids = {}
+        self.issue_counters = {}
+        self.issue_types = {}
+        self.statuses = {name: str(10000 + i) for i, name in enumerate(STATUS_CATEGORIES)}
+        self.transition_ids = {name: str(11 + i * 10) for i, name in enumerate(STATUS_CATEGORIES)}
+        self.sprints = {}
+        self.boards = {}
+        self.filters = {}
+        self.users = {}
+        self.next_id = 10000
+        self.myself = self._add_user('admin@example.com', 'Admin')
+
+        self.routes = [
+            ('GET', r'/rest/api/2/serverInfo', self._server_info),
+            ('GET', r'/rest/api/2/field', lambda params, body: FIELDS),
+            ('GET', r'/rest/api/2/myself', lambda params, body: self.myself),
+            ('GET', r'/rest/api/2/user/search', self._search_users),
+            ('POST', r'/rest/api/2/user', self._create_user),
+            ('GET', r'/rest/api/2/project/(?P<key>[^/]+)', self._get_project),
+            ('GET', r'/rest/api/2/project/(?P<key>[^/]+)/statuses', self._get_project_statuses),
+            ('POST', r'/rest/api/2/filter', self._create_filter),
+            ('POST', r'/rest/api/2/issue/bulk', self._bulk_create_issues),
+            ('POST', r'/rest/api/2/issue', self._create_issue),
+            ('GET', r'/rest/api/2/issue/(?P<key>[^/]+)', self._get_issue),
+            ('PUT', r'/rest/api/2/issue/(?P<key>[^/]+)', self._update_issue),
+            ('PUT', r'/rest/api/2/issue/(?P<key>[^/]+)/assignee', self._assign_issue),
+            ('GET', r'/rest/api/2/issue/(?P<key>[^/]+)/transitions', self._get_transitions),
+            ('POST', r'/rest/api/2/issue/(?P<key>[^/]+)/transitions', self._do_transition),
+            ('POST', r'/rest/api/2/issue/(?P<key>[^/]+)/comment', self._add_comment),
+            ('POST', r'/rest/api/2/issue/(?P<key>[^/]+)/worklog', self._add_worklog),
+            ('GET', r'/rest/agile/1.0/board', self._list_boards),
+            ('POST', r'/rest/agile/1.0/board', self._create_board),
+            ('POST', r'/rest/agile/1.0/sprint', self._create_sprint),
+            ('GET', r'/rest/agile/1.0/sprint/(?P<sprint_id>\d+)', self._get_sprint),
+            ('PUT', r'/rest/agile/1.0/sprint/(?P<sprint_id>\d+)', self._update_sprint),
+            ('POST', r'/rest/agile/1.0/sprint/(?P<sprint_id>\d+)', self._update_sprint),
+            ('POST', r'/rest/agile/1.0/sprint/(?P<sprint_id>\d+)/issue', self._move_issues_to_sprint)
+        ]
+        self.routes = [
+            (method, re.compile(pattern.replace('/rest/api/2/', '/rest/api/(?:2|latest)/') + '$'), handler)
+            for method, pattern, handler in self.routes
+        ]
+
+    @classmethod
+    def from_env(cls, base_url=MEMORY_SERVER_URL):
+        return cls(
+            latency_ms=float(os.getenv('FAKE_JIRA_LATENCY_MS', 0)),
+            throttle_rate=float(os.getenv('FAKE_JIRA_429_RATE', 0)),
+            rate_limit=float(os.getenv('FAKE_JIRA_RATE_LIMIT', 0)),
+            workflow=os.getenv('FAKE_JIRA_WORKFLOW', 'simple'),
+            base_url=base_url
+        )
+
+    def handle(self, method, path, params=None, body=None, delay=True):
+        """Serve one request; returns (status, headers, payload).
+
+        With delay=False the injected latency is left to the caller, e.g. to wait
+        it out on an event loop instead of blocking a thread.
+        """
+        params = params or {}
+        with self.lock:
+            self.request_count += 1
+            throttled = self._should_throttle()
+            if throttled:
+                self.throttled_count += 1
+
+        if self.latency and delay:
+            time.sleep(self.delay())
+        headers = {'Content-Type': 'application/json'}
+        if self.rate_limit:
+            headers['X-RateLimit-FillRate'] = str(self.rate_limit)
+            headers['X-RateLimit-Interval-Seconds'] = '1'
+        if throttled:
+            headers['Retry-After'] = '1'
+            return 429, headers, {'errorMessages': ['Rate limit exceeded'], 'errors': {}}
+
+        for route_method, pattern, handler in self.routes:
+            match = pattern.match(path)
+            if route_method == method.upper() and match:
+                try:
+                    with self.lock:
+                        result = handler(params, body, **match.groupdict())
+                except FakeJiraError as e:
+                    return e.status, headers, {'errorMessages': [e.message], 'errors': {}}
+                if isinstance(result, tuple):
+                    return result[0], headers, result[1]
+                return 200, headers, result
+        return 404, headers, {'errorMessages': [f"No fake route for {method} {path}"], 'errors': {}}
+
+    def delay(self):
+        """Seconds of injected latency for one request"""
+        return random.uniform(0.5, 1.5) * self.latency
+
+    def _should_throttle(self):
+        if self.throttle_rate and random.random() < self.throttle_rate:
+            return True
+        if self.rate_limit:
+            now = time.monotonic()
+            if now - self._window_start >= 1:
+                self._window_start, self._window_count = now, 0
+            self._window_count += 1
+            return self._window_count > self.rate_limit
+        return False
+
+    def _new_id(self):
+        self.next_id += 1
+        return str(self.next_id)
+
+    def _url(self, path):
+        return f"{self.base_url}{path}"
+
+    def _paginate(self, items, params, key='values'):
+        start = int(params.get('startAt', 0))
+        size = int(params.get('maxResults', 50))
+        page = items[start:start + size]
+        return {'startAt': start, 'maxResults': size, 'total': len(items),
+                'isLast': start + size >= len(items), key: page}
+
+    # Server, fields and users
+
+    def _server_info(self, params, body):
+        return {'baseUrl': self.base_url, 'version': '1001.0.0', 'versionNumbers': [1001, 0, 0],
+                'deploymentType': 'Cloud', 'serverTitle': 'Fake Jira'}
+
+    def _add_user(self, email, display_name):
+        account_id = f"fake-{len(self.users) + 1:06d}"
+        user = {'accountId': account_id, 'emailAddress': email, 'displayName': display_name,
+                'active': True, 'self': self._url(f"/rest/api/2/user?accountId={account_id}")}
+        self.users[account_id] = user
+        return user
+
+    def _search_users(self, params, body):
+        query = (params.get('query') or params.get('username') or '').lower()
+        matches = [
+            user for user in self.users.values()
+            if query in user['emailAddress'].lower() or query in user['displayName'].lower()
+        ]
+        start = int(params.get('startAt', 0))
+        return matches[start:start + int(params.get('maxResults', 50))]
+
+    def _create_user(self, params, body):
+        if any(user['emailAddress'] == body.get('emailAddress') for user in self.users.values()):
+            raise FakeJiraError(400, 'A user with that email address already exists.')
+        return 201, self._add_user(body['emailAddress'], body.get('displayName', body['emailAddress']))
+
+    def _project(self, ref):
+        key = ref.get('key') or ref.get('id') if isinstance(ref, dict) else str(ref)
+        for project in self.projects.values():
+            if key in (project['key'], project['id']):
+                return project
+        project = {'id': self._new_id(), 'key': key, 'name': key}
+        project['self'] = self._url(f"/rest/api/2/project/{project['id']}")
+        self.projects[project['id']] = project
+        return project
+
+    def _get_project(self, params, body, key):
+        return self._project(key)
+
+    def _get_project_statuses(self, params, body, key):
+        self._project(key)
+        statuses = [
+            {'name': name, 'id': self.statuses[name], 'statusCategory': {'key': STATUS_CATEGORIES[name]}}
+            for name in self.workflow
+        ]
+        return [dict(issue_type, subtask=False, statuses=statuses) for issue_type in self.issue_types.values()]
+
+    # Filters and boards
+
+    def _create_filter(self, params, body):
+        filter_id = self._new_id()
+        raw = dict(body, id=filter_id, self=self._url(f"/rest/api/2/filter/{filter_id}"))
+        self.filters[filter_id] = raw
+        return raw
+
+    def _create_board(self, params, body):
+        jql = self.filters.get(str(body.get('filterId')), {}).get('jql', '')
+        match = re.search(r'project\s*=\s*"?([A-Za-z0-9_]+)', jql)
+        project_key = (body.get('location') or {}).get('projectKeyOrId') or (match.group(1) if match else None)
+        board_id = int(self._new_id())
+        raw = {'id': board_id, 'name': body['name'], 'type': body.get('type', 'scrum'),
+               'self': self._url(f"/rest/agile/1.0/board/{board_id}"),
+               'location': {'projectKey': project_key}}
+        self.boards[board_id] = raw
+        return 201, raw
+
+    def _list_boards(self, params, body):
+        boards = list(self.boards.values())
+        if params.get('type'):
+            boards = [b for b in boards if b['type'] == params['type']]
+        if params.get('name'):
+            boards = [b for b in boards if params['name'].lower() in b['name'].lower()]
+        if params.get('projectKeyOrId'):
+            boards = [b for b in boards if b['location']['projectKey'] == params['projectKeyOrId']]
+        return self._paginate(boards, params)
+
+    # Sprints
+
+    def _sprint_raw(self, sprint):
+        return {key: value for key, value in sprint.items() if key != 'issues'}
+
+    def _create_sprint(self, params, body):
+        sprint_id = int(self._new_id())
+        sprint = dict(body, id=sprint_id, state='future', issues=[],
+                      self=self._url(f"/rest/agile/1.0/sprint/{sprint_id}"))
+        self.sprints[sprint_id] = sprint
+        return 201, self._sprint_raw(sprint)
+
+    def _get_sprint(self, params, body, sprint_id):
+        sprint = self._get(self.sprints, int(sprint_id), 'Sprint')
+        return self._sprint_raw(sprint)
+
+    def _update_sprint(self, params, body, sprint_id):
+        sprint = self._get(self.sprints, int(sprint_id), 'Sprint')
+        state = body.get('state')
+        if state == 'active' and sprint['state'] != 'future':
+            raise FakeJiraError(400, 'Only future sprints can be started.')
+        if state == 'closed' and sprint['state'] != 'active':
+            raise FakeJiraError(400, 'Only active sprints can be completed.')
+        sprint.update({key: value for key, value in body.items() if key not in ('id', 'self')})
+        if state == 'closed':
+            sprint['completeDate'] = _now()
+        return self._sprint_raw(sprint)
+
+    def _move_issues_to_sprint(self, params, body, sprint_id):
+        sprint = self._get(self.sprints, int(sprint_id), 'Sprint')
+        if sprint['state'] == 'closed':
+            raise FakeJiraError(400, 'Issues cannot be moved to a closed sprint.')
+        keys = body.get('issues', [])
+        if len(keys) > 50:
+            raise FakeJiraError(400, 'At most 50 issues can be moved in one request.')
+        for key in keys:
+            issue = self._issue(key)
+            old_sprint = issue['sprint']
+            if old_sprint is not None and old_sprint in self.sprints:
+                self.sprints[old_sprint]['issues'].remove(issue['key'])
+            issue['sprint'] = sprint['id']
+            sprint['issues'].append(issue['key'])
+        return 204, None
+
+    # Issues
+
+    def _issue(self, key_or_id):
+        key = self.issue_ids.get(str(key_or_id), key_or_id)
+        return self._get(self.issues, key, 'Issue')
+
+    def _get(self, table, key, kind):
+        if key not in table:
+            raise FakeJiraError(404, f"{kind} {key} does not exist.")
+        return table[key]
+
+    def _create_issue_record(self, fields):
+        if not fields.get('summary'):
+            raise FakeJiraError(400, 'Summary is required.')
+        project = self._project(fields.get('project', {}))
+        type_name = fields.get('issuetype', {}).get('name') or 'Task'
+        issue_type = self.issue_types.setdefault(type_name, {'id': str(10000 + len(self.issue_types)), 'name': type_name})
+        number = self.issue_counters.get(project['key'], 0) + 1
+        self.issue_counters[project['key']] = number
+        key = f"{project['key']}-{number}"
+        issue_id = self._new_id()
+        issue = {
+            'id': issue_id,
+            'key': key,
+            'project': project,
+            'issuetype': issue_type,
+            'status': 'To Do',
+            'assignee': None,
+            'labels': list(fields.get('labels', [])),
+            'sprint': None,
+            'comments': [],
+            'worklogs': [],
+            'created': _now(),
+            'fields': {name: value for name, value in fields.items()
+                       if name not in ('project', 'issuetype', 'labels', 'assignee')}
+        }
+        if fields.get('assignee'):
+            issue['assignee'] = self._user(fields['assignee'])
+        self.issues[key] = issue
+        self.issue_ids[issue_id] = key
+        return {'id': issue_id, 'key': key, 'self': self._url(f"/rest/api/2/issue/{issue_id}")}
+
+    def _create_issue(self, params, body):
+        return 201, self._create_issue_record(body.get('fields', {}))
+
+    def _bulk_create_issues(self, params, body):
+        updates = body.get('issueUpdates', [])
+        if len(updates) > 50:
+            raise FakeJiraError(400, 'At most 50 issues can be created in one request.')
+        created, errors = [], []
+        for index, update in enumerate(updates):
+            try:
+                created.append(self._create_issue_record(update.get('fields', {})))
+            except FakeJiraError as e:
+                errors.append({'status': e.status, 'failedElementNumber': index,
+                               'elementErrors': {'errorMessages': [], 'errors': {'summary': e.message}}})
+        return (201 if created else 400), {'issues': created, 'errors': errors}
+
+    def _issue_raw(self, issue):
+        status = issue['status']
+        fields = dict(issue['fields'])
+        fields.update({
+            'project': issue['project'],
+            'issuetype': issue['issuetype'],
+            'status': {'name': status, 'id': self.statuses[status],
+                       'statusCategory': {'key': STATUS_CATEGORIES[status]}},
+            'assignee': issue['assignee'],
+            'labels': issue['labels'],
+            'created': issue['created'],
+            'customfield_10020': [self._sprint_raw(self.sprints[issue['sprint']])] if issue['sprint'] else None,
+            'comment': {'comments': issue['comments'], 'total': len(issue['comments'])},
+            'worklog': {'worklogs': issue['worklogs'], 'total': len(issue['worklogs'])}
+        })
+        return {'id': issue['id'], 'key': issue['key'],
+                'self': self._url(f"/rest/api/2/issue/{issue['id']}"), 'fields': fields}
+
+    def _get_issue(self, params, body, key):
+        raw = self._issue_raw(self._issue(key))
+        if params.get('fields'):
+            wanted = set(params['fields'].split(','))
+            raw['fields'] = {name: value for name, value in raw['fields'].items() if name in wanted}
+        return raw
+
+    def _apply_update(self, issue, body):
+        for name, value in (body.get('fields') or {}).items():
+            if name == 'labels':
+                issue['labels'] = list(value)
+            elif name == 'assignee':
+                issue['assignee'] = self._user(value) if value else None
+            else:
+                issue['fields'][name] = value
+        for name, operations in (body.get('update') or {}).items():
+            for operation in operations:
+                if name == 'labels':
+                    if 'add' in operation and operation['add'] not in issue['labels']:
+                        issue['labels'].append(operation['add'])
+                    if 'remove' in operation and operation['remove'] in issue['labels']:
+                        issue['labels'].remove(operation['remove'])
+                elif name == 'comment' and 'add' in operation:
+                    self._append_comment(issue, operation['add'])
+                elif name == 'worklog' and 'add' in operation:
+                    self._append_worklog(issue, operation['add'])
+
+    def _update_issue(self, params, body, key):
+        self._apply_update(self._issue(key), body)
+        return 204, None
+
+    def _user(self, ref):
+        account_id = ref.get('accountId') if isinstance(ref, dict) else ref
+        if account_id not in self.users:
+            raise FakeJiraError(400, f"User {account_id} does not exist.")
+        return self.users[account_id]
+
+    def _assign_issue(self, params, body, key):
+        issue = self._issue(key)
+        issue['assignee'] = self._user(body) if body.get('accountId') else None
+        return 204, None
+
+    def _transitions_for(self, issue):
+        return [
+            {'id': self.transition_ids[target], 'name': target, 'hasScreen': False,
+             'to': {'name': target, 'id': self.statuses[target],
+                    'statusCategory': {'key': STATUS_CATEGORIES[target]}}}
+            for target in self.workflow[issue['status']]
+        ]
+
+    def _get_transitions(self, params, body, key):
+        return {'expand': 'transitions', 'transitions': self._transitions_for(self._issue(key))}
+
+    def _do_transition(self, params, body, key):
+        issue = self._issue(key)
+        transition_id = str(body.get('transition', {}).get('id'))
+        target = next((t['name'] for t in self._transitions_for(issue) if t['id'] == transition_id), None)
+        if target is None:
+            raise FakeJiraError(400, f"Transition id '{transition_id}' is not valid for this issue.")
+        issue['status'] = target
+        self._apply_update(issue, body)
+        return 204, None
+
+    def _append_comment(self, issue, body):
+        comment_id = self._new_id()
+        comment = {'id': comment_id, 'body': body.get('body', ''), 'author': self.myself, 'created': _now(),
+                   'self': self._url(f"/rest/api/2/issue/{issue['id']}/comment/{comment_id}")}
+        issue['comments'].append(comment)
+        return comment
+
+    def _append_worklog(self, issue, body):
+        worklog_id = self._new_id()
+        worklog = dict(body, id=worklog_id, issueId=issue['id'], author=self.myself,
+                       started=body.get('started') or _now(),
+                       self=self._url(f"/rest/api/2/issue/{issue['id']}/worklog/{worklog_id}"))
+        issue['worklogs'].append(worklog)
+        return worklog
+
+    def _add_comment(self, params, body, key):
+        return 201, self._append_comment(self._issue(key), body)
+
+    def _add_worklog(self, params, body, key):
+        return 201, self._append_worklog(self._issue(key), body)
+
+
+def _now():
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.000+0000')
+
+
+class FakeJiraAdapter(BaseAdapter):
+    """requests transport adapter that answers from a FakeJiraBackend instead of the network"""
+
+    def __init__(self, backend):
+        super().__init__()
+        self.backend = backend
+
+    def send(self, request, **kwargs):
+        parsed = urlparse(request.url)
+        params = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+        body = request.body
+        if isinstance(body, bytes):
+            body = body.decode('utf-8')
+        status, headers, payload = self.backend.handle(request.method, parsed.path, params, json.loads(body) if body else {})
+
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(headers)
+        response._content = json.dumps(payload).encode('utf-8') if payload is not None else b''
+        response.url = request.url
+        response.request = request
+        response.encoding = 'utf-8'
+        response.reason = 'Fake'
+        return response
+
+    def close(self):
+        pass
+
+
+_shared_backend = None
+_shared_backend_lock = threading.Lock()
+
+
+def get_memory_backend():
+    """The process-wide backend behind memory://, so every client sees the same data"""
+    global _shared_backend
+    with _shared_backend_lock:
+        if _shared_backend is None:
+            _shared_backend = FakeJiraBackend.from_env()
+        return _shared_backend
+
+
+def reset_memory_backend(backend=None):
+    """Replace the shared memory:// backend, e.g. between benchmark runs"""
+    global _shared_backend
+    with _shared_backend_lock:
+        _shared_backend = backend
+    return backend
+
+
+def mount_memory_backend(session, backend=None):
+    """Answer every request `session` sends to MEMORY_SERVER_URL from the in-memory backend"""
+    session.mount(MEMORY_SERVER_URL, FakeJiraAdapter(backend or get_memory_backend()))
+
+
+def memory_transport(backend=None):
+    """httpx transport answering from the in-memory backend, for AsyncJiraManager.
+
+    Injected latency is awaited rather than slept, so concurrent requests overlap
+    on the event loop the way they would against a real server.
+    """
+    import asyncio
+    import httpx
+
+    backend = backend or get_memory_backend()
+
+    async def handle(request):
+        if backend.latency:
+            await asyncio.sleep(backend.delay())
+        params = {key: value for key, value in request.url.params.items()}
+        body = json.loads(request.content) if request.content else {}
+        status, headers, payload = backend.handle(request.method, request.url.path, params, body, delay=False)
+        content = json.dumps(payload).encode('utf-8') if payload is not None else b''
+        return httpx.Response(status, headers=headers, content=content)
+
+    return httpx.MockTransport(handle)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    backend = None
+
+    def _serve(self):
+        parsed = urlparse(self.path)
+        params = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+        length = int(self.headers.get('Content-Length') or 0)
+        body = json.loads(self.rfile.read(length)) if length else {}
+        status, headers, payload = self.backend.handle(self.command, parsed.path, params, body)
+        content = json.dumps(payload).encode('utf-8') if payload is not None else b''
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _serve
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(host='127.0.0.1', port=8080):
+    """Serve a fresh backend over HTTP until interrupted"""
+    _Handler.backend = FakeJiraBackend.from_env(base_url=f"http://{host}:{port}")
+    server = ThreadingHTTPServer((host, port), _Handler)
+    print(f"Fake Jira listening on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the in-memory Jira stand-in over HTTP")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    args = parser.parse_args()
+    serve(args.host, args.port)
@@ -0,0 +1,181 @@
+"""Seed many projects across one or more Jira tenants from a single invocation.
+
+The manifest is JSON:
+
+    {
+      "tenants": {
+        "acme": {
+          "server": "https://acme.atlassian.net",
+          "email": "bot@acme.com",
+          "api_token_env": "ACME_JIRA_TOKEN",
+          "concurrency": 16,
+          "requests_per_second": 20,
+          "parallel_projects": 4,
+          "env": {"INPUT_NUM_SPRINTS": "4"}
+        }
+      },
+      "projects": [
+        {"tenant": "acme", "project_key": "WEB"},
+        {"tenant": "acme", "project_key": "API"}
+      ]
+    }
+
+Each tenant runs in its own worker process with one shared Jira client, so its
+projects share authentication, field/board/transition metadata, the request
+rate limit and a connection pool of `concurrency` connections; that pool is
+the tenant's concurrency budget however many projects run at once. A tenant's
+`env` sets INPUT_* options for all of its projects. Run with:
+
+    python fanout.py manifest.json --output report.json
+"""
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from dotenv import load_dotenv
+
+
+def load_manifest(path):
+    with open(path) as f:
+        manifest = json.load(f)
+    tenants = manifest.get('tenants', {})
+    for project in manifest.get('projects', []):
+        if project.get('tenant') not in tenants:
+            raise ValueError(f"Project {project.get('project_key')} names unknown tenant {project.get('tenant')!r}")
+    return manifest
+
+
+def seed_tenant(name, tenant, project_keys, run_id):
+    """Seed every project of one tenant; runs in its own process"""
+    # Worker processes are reused when there are fewer than tenants; leave the environment as it was
+    environ = dict(os.environ)
+    try:
+        return _seed_tenant(name, tenant, project_keys, run_id)
+    finally:
+        os.environ.clear()
+        os.environ.update(environ)
+
+
+def _seed_tenant(name, tenant, project_keys, run_id):
+    # Tenant options apply to every module this tenant's run uses
+    os.environ.update({key: str(value) for key, value in tenant.get('env', {}).items()})
+    if tenant.get('concurrency'):
+        os.environ['INPUT_HTTP_POOL_SIZE'] = str(tenant['concurrency'])
+    if tenant.get('requests_per_second') is not None:
+        os.environ['INPUT_REQUESTS_PER_SECOND'] = str(tenant['requests_per_second'])
+
+    from dataset import Dataset
+    from jira_client import create_jira_client
+    from main import seed_project
+    from metadata_cache import get_metadata_cache
+    from run_journal import RunJournal
+    from team_roster import TeamProvisioner, roster_from_env
+
+    started = time.monotonic()
+    api_token = os.getenv(tenant['api_token_env']) if tenant.get('api_token_env') else tenant.get('api_token')
+    try:
+        jira = create_jira_client(tenant['server'], tenant.get('email'), api_token)
+    except Exception as e:
+        print(f"Error connecting to tenant {name}: {str(e)}")
+        return {'tenant': name, 'status': 'failed', 'error': str(e), 'projects': [], 'calls': []}
+
+    # Provision the team once; parallel projects then find every account in the shared
+    # metadata cache instead of racing each other to create it
+    dataset = Dataset.from_env()
+    TeamProvisioner(jira).provision(dataset.roster if dataset is not None else roster_from_env())
+    if dataset is not None:
+        dataset.close()
+
+    def run(project_key):
+        journal = RunJournal(f"{run_id}-{name}-{project_key}")
+        try:
+            return seed_project(jira, project_key, journal)
+        except Exception as e:
+            print(f"Error seeding {name}/{project_key}: {str(e)}")
+            return {'project': project_key, 'status': 'failed', 'error': str(e)}
+        finally:
+            journal.close()
+
+    parallel = max(1, int(tenant.get('parallel_projects', len(project_keys) or 1)))
+    with ThreadPoolExecutor(max_workers=parallel) as executor:
+        projects = list(executor.map(run, project_keys))
+
+    get_metadata_cache(jira).flush()
+    jira.instrumentation.close()
+    return {
+        'tenant': name,
+        'server': tenant['server'],
+        'status': 'ok' if all(project['status'] == 'ok' for project in projects) else 'failed',
+        'seconds': round(time.monotonic() - started, 2),
+        'projects': projects,
+        'calls': jira.instrumentation.summary(),
+        'http_pool': jira.http_pool.stats()
+    }
+
+
+def aggregate(tenants, seconds):
+    projects = [project for tenant in tenants for project in tenant['projects']]
+    calls = sum(row['calls'] for tenant in tenants for row in tenant['calls'])
+    tickets = sum(project.get('tickets', 0) for project in projects)
+    return {
+        'seconds': round(seconds, 2),
+        'tenants': len(tenants),
+        'projects': len(projects),
+        'failed_projects': sum(1 for project in projects if project['status'] != 'ok'),
+        'tickets': tickets,
+        'simulated': sum(project.get('simulated', 0) for project in projects),
+        'api_calls': calls,
+        'api_calls_per_ticket': round(calls / tickets, 2) if tickets else None,
+        'tickets_per_second': round(tickets / seconds, 2) if seconds else None
+    }
+
+
+def print_report(report):
+    print("\nFan-out report:")
+    print(f"  {'tenant':<16} {'project':<12} {'status':<8} {'sprints':>7} {'tickets':>8} {'simulated':>9} {'seconds':>8}")
+    for tenant in report['tenants']:
+        if not tenant['projects']:
+            print(f"  {tenant['tenant']:<16} {'-':<12} {tenant['status']:<8}")
+        for project in tenant['projects']:
+            print(f"  {tenant['tenant']:<16} {project['project']:<12} {project['status']:<8} "
+                  f"{project.get('sprints', 0):>7} {project.get('tickets', 0):>8} "
+                  f"{project.get('simulated', 0):>9} {project.get('seconds', 0):>8}")
+    totals = report['totals']
+    print(f"\n{totals['projects']} projects on {totals['tenants']} tenants in {totals['seconds']}s: "
+          f"{totals['tickets']} tickets, {totals['api_calls']} API calls, {totals['failed_projects']} failed")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Seed the projects listed in a manifest, tenants in parallel")
+    parser.add_argument('manifest')
+    parser.add_argument('--processes', type=int, help="tenant worker processes (default: one per tenant)")
+    parser.add_argument('--run-id', default=os.getenv('INPUT_RUN_ID') or time.strftime('%Y%m%d-%H%M%S'),
+                        help="journal prefix; rerun with the same ID to resume every project")
+    parser.add_argument('--output', help="write the aggregated JSON report to this file")
+    args = parser.parse_args()
+
+    load_dotenv()
+    manifest = load_manifest(args.manifest)
+    by_tenant = {}
+    for project in manifest['projects']:
+        by_tenant.setdefault(project['tenant'], []).append(project['project_key'])
+
+    started = time.monotonic()
+    with ProcessPoolExecutor(max_workers=args.processes or max(1, len(by_tenant))) as executor:
+        futures = [
+            executor.submit(seed_tenant, name, manifest['tenants'][name], project_keys, args.run_id)
+            for name, project_keys in by_tenant.items()
+        ]
+        tenants = [future.result() for future in futures]
+
+    report = {'run_id': args.run_id, 'totals': aggregate(tenants, time.monotonic() - started), 'tenants': tenants}
+    print_report(report)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def payload_size(kwargs):
+    """Bytes a requests or httpx call will send as its body"""
+    data = kwargs.get('data')
+    if data is None:
+        data = kwargs.get('content')
+    if data is None and kwargs.get('json') is not None:
+        data = json.dumps(kwargs['json'])
+    if isinstance(data, str):
+        return len(data.encode('utf-8'))
+    if isinstance(data, bytes):
+        return len(data)
+    return 0
+
+
+class Instrumentation:
+    """Per-call records for Jira and Anthropic calls.
+
+    Each call produces one record (kind, operation, latency, status, retries,
+    throttled responses, time spent waiting and payload sizes). Callers that
+    wait or retry set `latency_ms` to the time spent on the wire themselves and
+    put rate-limit waits and backoff in `wait_ms`. Records are aggregated per operation for the end-of-run summary,
+    optionally written as JSON lines to `log_path` ('-' for stderr) and, when
+    `otel` is set and the opentelemetry API is installed, emitted as spans.
+    """
+
+    def __init__(self, log_path=None, otel=False):
+        self.lock = threading.Lock()
+        self.operations = {}
+        self.log_file = None
+        if log_path == '-':
+            self.log_file = sys.stderr
+        elif log_path:
+            self.log_file = open(log_path, 'a')
+        self.tracer = self._tracer() if otel else None
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            log_path=os.getenv('INPUT_TRACE_LOG'),
+            otel=os.getenv('INPUT_OTEL_TRACING', 'false').lower() == 'true'
+        )
+
+    def _tracer(self):
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            print("Warning: INPUT_OTEL_TRACING is set but opentelemetry is not installed; spans are disabled")
+            return None
+        return trace.get_tracer('jira-ticket-simulator')
+
+    @contextmanager
+    def call(self, kind, operation, **attributes):
+        """Time one call; the caller fills in status, retries and sizes on the yielded record"""
+        record = {'kind': kind, 'operation': operation, 'status': None, 'retries': 0, 'throttled': 0,
+                  'wait_ms': 0.0, 'request_bytes': 0, 'response_bytes': 0}
+        record.update(attributes)
+        span = self.tracer.start_span(f"{kind} {operation}") if self.tracer else None
+        started = time.perf_counter()
+        try:
+            yield record
+        except Exception as e:
+            record['error'] = type(e).__name__
+            raise
+        finally:
+            record['latency_ms'] = round(record.get('latency_ms', (time.perf_counter() - started) * 1000), 2)
+            record['wait_ms'] = round(record['wait_ms'], 2)
+            self._finish(record, span)
+
+    def _finish(self, record, span):
+        with self.lock:
+            stats = self.operations.setdefault((record['kind'], record['operation']), {
+                'calls': 0, 'errors': 0, 'retries': 0, 'throttled': 0, 'wait_ms': 0.0, 'request_bytes': 0,
+                'response_bytes': 0, 'latencies': []
+            })
+            stats['calls'] += 1
+            stats['errors'] += 1 if 'error' in record else 0
+            stats['retries'] += record['retries']
+            stats['throttled'] += record['throttled']
+            stats['wait_ms'] += record['wait_ms']
+            stats['request_bytes'] += record['request_bytes']
+            stats['response_bytes'] += record['response_bytes']
+            stats['latencies'].append(record['latency_ms'])
+            if self.log_file:
+                self.log_file.write(json.dumps(dict(record, ts=round(time.time(), 3))) + '\n')
+                self.log_file.flush()
+
+        if span is not None:
+            span.set_attributes({
+                name: value for name, value in record.items()
+                if isinstance(value, (str, bool, int, float))
+            })
+            if 'error' in record:
+                from opentelemetry.trace import Status, StatusCode
+                span.set_status(Status(StatusCode.ERROR, record['error']))
+            span.end()
+
+    def summary(self):
+        """Per-operation totals with latency percentiles, slowest total time first"""
+        with self.lock:
+            rows = []
+            for (kind, operation), stats in self.operations.items():
+                latencies = stats['latencies']
+                rows.append({
+                    'kind': kind,
+                    'operation': operation,
+                    'calls': stats['calls'],
+                    'errors': stats['errors'],
+                    'retries': stats['retries'],
+                    'throttled': stats['throttled'],
+                    'total_ms': round(sum(latencies), 2),
+                    'wait_ms': round(stats['wait_ms'], 2),
+                    'p50_ms': percentile(latencies, 0.50),
+                    'p95_ms': percentile(latencies, 0.95),
+                    'request_bytes': stats['request_bytes'],
+                    'response_bytes': stats['response_bytes']
+                })
+        return sorted(rows, key=lambda row: row['total_ms'], reverse=True)
+
+    def print_summary(self):
+        rows = self.summary()
+        if not rows:
+            return
+        print("\nCalls by total time:")
+        print(f"  {'operation':<52} {'calls':>6} {'errors':>6} {'retries':>7} {'429s':>5} {'p50 ms':>8} {'p95 ms':>8} "
+              f"{'total s':>8} {'wait s':>7} {'KB out':>8} {'KB in':>8}")
+        for row in rows:
+            name = f"{row['kind']} {row['operation']}"
+            print(f"  {name[:52]:<52} {row['calls']:>6} {row['errors']:>6} {row['retries']:>7} {row['throttled']:>5} "
+                  f"{row['p50_ms']:>8.1f} {row['p95_ms']:>8.1f} {row['total_ms'] / 1000:>8.2f} "
+                  f"{row['wait_ms'] / 1000:>7.2f} "
+                  f"{row['request_bytes'] / 1024:>8.1f} {row['response_bytes'] / 1024:>8.1f}")
+
+    def close(self):
+        with self.lock:
+            if self.log_file and self.log_file is not sys.stderr:
+                self.log_file.close()
+            self.log_file = None
@@ -0,0 +1,305 @@
+import os
+import random
+import re
+import socket
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+from jira import JIRA
+from jira.exceptions import JIRAError
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError, Timeout
+from urllib3.connection import HTTPConnection
+
+from instrumentation import Instrumentation, payload_size
+from rate_limiter import RateLimiter
+
+# Methods that are safe to resend when we can't tell whether the server applied them
+IDEMPOTENT_METHODS = {'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'}
+RETRYABLE_STATUSES = {429, 502, 503, 504}
+
+# Collapse issue keys and numeric IDs so counters group by endpoint, not by resource
+ISSUE_KEY_PATTERN = re.compile(r'/[A-Z][A-Z0-9_]*-\d+(?=/|$)')
+NUMERIC_ID_PATTERN = re.compile(r'(?<!/api)/\d+(?=/|$)')
+
+
+def endpoint_name(method, url):
+    """'GET /rest/api/2/issue/{key}' style name used to group calls by endpoint"""
+    path = urlparse(url).path
+    path = ISSUE_KEY_PATTERN.sub('/{key}', path)
+    path = NUMERIC_ID_PATTERN.sub('/{id}', path)
+    return f"{method.upper()} {path}"
+
+
+def create_jira_client(server=None, email=None, api_token=None):
+    """Build a JIRA client whose every request goes through a shared throttle.
+
+    A server of `memory://` selects the in-memory stand-in from fake_jira.
+    """
+    server = server or os.getenv('JIRA_SERVER')
+    in_memory = server.startswith('memory://')
+    if in_memory:
+        from fake_jira import MEMORY_SERVER_URL
+        server = MEMORY_SERVER_URL
+    jira = LazyServerInfoJIRA(
+        server=server,
+        basic_auth=(email or os.getenv('JIRA_EMAIL') or 'memory', api_token or os.getenv('JIRA_API_TOKEN') or 'memory'),
+        max_retries=0,  # RequestThrottle owns retries
+        get_server_info=False
+    )
+    # One keep-alive pool per client, shared by every thread and every raw _session call
+    jira.http_pool = PooledAdapter(pool_size())
+    jira._session.mount('https://', jira.http_pool)
+    jira._session.mount('http://', jira.http_pool)
+    if in_memory:
+        from fake_jira import mount_memory_backend
+        mount_memory_backend(jira._session)
+    jira.instrumentation = Instrumentation.from_env()
+    throttle = RequestThrottle(
+        requests_per_second=float(os.getenv('INPUT_REQUESTS_PER_SECOND', 10)),
+        max_retries=int(os.getenv('INPUT_MAX_RETRIES', 5)),
+        instrumentation=jira.instrumentation
+    )
+    throttle.install(jira._session)
+    jira.throttle = throttle
+    return jira
+
+
+class LazyServerInfoJIRA(JIRA):
+    """JIRA client that fetches server info the first time something needs it.
+
+    The deployment type and version decide which API variants the client uses
+    (accountId vs username and so on), but many runs never reach such a call, so
+    connecting costs no request. The fetch goes through the client's throttle.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._server_info_lock = threading.Lock()
+        self._server_info_loaded = False
+        super().__init__(*args, **kwargs)
+
+    def _load_server_info(self):
+        with self._server_info_lock:
+            if self._server_info_loaded:
+                return
+            server_info = self.server_info()
+            self.__dict__['_server_version'] = tuple(server_info.get('versionNumbers', (0, 0, 0)))
+            self.__dict__['_deployment_type'] = server_info.get('deploymentType')
+            self._server_info_loaded = True
+
+    @property
+    def deploymentType(self):
+        self._load_server_info()
+        return self.__dict__.get('_deployment_type')
+
+    @deploymentType.setter
+    def deploymentType(self, value):
+        # JIRA.__init__ assigns placeholders; real values come from _load_server_info
+        if value is not None:
+            self.__dict__['_deployment_type'] = value
+            self._server_info_loaded = True
+
+    @property
+    def _version(self):
+        self._load_server_info()
+        return self.__dict__.get('_server_version', (0, 0, 0))
+
+    @_version.setter
+    def _version(self, value):
+        if value != (0, 0, 0):
+            self.__dict__['_server_version'] = value
+            self._server_info_loaded = True
+
+
+def pool_size():
+    """Connections to keep open: one per simulation worker plus the pipeline and main threads"""
+    if os.getenv('INPUT_HTTP_POOL_SIZE'):
+        return max(1, int(os.getenv('INPUT_HTTP_POOL_SIZE')))
+    return max(1, int(os.getenv('INPUT_SIMULATION_CONCURRENCY', 4))) + 3
+
+
+class PooledAdapter(HTTPAdapter):
+    """Keep-alive connection pool sized to the client's worker threads.
+
+    requests' default pool holds 10 connections and, when more threads than that
+    are sending, opens extra ones and throws them away afterwards, paying a TCP and
+    TLS handshake each time. This pool blocks a thread until a connection is free
+    instead, and counts how often that happened so an undersized pool shows up in
+    the run summary.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.saturated = 0
+        self.stats_lock = threading.Lock()
+        super().__init__(pool_connections=4, pool_maxsize=size, pool_block=True)
+
+    def init_poolmanager(self, *args, **kwargs):
+        # TCP keep-alive stops idle pooled connections being dropped by proxies between bursts
+        kwargs.setdefault('socket_options', HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        ])
+        super().init_poolmanager(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        with self.stats_lock:
+            if self.in_flight >= self.size:
+                self.saturated += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            return super().send(request, **kwargs)
+        finally:
+            with self.stats_lock:
+                self.in_flight -= 1
+
+    def stats(self):
+        """Pool size, peak concurrency, waits for a free connection and connection reuse"""
+        connections = requests = 0
+        pools = self.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is not None:
+                connections += pool.num_connections
+                requests += pool.num_requests
+        with self.stats_lock:
+            return {
+                'pool_size': self.size,
+                'peak_in_flight': self.peak_in_flight,
+                'saturated_requests': self.saturated,
+                'connections_opened': connections,
+                'requests': requests
+            }
+
+    def print_stats(self):
+        stats = self.stats()
+        if not stats['requests']:
+            return
+        reused = 1 - stats['connections_opened'] / stats['requests']
+        print(f"\nHTTP pool: {stats['requests']} requests over {stats['connections_opened']} connections "
+              f"({reused:.0%} reused), peak {stats['peak_in_flight']}/{stats['pool_size']} in flight, "
+              f"{stats['saturated_requests']} waited for a free connection")
+
+
+class RequestThrottle:
+    """Rate limiting and retry for a Jira HTTP session, with one instrumentation record per call.
+
+    A call's latency is the time its attempts spent on the wire; time waiting
+    for the rate limiter or backing off between attempts is recorded apart as
+    `wait_ms`, and 429 responses as `throttled`.
+    """
+
+    def __init__(self, requests_per_second=10, max_retries=5, base_delay=0.5, max_delay=30, instrumentation=None):
+        self.max_rate = requests_per_second
+        self.limiter = RateLimiter(requests_per_second)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.instrumentation = instrumentation or Instrumentation()
+        self._send = None
+
+    def install(self, session):
+        """Route all of `session`'s requests through this throttle"""
+        self._send = session.request
+        session.request = self.request
+
+    def request(self, method, url, **kwargs):
+        endpoint = endpoint_name(method, url)
+        with self.instrumentation.call('jira', endpoint, request_bytes=payload_size(kwargs)) as record:
+            attempt = 0
+            record['latency_ms'] = 0.0
+            while True:
+                started = time.perf_counter()
+                self.limiter.acquire()
+                sent = time.perf_counter()
+                record['wait_ms'] += (sent - started) * 1000
+                response = None
+                try:
+                    response = self._send(method, url, **kwargs)
+                    error = None
+                except JIRAError as e:
+                    response, error = e.response, e
+                except (ConnectionError, Timeout) as e:
+                    error = e
+
+                self._record_attempt(record, attempt, sent, response)
+                if error is None:
+                    return response
+                if attempt >= self.max_retries or not self._is_retryable(method, response):
+                    raise error
+
+                delay = self._retry_delay(response, attempt)
+                record['wait_ms'] += delay * 1000
+                time.sleep(delay)
+                attempt += 1
+
+    def _record_attempt(self, record, attempt, sent, response):
+        """Add one attempt, sent at perf_counter() `sent`, to the call's record"""
+        record['latency_ms'] += (time.perf_counter() - sent) * 1000
+        record['status'] = response.status_code if response is not None else None
+        record['retries'] = attempt
+        if response is not None:
+            record['response_bytes'] = len(response.content or b'')
+            if response.status_code == 429:
+                record['throttled'] += 1
+            self._adapt_rate(response)
+
+    def _is_retryable(self, method, response):
+        if response is None:
+            # Connection dropped: only safe if resending can't duplicate a write
+            return method.upper() in IDEMPOTENT_METHODS
+        if response.status_code == 429:
+            # Throttled requests were rejected before being applied
+            return True
+        if response.status_code in RETRYABLE_STATUSES:
+            return method.upper() in IDEMPOTENT_METHODS or 'Retry-After' in response.headers
+        return False
+
+    def _retry_delay(self, response, attempt):
+        retry_after = self._retry_after(response) if response is not None else None
+        if retry_after is not None:
+            return min(self.max_delay, retry_after) + random.uniform(0, self.base_delay)
+        # Full jitter exponential backoff
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def _retry_after(self, response):
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def _adapt_rate(self, response):
+        """Track the tenant's advertised limit and back off multiplicatively on 429s"""
+        headers = response.headers
+        fill_rate = headers.get('X-RateLimit-FillRate')
+        interval = headers.get('X-RateLimit-Interval-Seconds')
+        if fill_rate and interval:
+            try:
+                self.max_rate = float(fill_rate) / float(interval)
+            except (ValueError, ZeroDivisionError):
+                pass
+
+        if self.max_rate <= 0:
+            # Pacing disabled and the tenant hasn't advertised a limit
+            return
+        if self.limiter.rate <= 0:
+            self.limiter.set_rate(self.max_rate)
+
+        if response.status_code == 429:
+            self.limiter.set_rate(max(0.5, self.limiter.rate / 2))
+        elif headers.get('X-RateLimit-Remaining') == '0':
+            self.limiter.set_rate(max(0.5, self.limiter.rate * 0.75))
+        elif self.limiter.rate < self.max_rate:
+            self.limiter.set_rate(min(self.max_rate, self.limiter.rate + 0.5))
+
@@ -1,27 +1,35 @@
 import os
-from jira import JIRA
+from jira_client import create_jira_client
+from metadata_cache import get_metadata_cache
+from workflow_planner import get_workflow_planner
 import json
 
 class JiraManager:
-    def __init__(self):
-        self.jira = JIRA(
-            server=os.getenv('JIRA_SERVER'),
-            basic_auth=(os.getenv('JIRA_EMAIL'), os.getenv('JIRA_API_TOKEN'))
-        )
+    def __init__(self, jira=None):
+        # Pass the caller's client to share its connection pool, throttle and caches
+        self.jira = jira or create_jira_client()
         self.project_key = os.getenv('JIRA_PROJECT_KEY')
         
-        # Get available fields
-        self.available_fields = self._get_available_fields()
+        # Field IDs, transitions and board IDs are shared with the other modules
+        self.metadata = get_metadata_cache(self.jira)
+        self.planner = get_workflow_planner(self.jira)
 
-    def _get_available_fields(self):
+    @property
+    def available_fields(self):
         """Get all available custom fields and their IDs"""
-        fields = {}
         try:
-            for field in self.jira.fields():
-                fields[field['name'].lower()] = field['id']
+            return self.metadata.fields()
         except Exception as e:
             print(f"Warning: Could not fetch fields - {str(e)}")
-        return fields
+            return {}
+
+    def _field_id(self, name):
+        """Resolve a field ID through the metadata cache"""
+        try:
+            return self.metadata.field_id(name)
+        except Exception as e:
+            print(f"Warning: Could not fetch fields - {str(e)}")
+            return None
 
     def create_epic(self, epic_data):
         """Create an epic in Jira"""
@@ -72,8 +80,7 @@ class JiraManager:
         }
             
         # Add story points if available
-        story_points_field = next((field_id for field_name, field_id in self.available_fields.items() 
-                                 if 'story points' in field_name.lower()), None)
+        story_points_field = self._field_id('story points')
         if story_points_field:
             try:
                 issue_dict[story_points_field] = float(ticket_dict['story_points'])
@@ -82,8 +89,7 @@ class JiraManager:
         
         # Add epic link if available
         if epic_key:
-            epic_link_field = next((field_id for field_name, field_id in self.available_fields.items() 
-                                  if 'epic link' in field_name.lower()), None)
+            epic_link_field = self._field_id('epic link')
             if epic_link_field:
                 try:
                     issue_dict[epic_link_field] = epic_key
@@ -91,6 +97,7 @@ class JiraManager:
                     print("Warning: Could not set epic link field")
             
         issue = self.jira.create_issue(fields=issue_dict)
+        self.metadata.note_issue(issue.key, 'Story')
         
         if sprint_id:
             try:
@@ -114,21 +121,27 @@ class JiraManager:
         except Exception as e:
             print(f"Warning: Could not add worklog to {issue_key} - {str(e)}")
 
-    def transition_issue(self, issue_key, to_status):
-        """Transition an issue to a new status"""
+    def transition_issue(self, issue_key, to_status, comment=None):
+        """Move an issue to a status along the workflow's shortest path, commenting with the last transition.
+
+        Intermediate statuses are passed through as the workflow requires. A
+        `to_status` that names no reachable status is matched against the
+        current transition names instead.
+        """
         try:
-            issue = self.jira.issue(issue_key)
-            transitions = self.jira.transitions(issue)
+            try:
+                for transition, last in self.planner.walk(issue_key, to_status):
+                    self.jira.transition_issue(issue_key, transition['id'], comment=comment if last else None)
+                    self.metadata.record_transition(issue_key, transition)
+                return
+            except LookupError:
+                pass
             
-            # Find the transition that matches our target status
-            transition_id = None
-            for t in transitions:
-                if to_status.lower() in t['name'].lower():
-                    transition_id = t['id']
-                    break
-                    
-            if transition_id:
-                self.jira.transition_issue(issue, transition_id)
+            transitions = self.metadata.transitions(issue_key)
+            transition = next((t for t in transitions if to_status.lower() in t['name'].lower()), None)
+            if transition:
+                self.jira.transition_issue(issue_key, transition['id'], comment=comment)
+                self.metadata.record_transition(issue_key, transition)
             else:
                 print(f"Warning: Could not find transition to {to_status} for {issue_key}")
                 
@@ -138,15 +151,15 @@ class JiraManager:
     def add_label(self, issue_key, label):
         """Add a label to an issue"""
         try:
-            issue = self.jira.issue(issue_key)
-            issue.fields.labels.append(label)
-            issue.update(fields={"labels": issue.fields.labels})
+            # The add verb appends server-side, so there's no need to read the current labels first
+            self.jira._session.put(
+                self.jira._get_url(f"issue/{issue_key}"),
+                data=json.dumps({'update': {'labels': [{'add': label}]}})
+            )
         except Exception as e:
             print(f"Warning: Could not add label to {issue_key} - {str(e)}")
 
     def _get_scrum_board_id(self):
-        """Get the first Scrum board ID for the project"""
-        boards = self.jira.boards(projectKeyOrID=self.project_key, type='scrum')
-        if not boards:
-            raise Exception(f"No Scrum boards found for project {self.project_key}")
-        return boards[0].id 
\ No newline at end of file
+        """The project's seeded Scrum board, else its first Scrum board (both cached)"""
+        return self.metadata.find_board(self.project_key, f"{self.project_key} Scrum Board") or \
+            self.metadata.board_id(self.project_key) 
\ No newline at end of file
@@ -0,0 +1,207 @@
+import asyncio
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from async_tasks import run_all
+from instrumentation import Instrumentation
+
+DEFAULT_MODEL = "claude-3-sonnet-20240229"
+
+
+def extract_json(content, opening='{', closing='}'):
+    """Strip markdown fences and surrounding prose from a JSON reply"""
+    content = content.strip()
+    if content.startswith('```json'):
+        content = content[7:-3]  # Remove ```json and ``` markers
+    elif not content.startswith(opening):
+        # Find the first opening and last closing bracket
+        start = content.find(opening)
+        end = content.rfind(closing) + 1
+        if start >= 0 and end > 0:
+            content = content[start:end]
+    return content.strip()
+
+
+def parse_json_list(content):
+    """Parse a JSON array reply, or None when the model didn't return one"""
+    try:
+        items = json.loads(extract_json(content, '[', ']'))
+    except ValueError:
+        return None
+    return items if isinstance(items, list) else None
+
+
+class ResponseCache:
+    """On-disk cache of parsed LLM results keyed by prompt, model and seed"""
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def key(self, prompt, model, seed):
+        raw = json.dumps([prompt, model, seed])
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], f"{key}.json")
+
+    def get(self, key):
+        if not self.directory:
+            return None
+        try:
+            with open(self._path(key)) as f:
+                return json.load(f)['value']
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def set(self, key, value):
+        if not self.directory:
+            return
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump({'value': value}, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Warning: Could not write LLM cache entry - {str(e)}")
+
+
+class ContentPipeline:
+    """Concurrent, cached Claude completions for ticket and sprint content.
+
+    Every call is keyed by (prompt, model, seed). The seed is the run seed plus a
+    per-item index, so distinct items get distinct cache entries while a rerun
+    with the same seed replays the same content without spending tokens.
+    """
+
+    def __init__(self, anthropic, model=DEFAULT_MODEL, concurrency=None, cache_dir=None, seed=None, instrumentation=None):
+        self.anthropic = anthropic
+        self.instrumentation = instrumentation or Instrumentation()
+        self.model = model
+        self.concurrency = concurrency or int(os.getenv('INPUT_LLM_CONCURRENCY', 4))
+        self.seed = seed if seed is not None else int(os.getenv('INPUT_SEED', 0))
+        self.cache = ResponseCache(cache_dir if cache_dir is not None else os.getenv('LLM_CACHE_DIR', '.llm_cache'))
+        self.counters = {}
+        self.lock = threading.Lock()
+        # Running totals; cached replies count as hits and cost nothing
+        self.usage = {'calls': 0, 'cache_hits': 0, 'input_tokens': 0, 'output_tokens': 0}
+
+    def next_index(self, name):
+        """Hand out 0, 1, 2, ... per name so repeated calls get distinct seeds"""
+        with self.lock:
+            index = self.counters.get(name, 0)
+            self.counters[name] = index + 1
+            return index
+
+    def _cached(self, prompt, index):
+        """(cache key, cached value or None) for one request"""
+        key = self.cache.key(prompt, self.model, [self.seed, index])
+        with self.instrumentation.call('llm', 'cache', request_bytes=len(prompt.encode('utf-8'))) as record:
+            cached = self.cache.get(key)
+            record['status'] = 'hit' if cached is not None else 'miss'
+        if cached is not None:
+            with self.lock:
+                self.usage['cache_hits'] += 1
+        return key, cached
+
+    def _record_message(self, record, message):
+        text = message.content[0].text
+        record['status'] = message.stop_reason
+        record['response_bytes'] = len(text.encode('utf-8'))
+        record['input_tokens'] = message.usage.input_tokens
+        record['output_tokens'] = message.usage.output_tokens
+        with self.lock:
+            self.usage['calls'] += 1
+            self.usage['input_tokens'] += message.usage.input_tokens
+            self.usage['output_tokens'] += message.usage.output_tokens
+        return text
+
+    def complete(self, prompt, max_tokens, parse=None, index=0):
+        """Return the parsed reply for `prompt`, from the cache when possible"""
+        key, cached = self._cached(prompt, index)
+        if cached is not None:
+            return cached
+
+        with self.instrumentation.call('llm', 'messages.create', model=self.model,
+                                       request_bytes=len(prompt.encode('utf-8'))) as record:
+            message = self.anthropic.messages.create(
+                max_tokens=max_tokens,
+                messages=[{
+                    "role": "user",
+                    "content": prompt
+                }],
+                model=self.model
+            )
+            text = self._record_message(record, message)
+        value = parse(text) if parse else text.strip()
+        self.cache.set(key, value)
+        return value
+
+    def map(self, requests):
+        """Run (prompt, max_tokens, parse, index) requests concurrently, preserving order.
+
+        A request that fails comes back as None, so the caller falls back to
+        Faker or template content for that item only.
+        """
+        if not requests:
+            return []
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = [executor.submit(self._complete_or_none, request) for request in requests]
+            return [future.result() for future in futures]
+
+    def _complete_or_none(self, request):
+        try:
+            return self.complete(*request)
+        except Exception as e:
+            print(f"Warning: Could not generate content, using fallback content - {str(e)}")
+            return None
+
+
+class AsyncContentPipeline(ContentPipeline):
+    """ContentPipeline on AsyncAnthropic: completions are coroutines on the caller's event loop.
+
+    Shares the cache layout, seeding and instrumentation of ContentPipeline, so
+    sync and async runs with the same seed replay each other's cached content.
+    Each completion is abandoned after INPUT_LLM_TIMEOUT seconds.
+    """
+
+    def __init__(self, anthropic, model=DEFAULT_MODEL, concurrency=None, cache_dir=None, seed=None,
+                 instrumentation=None, timeout=None):
+        super().__init__(anthropic, model, concurrency, cache_dir, seed, instrumentation)
+        self.timeout = timeout or float(os.getenv('INPUT_LLM_TIMEOUT', 120))
+
+    async def complete(self, prompt, max_tokens, parse=None, index=0):
+        """Return the parsed reply for `prompt`, from the cache when possible"""
+        key, cached = self._cached(prompt, index)
+        if cached is not None:
+            return cached
+
+        with self.instrumentation.call('llm', 'messages.create', model=self.model,
+                                       request_bytes=len(prompt.encode('utf-8'))) as record:
+            message = await asyncio.wait_for(self.anthropic.messages.create(
+                max_tokens=max_tokens,
+                messages=[{
+                    "role": "user",
+                    "content": prompt
+                }],
+                model=self.model
+            ), self.timeout)
+            text = self._record_message(record, message)
+        value = parse(text) if parse else text.strip()
+        self.cache.set(key, value)
+        return value
+
+    async def map(self, requests):
+        """Run (prompt, max_tokens, parse, index) requests concurrently, preserving order; failures come back as None"""
+        return await run_all([self._complete_or_none(request) for request in requests], limit=self.concurrency)
+
+    async def _complete_or_none(self, request):
+        try:
+            return await self.complete(*request)
+        except Exception as e:
+            print(f"Warning: Could not generate content, using fallback content - {str(e)}")
+            return None
@@ -1,19 +1,20 @@
+import argparse
 import os
 from dotenv import load_dotenv
-from ticket_generator import TicketGenerator
-from jira_manager import JiraManager
-from ticket_simulator import TicketSimulator
-import random
 import time
-from jira import JIRA
+from metadata_cache import get_metadata_cache
+from run_journal import RunJournal
+# jira, anthropic and faker are imported where they are first needed, so
+# `--dry-run` and short runs don't pay for loading them
 
 def create_scrum_board(jira, project_key):
-    # Check if board already exists
-    boards = jira.boards()
-    for board in boards:
-        if board.name == f"{project_key} Scrum Board":
-            print(f"Board {board.name} already exists with id {board.id}")
-            return board.id
+    # Check if board already exists (filtered server-side, cached across runs)
+    metadata = get_metadata_cache(jira)
+    board_name = f"{project_key} Scrum Board"
+    board_id = metadata.find_board(project_key, board_name)
+    if board_id:
+        print(f"Board {board_name} already exists with id {board_id}")
+        return board_id
 
     # Create JQL for the board filter
     jql = f"project = {project_key} ORDER BY Rank ASC"
@@ -33,9 +34,11 @@ def create_scrum_board(jira, project_key):
         
         # Create board using REST API
         board_config = {
-            'name': f"{project_key} Scrum Board",
+            'name': board_name,
             'type': 'scrum',
-            'filterId': new_filter.id
+            'filterId': new_filter.id,
+            # Without a location the board isn't found by project-filtered lookups
+            'location': {'type': 'project', 'projectKeyOrId': project_key}
         }
         
         # Use the REST API directly
@@ -45,6 +48,7 @@ def create_scrum_board(jira, project_key):
         if response.status_code == 201:
             new_board = response.json()
             print(f"Created new Scrum board: {new_board['name']} with id {new_board['id']}")
+            metadata.remember_board(project_key, board_name, new_board['id'])
             return new_board['id']
         else:
             print(f"Failed to create board. Status: {response.status_code}, Response: {response.text}")
@@ -54,7 +58,13 @@ def create_scrum_board(jira, project_key):
         print(f"Error creating board: {str(e)}")
         return None
 
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Seed a Jira project with sprints, tickets and simulated work")
+    parser.add_argument('--dry-run', '--plan', action='store_true', dest='dry_run',
+                        default=os.getenv('INPUT_DRY_RUN', 'false').lower() == 'true',
+                        help="check the configuration and show what would be created, without any network calls")
+    args = parser.parse_args(argv)
+
     # Load environment variables
     print("Loading environment variables...")
     load_dotenv(verbose=True)
@@ -70,8 +80,16 @@ def main():
     jira_api_token = os.getenv('JIRA_API_TOKEN')
     project_key = os.getenv('JIRA_PROJECT_KEY')
     
-    # Verify all required environment variables are present
-    if not all([jira_server, jira_email, jira_api_token, project_key]):
+    if args.dry_run:
+        from run_plan import dry_run
+        if not dry_run(project_key):
+            raise SystemExit(1)
+        return
+    
+    # Verify all required environment variables are present; the in-memory
+    # stand-in (JIRA_SERVER=memory://) needs no credentials
+    in_memory = bool(jira_server) and jira_server.startswith('memory://')
+    if not all([jira_server, project_key]) or not (in_memory or all([jira_email, jira_api_token])):
         print("\nError: Missing required environment variables.")
         print(f"JIRA_SERVER: {'✓' if jira_server else '✗'}")
         print(f"JIRA_EMAIL: {'✓' if jira_email else '✗'}")
@@ -81,36 +99,115 @@ def main():
     
     print(f"\nConnecting to Jira server: {jira_server}")
     
-    # Initialize Jira client
-    jira = JIRA(
-        server=jira_server,
-        basic_auth=(jira_email, jira_api_token)
-    )
+    # Initialize Jira client; every module shares its rate limiter and retries
+    from jira_client import create_jira_client
+    jira = create_jira_client(jira_server, jira_email, jira_api_token)
+    
+    # Every finished step is journaled; rerun with the same INPUT_RUN_ID to resume
+    journal = RunJournal.from_env()
+    if journal.resumed:
+        print(f"\nResuming run {journal.run_id}")
+    else:
+        print(f"\nStarting run {journal.run_id} (set INPUT_RUN_ID={journal.run_id} to resume it)")
+    
+    seed_project(jira, project_key, journal)
+    
+    journal.close()
+    get_metadata_cache(jira).flush()
+    jira.instrumentation.print_summary()
+    jira.http_pool.print_stats()
+    jira.instrumentation.close()
+
+def seed_project(jira, project_key, journal):
+    """Seed one project: board, team, epic, sprints, tickets and simulated work.
+
+    Returns a small report of what was done; fanout.py aggregates these across projects.
+    """
+    from dataset import Dataset
+    from seeding_pipeline import SeedingPipeline
+    from ticket_generator import TicketGenerator
+    from ticket_simulator import TicketSimulator
+    
+    started = time.monotonic()
+    report = {'project': project_key, 'status': 'failed', 'sprints': 0, 'tickets': 0, 'simulated': 0}
     
     # Create Scrum board first
-    board_id = create_scrum_board(jira, project_key)
+    board_id = journal.get('board', project_key)
     if not board_id:
-        print("Failed to create or find Scrum board. Exiting.")
-        return
+        board_id = create_scrum_board(jira, project_key)
+        if not board_id:
+            print("Failed to create or find Scrum board. Exiting.")
+            report['seconds'] = round(time.monotonic() - started, 2)
+            return report
+        journal.record('board', project_key, board_id)
 
+    # A dataset exported with `python dataset.py export` replaces content generation and planning
+    dataset = Dataset.from_env()
+    if dataset is not None:
+        print(f"\nImporting {len(dataset)} tickets from dataset {dataset.path}")
+    
+    # Set up the team first so tickets can be created already assigned
+    simulator = TicketSimulator(jira, [], journal, dataset=dataset)
+    
     # Generate tickets
-    ticket_generator = TicketGenerator(jira, project_key)
+    ticket_generator = TicketGenerator(jira, project_key, journal, team_members=simulator.team_members,
+                                       plan=simulator.plan, dataset=dataset)
     epic = ticket_generator.create_epic()
     
     if epic:
         # Create sprints first
         sprints = ticket_generator.create_sprints(board_id)
         
-        # Generate tickets and assign to sprints
-        tickets = ticket_generator.generate_tickets(epic.key, sprints)
-        
-        # Simulate work on tickets
-        simulator = TicketSimulator(jira, tickets)
-        simulator.simulate_work()
+        mode = os.getenv('INPUT_PIPELINE_MODE', 'batch').lower()
+        lifecycle = os.getenv('INPUT_SPRINT_LIFECYCLE', 'false').lower() == 'true'
+        if lifecycle and mode != 'batch':
+            print(f"Warning: INPUT_SPRINT_LIFECYCLE works sprint by sprint; ignoring INPUT_PIPELINE_MODE={mode}")
+            mode = 'batch'
+        if mode == 'async':
+            # One event loop drives content, creation and every ticket's simulation;
+            # imported here so the threaded modes don't need httpx
+            from async_seeding import run_async_seeding
+            print("\nGenerating and simulating tickets...")
+            stats = run_async_seeding(jira, ticket_generator, simulator, epic.key, sprints)
+            print(f"Async: {stats['created']} created, {stats['simulated']} simulated, "
+                  f"first simulated after {stats['first_simulated_after']}s")
+            report.update(tickets=stats['created'], simulated=stats['simulated'])
+            if stats['timed_out']:
+                report['seconds'] = round(time.monotonic() - started, 2)
+                return report
+        elif mode == 'streaming':
+            # Tickets flow through generation, creation, sprint assignment and
+            # simulation one by one instead of stage by stage
+            print("\nGenerating and simulating tickets...")
+            stats = SeedingPipeline(ticket_generator, simulator).run(epic.key, sprints)
+            print(f"Pipeline: {stats['created']} created, {stats['simulated']} simulated, "
+                  f"first simulated after {stats['first_simulated_after']}s")
+            report.update(tickets=stats['created'], simulated=stats['simulated'])
+        else:
+            # Generate tickets and assign to sprints
+            tickets = ticket_generator.generate_tickets(epic.key, sprints)
+            
+            if lifecycle:
+                # Start, work and complete each sprint in turn, carrying unfinished tickets over
+                from sprint_lifecycle import SprintLifecycle
+                print("\nRunning sprints...")
+                sprint_run = SprintLifecycle.from_env(jira, ticket_generator, simulator)
+                sprint_run.run(sprints)
+                sprint_run.print_report()
+            else:
+                # Simulate work on the generator's ticket store
+                simulator.tickets = ticket_generator.tickets
+                simulator.simulate_work()
+            report.update(tickets=len(tickets), simulated=ticket_generator.tickets.counts()['complete'])
         
+        ticket_generator.print_content_summary()
+        report.update(status='ok', epic=epic.key, sprints=len(sprints))
         print("\nSimulation completed successfully!")
     else:
         print("Failed to create epic. Simulation aborted.")
+    
+    report['seconds'] = round(time.monotonic() - started, 2)
+    return report
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,266 @@
+import json
+import os
+import threading
+import time
+
+_attach_lock = threading.Lock()
+_MISSING = object()
+
+# Seconds between writes of the cache file; flush() writes whatever is left
+SAVE_INTERVAL = 5
+
+
+def get_metadata_cache(jira):
+    """Return the metadata cache shared by every module using this client"""
+    with _attach_lock:
+        cache = getattr(jira, 'metadata', None)
+        if cache is None:
+            cache = MetadataCache(
+                jira,
+                ttl=float(os.getenv('JIRA_METADATA_TTL', 86400)),
+                path=os.getenv('JIRA_METADATA_CACHE')
+            )
+            jira.metadata = cache
+        return cache
+
+
+class MetadataCache:
+    """TTL cache for field IDs, transition graphs and board IDs.
+
+    Entries are keyed by name and expire after `ttl` seconds. When `path` is set the
+    entries are saved to a JSON file, grouped by server, so later runs against the
+    same instance start warm. Only shared metadata is saved: per-issue state
+    (issue_states) lives in memory for the run, and changes are written at most
+    every SAVE_INTERVAL seconds plus once more on flush(), not on every update.
+    """
+
+    def __init__(self, jira, ttl=86400, path=None):
+        self.jira = jira
+        self.ttl = ttl
+        self.path = path
+        self.server = getattr(jira, 'server_url', '')
+        self.lock = threading.RLock()
+        self.key_locks = {}
+        self.entries = self._load()
+        self.dirty = False
+        self.saved_at = time.monotonic()
+        # Last known (issue type, status) per issue key; only valid for this run, never saved
+        self.issue_states = {}
+        # Field names this run found no field for; never saved
+        self.missing_fields = set()
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path) as f:
+                return json.load(f).get(self.server, {})
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not read metadata cache {self.path} - {str(e)}")
+            return {}
+
+    def _save(self):
+        """Note that the entries changed, writing them if the last write was a while ago"""
+        if not self.path:
+            return
+        self.dirty = True
+        if time.monotonic() - self.saved_at >= SAVE_INTERVAL:
+            self.flush()
+
+    def flush(self):
+        """Write pending changes to the cache file"""
+        with self.lock:
+            if not self.path or not self.dirty:
+                return
+            self.dirty = False
+            self.saved_at = time.monotonic()
+            try:
+                data = {}
+                if os.path.exists(self.path):
+                    with open(self.path) as f:
+                        data = json.load(f)
+                data[self.server] = self.entries
+                tmp_path = f"{self.path}.tmp"
+                with open(tmp_path, 'w') as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, self.path)
+            except (OSError, ValueError) as e:
+                print(f"Warning: Could not write metadata cache {self.path} - {str(e)}")
+
+    def get(self, key, loader):
+        """Return the cached value for `key`, calling `loader` when missing or expired"""
+        with self.lock:
+            value = self._fresh(key)
+            if value is not _MISSING:
+                return value
+            key_lock = self.key_locks.setdefault(key, threading.Lock())
+
+        # One loader per key; other keys keep flowing while this one is fetched
+        with key_lock:
+            with self.lock:
+                value = self._fresh(key)
+            if value is not _MISSING:
+                return value
+            value = loader()
+            with self.lock:
+                self.entries[key] = {'value': value, 'expires': time.time() + self.ttl}
+                self._save()
+            return value
+
+    def _fresh(self, key):
+        entry = self.entries.get(key)
+        if entry and entry['expires'] > time.time():
+            return entry['value']
+        return _MISSING
+
+    def set(self, key, value):
+        """Store a value we learned as a side effect, e.g. the ID of something we just created"""
+        with self.lock:
+            self.entries[key] = {'value': value, 'expires': time.time() + self.ttl}
+            self._save()
+
+    def invalidate(self, key):
+        with self.lock:
+            if self.entries.pop(key, None) is not None:
+                self._save()
+
+    def fields(self):
+        """Map of lower-cased field name to field ID"""
+        return self.get('fields', lambda: {field['name'].lower(): field['id'] for field in self.jira.fields()})
+
+    def field_id(self, name):
+        """Resolve a field ID by exact name, falling back to a substring match.
+
+        Misses are only remembered for this run and drop the cached field list,
+        so a field created later is found by the next run.
+        """
+        name = name.lower()
+        key = f"field:{name}"
+        with self.lock:
+            if name in self.missing_fields:
+                return None
+
+        def resolve():
+            fields = self.fields()
+            if name in fields:
+                return fields[name]
+            return next((field_id for field_name, field_id in fields.items() if name in field_name), None)
+
+        field_id = self.get(key, resolve)
+        if field_id is None:
+            with self.lock:
+                self.missing_fields.add(name)
+            self.invalidate(key)
+            self.invalidate('fields')
+        return field_id
+
+    def board_id(self, project_key):
+        """First Scrum board ID for the project"""
+        def resolve():
+            boards = self.jira.boards(projectKeyOrID=project_key, type='scrum')
+            if not boards:
+                raise Exception(f"No Scrum boards found for project {project_key}")
+            return boards[0].id
+
+        return self.get(f"board:{project_key}", resolve)
+
+    def find_board(self, project_key, name):
+        """ID of the project's board called `name`, or None.
+
+        Looked up with server-side project and name filters, so the cost doesn't
+        grow with the number of boards on the instance. Hits are cached (and
+        persisted with the rest of the cache); misses are not, so a board created
+        later is still found.
+        """
+        key = f"board:{project_key}:{name}"
+
+        def resolve():
+            # Boards created without a location aren't indexed under the project; fall back to the name alone
+            for filters in ({'projectKeyOrID': project_key}, {}):
+                for board in self.jira.boards(name=name, **filters):
+                    if board.name == name:
+                        return board.id
+            return None
+
+        board_id = self.get(key, resolve)
+        if board_id is None:
+            self.invalidate(key)
+        return board_id
+
+    def remember_board(self, project_key, name, board_id):
+        self.set(f"board:{project_key}:{name}", board_id)
+
+    def note_issue(self, issue_key, issue_type, status=None):
+        """Record what we already know about an issue so transitions() can skip a GET"""
+        with self.lock:
+            self.issue_states[issue_key] = (issue_type, status)
+
+    def issue_state(self, issue_key):
+        """(issue type, status) of an issue: from what this run already knows, else one GET"""
+        project = issue_key.rsplit('-', 1)[0]
+        with self.lock:
+            issue_type, status = self.issue_states.get(issue_key, (None, None))
+            is_new = issue_type is not None and status is None
+            if is_new:
+                initial_status = self._fresh(f"initial_status:{project}:{issue_type}")
+                status = None if initial_status is _MISSING else initial_status
+
+        if issue_type is None or status is None:
+            issue = self.jira.issue(issue_key, fields='issuetype,status')
+            issue_type, status = issue.fields.issuetype.name, issue.fields.status.name
+            if is_new:
+                self.get(f"initial_status:{project}:{issue_type}", lambda: status)
+            self.note_issue(issue_key, issue_type, status)
+        return issue_type, status
+
+    def known_transitions(self, project, issue_type, status):
+        """Cached transitions out of a status for an issue type, or None if not discovered yet (never fetches)"""
+        with self.lock:
+            transitions = self._fresh(f"transitions:{project}:{issue_type}:{status}")
+        return None if transitions is _MISSING else transitions
+
+    def statuses(self, project, issue_type):
+        """Names of the statuses in an issue type's workflow, or None when the project doesn't list them.
+
+        One GET per project, read from the project's status list rather than by
+        moving an issue around its workflow. A failed read isn't cached.
+        """
+        def resolve():
+            try:
+                listed = self.jira._get_json(f"project/{project}/statuses")
+            except Exception as e:
+                print(f"Warning: Could not read the statuses of project {project} - {str(e)}")
+                return None
+            return {entry['name']: [status['name'] for status in entry.get('statuses', [])] for entry in listed}
+
+        key = f"statuses:{project}"
+        workflows = self.get(key, resolve)
+        if workflows is None:
+            self.invalidate(key)
+            return None
+        return workflows.get(issue_type)
+
+    def transitions(self, issue_key):
+        """Transitions available to the issue in its current status.
+
+        The transition graph is cached per project, issue type and status, so only the
+        first issue of each type in each status costs a request.
+        """
+        project = issue_key.rsplit('-', 1)[0]
+        issue_type, status = self.issue_state(issue_key)
+        return self.get(
+            f"transitions:{project}:{issue_type}:{status}",
+            lambda: [
+                {'id': t['id'], 'name': t['name'], 'to': t.get('to', {}).get('name')}
+                for t in self.jira.transitions(issue_key)
+            ]
+        )
+
+    def record_transition(self, issue_key, transition):
+        """Move the cached status along after a transition has been applied"""
+        with self.lock:
+            issue_type, _ = self.issue_states.get(issue_key, (None, None))
+            if issue_type is not None and transition.get('to'):
+                self.issue_states[issue_key] = (issue_type, transition['to'])
+            else:
+                self.issue_states.pop(issue_key, None)
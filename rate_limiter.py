@@ -0,0 +1,55 @@
+import asyncio
+import threading
+import time
+
+
+class RateLimiter:
+    """Thread-safe token bucket shared by everything that talks to Jira"""
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else max(1, rate))
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def _take(self, tokens):
+        """Take `tokens` if available and return 0, else return how long to wait for them"""
+        with self.lock:
+            self._refill()
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return 0
+            return (tokens - self.tokens) / self.rate
+
+    def acquire(self, tokens=1):
+        """Block until `tokens` tokens are available, then take them"""
+        if self.rate <= 0:
+            return
+        while True:
+            wait = self._take(tokens)
+            if not wait:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens=1):
+        """acquire for coroutines: waiting yields to the event loop instead of blocking it"""
+        if self.rate <= 0:
+            return
+        while True:
+            wait = self._take(tokens)
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+
+    def set_rate(self, rate):
+        """Change the refill rate, keeping tokens already earned at the old rate"""
+        with self.lock:
+            self._refill()
+            self.rate = float(rate)
+
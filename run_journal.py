@@ -0,0 +1,77 @@
+import json
+import os
+import threading
+import uuid
+from datetime import datetime
+
+
+class RunJournal:
+    """Append-only JSONL record of completed seeding steps.
+
+    Each line is one finished step: {"step": ..., "key": ..., "data": ...}. Reopening
+    the journal with the same run ID replays those lines, so a rerun can skip work
+    that already happened and carry on from the first incomplete step. Steps are
+    recorded after the Jira call succeeds, so a crash between the two can repeat
+    that single step on resume but never skips one.
+
+    A journal without a run ID keeps its entries in memory only.
+    """
+
+    def __init__(self, run_id=None, directory=None):
+        self.run_id = run_id
+        self.lock = threading.Lock()
+        self.entries = {}
+        self.path = None
+        self.file = None
+        if run_id:
+            directory = directory or os.getenv('INPUT_RUN_DIR', '.runs')
+            os.makedirs(directory, exist_ok=True)
+            self.path = os.path.join(directory, f"{run_id}.jsonl")
+            self._replay()
+            self.file = open(self.path, 'a')
+
+    @classmethod
+    def from_env(cls):
+        """Open the journal named by INPUT_RUN_ID, or start a new run with a fresh ID"""
+        run_id = os.getenv('INPUT_RUN_ID') or f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        return cls(run_id)
+
+    def _replay(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path) as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A torn final line from a crash mid-write; everything before it is intact
+                    continue
+                self.entries[(entry['step'], entry['key'])] = entry.get('data')
+
+    @property
+    def resumed(self):
+        return bool(self.entries)
+
+    def get(self, step, key=''):
+        """Data recorded for a finished step, or None if it hasn't finished"""
+        with self.lock:
+            return self.entries.get((step, str(key)))
+
+    def done(self, step, key=''):
+        with self.lock:
+            return (step, str(key)) in self.entries
+
+    def record(self, step, key='', data=True):
+        """Mark a step finished; `data` is what a resumed run needs to carry on without it"""
+        key = str(key)
+        with self.lock:
+            self.entries[(step, key)] = data
+            if self.file:
+                self.file.write(json.dumps({'step': step, 'key': key, 'data': data}) + '\n')
+                self.file.flush()
+
+    def close(self):
+        with self.lock:
+            if self.file:
+                self.file.close()
+                self.file = None
@@ -0,0 +1,143 @@
+"""Offline checks and a preview of what a run would do, for `main.py --dry-run`.
+
+Nothing here imports the Jira, Anthropic or Faker packages or opens a
+connection, so checking a configuration takes a fraction of a second.
+"""
+import importlib.util
+import math
+import os
+import time
+from datetime import timedelta
+
+from simulation_plan import SimulationPlan, planned_ticket_count, tickets_per_sprint
+from team_roster import team_structure_from_env
+
+# INPUT_* settings that must parse as numbers, with their defaults
+INTEGER_SETTINGS = {
+    'INPUT_NUM_SPRINTS': 2,
+    'INPUT_TICKETS_PER_SPRINT': 5,
+    'INPUT_INCOMPLETE_TICKETS_PER_SPRINT': 1,
+    'INPUT_SPRINT_LENGTH_DAYS': 14,
+    'INPUT_SIMULATION_CONCURRENCY': 4,
+    'INPUT_SEED': 0,
+    'INPUT_BLOCK_CHANCE': 30,
+    'INPUT_LLM_BATCH_SIZE': 5,
+    'INPUT_LLM_CONCURRENCY': 4,
+    'INPUT_MAX_RETRIES': 5,
+    'INPUT_ASYNC_CONCURRENCY': 100,
+    'INPUT_LLM_TOKEN_BUDGET': 20000,
+    'INPUT_VARIANTS_PER_SEED': 10,
+    'INPUT_NUM_DEVELOPERS': 4,
+    'INPUT_NUM_QA': 2,
+    'INPUT_NUM_TECH_LEADS': 1,
+    'INPUT_NUM_PRODUCT_OWNERS': 1,
+    'INPUT_NUM_SCRUM_MASTERS': 1
+}
+FLOAT_SETTINGS = {
+    'INPUT_REQUESTS_PER_SECOND': 10,
+    'INPUT_TIME_SCALE': 0,
+    'INPUT_ASYNC_TIMEOUT': 0,
+    'INPUT_LLM_LATENCY_BUDGET': 0
+}
+CHOICE_SETTINGS = {
+    'INPUT_PIPELINE_MODE': ('batch', ('batch', 'streaming', 'async')),
+    'INPUT_CONTENT_SOURCE': ('faker', ('faker', 'template', 'hybrid', 'llm')),
+    'INPUT_BULK_CREATE': ('true', ('true', 'false')),
+    'INPUT_BACKDATE': ('false', ('true', 'false')),
+    'INPUT_SPRINT_LIFECYCLE': ('false', ('true', 'false'))
+}
+
+
+def config_errors():
+    """Problems with the current environment's configuration, as messages"""
+    errors = []
+    jira_server = os.getenv('JIRA_SERVER')
+    in_memory = bool(jira_server) and jira_server.startswith('memory://')
+    required = ['JIRA_SERVER', 'JIRA_PROJECT_KEY'] + ([] if in_memory else ['JIRA_EMAIL', 'JIRA_API_TOKEN'])
+    errors += [f"{name} is not set" for name in required if not os.getenv(name)]
+
+    for name, parse, settings in [('an integer', int, INTEGER_SETTINGS), ('a number', float, FLOAT_SETTINGS)]:
+        for key, default in settings.items():
+            try:
+                if parse(os.getenv(key, default)) < 0:
+                    errors.append(f"{key} must not be negative")
+            except ValueError:
+                errors.append(f"{key} must be {name}, got {os.getenv(key)!r}")
+    for key, (default, choices) in CHOICE_SETTINGS.items():
+        value = os.getenv(key, default).lower()
+        if value not in choices:
+            errors.append(f"{key} must be one of {', '.join(choices)}, got {value!r}")
+
+    source = os.getenv('INPUT_CONTENT_SOURCE', 'faker').lower()
+    if source in ('llm', 'hybrid') and not os.getenv('CLAUDE_API_KEY'):
+        errors.append(f"CLAUDE_API_KEY is not set (needed for INPUT_CONTENT_SOURCE={source})")
+    if os.getenv('INPUT_PIPELINE_MODE', 'batch').lower() == 'async' and importlib.util.find_spec('httpx') is None:
+        errors.append("INPUT_PIPELINE_MODE=async needs httpx (pip install httpx)")
+    if os.getenv('INPUT_TEMPLATE_PACK'):
+        from content_engine import load_template_pack, merge_template_pack
+        try:
+            merge_template_pack(load_template_pack(os.getenv('INPUT_TEMPLATE_PACK')))
+        except (OSError, ValueError) as e:
+            errors.append(f"INPUT_TEMPLATE_PACK: {str(e)}")
+    if os.getenv('INPUT_DATASET'):
+        from dataset import Dataset
+        try:
+            Dataset(os.getenv('INPUT_DATASET')).close()
+        except (OSError, ValueError) as e:
+            errors.append(f"INPUT_DATASET: {str(e)}")
+    return errors
+
+
+def estimated_requests(num_sprints, per_sprint, team_size):
+    """Rough Jira request count for a fresh run: setup, bulk creation, sprint moves and two transitions per ticket"""
+    tickets = num_sprints * per_sprint
+    setup = 1 + 2 + 2 * team_size + 1 + 1 + num_sprints  # board lookup, filter and board, users, epic, fields, sprints
+    creation = math.ceil(tickets / 50) + num_sprints * math.ceil(per_sprint / 50)
+    return setup + creation + 2 * tickets + 3  # plus the first transition lookup per issue type
+
+
+def describe_plan(project_key):
+    """Print what a run with this configuration would create, without sending a request"""
+    structure = team_structure_from_env()
+    team_size = sum(count for _, count in structure)
+    num_sprints = int(os.getenv('INPUT_NUM_SPRINTS', 2))
+    per_sprint = tickets_per_sprint()
+
+    started = time.perf_counter()
+    plan = SimulationPlan.from_env(max(1, team_size))
+    tickets = planned_ticket_count()
+    blocked = sum(plan.blocked)
+    hours = sum(plan.worklog_seconds) / 3600
+
+    print(f"\nDry run for project {project_key} on {os.getenv('JIRA_SERVER')}: no requests will be sent")
+    print(f"  Sprints: {num_sprints} x {plan.sprint_length.days} days, "
+          f"{plan.origin:%Y-%m-%d} to {(plan.origin + num_sprints * plan.sprint_length - timedelta(days=1)):%Y-%m-%d}"
+          f"{' (backdated)' if plan.backdate else ''}")
+    print(f"  Tickets: {tickets} ({per_sprint} per sprint, "
+          f"{os.getenv('INPUT_INCOMPLETE_TICKETS_PER_SPRINT', 1)} of them incomplete)")
+    print(f"  Team: {team_size} members ({', '.join(f'{count} {role}' for role, count in structure if count)})")
+    print(f"  Content: {os.getenv('INPUT_CONTENT_SOURCE', 'faker').lower()}, "
+          f"pipeline: {os.getenv('INPUT_PIPELINE_MODE', 'batch').lower()}, seed: {plan.seed}")
+    print(f"  Simulation: {blocked} tickets blocked on the way, {hours:.1f} hours of work logged "
+          f"(planned in {time.perf_counter() - started:.3f}s)")
+    print(f"  Jira requests: about {estimated_requests(num_sprints, per_sprint, team_size)} on a fresh run")
+    return {
+        'project': project_key,
+        'sprints': num_sprints,
+        'tickets': tickets,
+        'team_size': team_size,
+        'blocked': blocked,
+        'worklog_hours': round(hours, 1)
+    }
+
+
+def dry_run(project_key):
+    """Validate the configuration and describe the run; returns whether it is valid"""
+    errors = config_errors()
+    if errors:
+        print("\nConfiguration problems:")
+        for error in errors:
+            print(f"  - {error}")
+        return False
+    describe_plan(project_key)
+    return True
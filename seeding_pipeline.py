@@ -0,0 +1,166 @@
+import os
+import queue
+import threading
+import time
+
+from ticket_generator import BULK_CREATE_LIMIT
+
+_DONE = object()
+
+# How often a stage blocked on a queue checks whether another stage has failed
+POLL_SECONDS = 0.5
+
+
+class SeedingPipeline:
+    """Streaming seeding: content generation -> issue creation -> sprint assignment -> simulation.
+
+    Stages run on their own threads and hand tickets along bounded queues, so the
+    first ticket is being simulated while later ones are still being written and
+    memory stays flat however many tickets are requested. Creation and sprint
+    assignment take small batches off their queue to keep the bulk endpoints in use
+    without holding tickets back. If a stage fails, the others stop waiting on
+    their queues and `run` raises the error; the journal lets a rerun resume.
+    """
+
+    def __init__(self, generator, simulator, queue_size=None, batch_size=None, flush_seconds=0.5, workers=None):
+        self.generator = generator
+        self.simulator = simulator
+        queue_size = queue_size or int(os.getenv('INPUT_PIPELINE_QUEUE_SIZE', 100))
+        self.batch_size = min(BULK_CREATE_LIMIT, batch_size or int(os.getenv('INPUT_PIPELINE_BATCH_SIZE', 10)))
+        self.flush_seconds = flush_seconds
+        self.workers = workers or max(1, int(os.getenv('INPUT_SIMULATION_CONCURRENCY', 4)))
+        self.create_queue = queue.Queue(maxsize=queue_size)
+        self.assign_queue = queue.Queue(maxsize=queue_size)
+        self.simulate_queue = queue.Queue(maxsize=queue_size)
+        self.lock = threading.Lock()
+        self.failed = threading.Event()
+        self.errors = []
+        self.stats = {'generated': 0, 'created': 0, 'simulated': 0, 'first_simulated_after': None}
+
+    def run(self, epic_key, sprints):
+        """Seed and simulate every sprint's tickets; returns the stage counters"""
+        self.started = time.monotonic()
+        threads = [
+            threading.Thread(target=self._produce, args=(epic_key, sprints), name='pipeline-generate'),
+            threading.Thread(target=self._create, name='pipeline-create'),
+            threading.Thread(target=self._assign, name='pipeline-assign')
+        ]
+        threads += [
+            threading.Thread(target=self._simulate, name=f'pipeline-simulate-{i}')
+            for i in range(self.workers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if self.errors:
+            raise self.errors[0]
+        return dict(self.stats)
+
+    def _fail(self, error):
+        with self.lock:
+            self.errors.append(error)
+        self.failed.set()
+
+    def _put(self, target, item):
+        """Put `item` on a bounded queue; False if a stage failed while waiting for room"""
+        while not self.failed.is_set():
+            try:
+                target.put(item, timeout=POLL_SECONDS)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _get(self, source, timeout=None):
+        """Next item from `source`, _DONE once a stage has failed; raises queue.Empty after `timeout`"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.failed.is_set():
+            wait = POLL_SECONDS if deadline is None else min(POLL_SECONDS, deadline - time.monotonic())
+            if wait <= 0:
+                raise queue.Empty
+            try:
+                return source.get(timeout=wait)
+            except queue.Empty:
+                pass
+        return _DONE
+
+    def _count(self, name, amount=1):
+        with self.lock:
+            self.stats[name] += amount
+
+    def _take_batch(self, source):
+        """Block for one item, then gather more until the batch is full or the flush window passes"""
+        item = self._get(source)
+        if item is _DONE:
+            return [], True
+        batch = [item]
+        deadline = time.monotonic() + self.flush_seconds
+        while len(batch) < self.batch_size:
+            try:
+                item = self._get(source, timeout=max(0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+            if item is _DONE:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _produce(self, epic_key, sprints):
+        try:
+            for payload in self.generator.iter_ticket_payloads(epic_key, sprints):
+                if not self._put(self.create_queue, payload):
+                    return
+                self._count('generated')
+        except Exception as e:
+            print(f"Error generating ticket content: {str(e)}")
+        finally:
+            self._put(self.create_queue, _DONE)
+
+    def _create(self):
+        try:
+            done = False
+            while not done:
+                batch, done = self._take_batch(self.create_queue)
+                if batch:
+                    created = self.generator.create_ticket_batch(batch)
+                    self._count('created', len(created))
+                    for pair in created:
+                        self._put(self.assign_queue, pair)
+        except Exception as e:
+            print(f"Error creating tickets: {str(e)}")
+            self._fail(e)
+        finally:
+            self._put(self.assign_queue, _DONE)
+
+    def _assign(self):
+        try:
+            done = False
+            while not done:
+                batch, done = self._take_batch(self.assign_queue)
+                if batch:
+                    self.generator.assign_to_sprints(batch)
+                    for _, ticket in batch:
+                        self._put(self.simulate_queue, ticket)
+        except Exception as e:
+            print(f"Error assigning tickets to sprints: {str(e)}")
+            self._fail(e)
+        finally:
+            for _ in range(self.workers):
+                self._put(self.simulate_queue, _DONE)
+
+    def _simulate(self):
+        while True:
+            ticket = self._get(self.simulate_queue)
+            if ticket is _DONE:
+                return
+            try:
+                self.simulator.simulate_ticket(ticket)
+            except Exception as e:
+                print(f"Error simulating work on {ticket.key}: {str(e)}")
+                self._fail(e)
+                return
+            with self.lock:
+                self.stats['simulated'] += 1
+                if self.stats['first_simulated_after'] is None:
+                    self.stats['first_simulated_after'] = round(time.monotonic() - self.started, 3)
@@ -0,0 +1,221 @@
+"""Seeded, precomputed simulation timeline.
+
+Every random decision the simulation makes (who is assigned, how long the work
+took, which comment is posted, whether a ticket gets blocked and who reviews it)
+is drawn up front from INPUT_SEED and the INPUT_* sizes, before any request is
+sent. The executor (TicketSimulator) only replays the plan, so the same seed and
+config produce the same run whatever order the worker threads finish in.
+
+The plan also places every ticket on a simulated clock: when work on it
+started and when it was done, within its sprint. With INPUT_BACKDATE=true the
+sprints end today instead of starting today, worklogs carry their simulated
+`started` time and transitions are replayed in simulated-time order, so a year
+of sprint history takes minutes rather than a year.
+
+Plans are stored column-wise in arrays, so 100k tickets plan in well under a
+second and take a few hundred KB. Dump one to diffable JSON lines with:
+
+    python simulation_plan.py --tickets 100000 --team-size 9 --seed 7 --output plan.jsonl
+"""
+import argparse
+import json
+import os
+import random
+import time
+from array import array
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+
+# Statuses every ticket is moved through, in order
+STATUS_ORDER = ('In Progress', 'Done')
+# Number of canned comments per status in TicketSimulator._get_status_comment
+COMMENT_CHOICES = 3
+
+# Jira's worklog timestamp format
+WORKLOG_TIME_FORMAT = '%Y-%m-%dT%H:%M:%S.000%z'
+
+PlannedTicket = namedtuple('PlannedTicket', 'slot assignee worklog_seconds comments blocked follow_ups started done')
+
+
+def tickets_per_sprint():
+    """Tickets the generator creates in each sprint, incomplete ones included"""
+    return int(os.getenv('INPUT_TICKETS_PER_SPRINT', 5)) + int(os.getenv('INPUT_INCOMPLETE_TICKETS_PER_SPRINT', 1))
+
+
+def planned_ticket_count():
+    """Tickets a run with the current INPUT_* config will create"""
+    return int(os.getenv('INPUT_NUM_SPRINTS', 2)) * tickets_per_sprint()
+
+
+def history_origin(num_sprints, sprint_length_days, backdate):
+    """Start of the first sprint: now, or far enough back that the last sprint ends today"""
+    now = datetime.now(timezone.utc)
+    if not backdate:
+        return now
+    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    return midnight - timedelta(days=num_sprints * sprint_length_days)
+
+
+class SimulationPlan:
+    """Per-ticket simulation decisions, indexed by the ticket's creation slot.
+
+    Slot n is the n-th ticket the generator creates. Columns:
+    assignee - index into the team roster
+    worklog_seconds - time logged with the first transition
+    comments - per status in STATUS_ORDER, which canned status comment is posted
+    blocked - whether the In Progress follow-up is a blocker rather than a review request
+    follow_ups - per status, index of the blocker/reviewer among the other team members
+    start_offset, done_offset - seconds into the ticket's sprint when work started and finished
+    """
+
+    def __init__(self, seed, tickets, team_size, block_chance=30, per_sprint=None, sprint_length_days=14,
+                 origin=None, backdate=False, columns=None):
+        self.seed = seed
+        self.tickets = tickets
+        self.team_size = max(1, team_size)
+        self.block_chance = block_chance
+        self.per_sprint = max(1, per_sprint or tickets or 1)
+        self.sprint_length = timedelta(days=sprint_length_days)
+        self.origin = origin or datetime.now(timezone.utc)
+        self.backdate = backdate
+        if columns is None:
+            self._build()
+        else:
+            self._restore(columns)
+
+    @classmethod
+    def from_env(cls, team_size, tickets=None, origin=None):
+        num_sprints = int(os.getenv('INPUT_NUM_SPRINTS', 2))
+        sprint_length_days = int(os.getenv('INPUT_SPRINT_LENGTH_DAYS', 14))
+        backdate = os.getenv('INPUT_BACKDATE', 'false').lower() == 'true'
+        return cls(
+            seed=int(os.getenv('INPUT_SEED', 0)),
+            tickets=planned_ticket_count() if tickets is None else tickets,
+            team_size=team_size,
+            block_chance=int(os.getenv('INPUT_BLOCK_CHANCE', 30)),
+            per_sprint=tickets_per_sprint(),
+            sprint_length_days=sprint_length_days,
+            origin=origin or history_origin(num_sprints, sprint_length_days, backdate),
+            backdate=backdate
+        )
+
+    def _build(self):
+        # Seeded from the config as well as the seed, so changing either gives a different plan
+        rng = random.Random(f"{self.seed}:{self.team_size}:{self.block_chance}")
+        draw = rng.random
+        count = range(self.tickets)
+        team = self.team_size
+        others = max(1, team - 1)
+        chance = self.block_chance / 100
+
+        self.assignee = array('H', [int(draw() * team) for _ in count])
+        self.worklog_seconds = array('I', [3600 + int(draw() * 25201) for _ in count])  # 1-8 hours
+        self.comments = [array('B', [int(draw() * COMMENT_CHOICES) for _ in count]) for _ in STATUS_ORDER]
+        self.blocked = array('B', [draw() < chance for _ in count])
+        self.follow_ups = [array('H', [int(draw() * others) for _ in count]) for _ in STATUS_ORDER]
+
+        # Work starts in the first 70% of the sprint and finishes after the logged time
+        # plus up to 30% of the sprint in review, never past the sprint's last hour
+        sprint_seconds = int(self.sprint_length.total_seconds())
+        latest = max(0, sprint_seconds - 3600)
+        self.start_offset = array('I', [min(latest, int(draw() * sprint_seconds * 0.7)) for _ in count])
+        self.done_offset = array('I', [
+            min(latest, start + worklog + int(draw() * sprint_seconds * 0.3))
+            for start, worklog in zip(self.start_offset, self.worklog_seconds)
+        ])
+
+    def columns(self, slot):
+        """The slot's raw plan values, to save it and rebuild the plan later with `columns=`"""
+        return {
+            'assignee': self.assignee[slot],
+            'worklog_seconds': self.worklog_seconds[slot],
+            'comments': [column[slot] for column in self.comments],
+            'blocked': self.blocked[slot],
+            'follow_ups': [column[slot] for column in self.follow_ups],
+            'start_offset': self.start_offset[slot],
+            'done_offset': self.done_offset[slot]
+        }
+
+    def _restore(self, rows):
+        """Take every column from saved per-slot rows instead of drawing them"""
+        self.tickets = len(rows)
+        self.assignee = array('H', [row['assignee'] for row in rows])
+        self.worklog_seconds = array('I', [row['worklog_seconds'] for row in rows])
+        self.comments = [array('B', [row['comments'][i] for row in rows]) for i in range(len(STATUS_ORDER))]
+        self.blocked = array('B', [row['blocked'] for row in rows])
+        self.follow_ups = [array('H', [row['follow_ups'][i] for row in rows]) for i in range(len(STATUS_ORDER))]
+        self.start_offset = array('I', [row['start_offset'] for row in rows])
+        self.done_offset = array('I', [row['done_offset'] for row in rows])
+
+    def settings(self):
+        """Constructor arguments other than the origin, as plain data"""
+        return {'seed': self.seed, 'tickets': self.tickets, 'team_size': self.team_size,
+                'block_chance': self.block_chance, 'per_sprint': self.per_sprint,
+                'sprint_length_days': self.sprint_length.days, 'backdate': self.backdate}
+
+    def __len__(self):
+        return self.tickets
+
+    def sprint_start(self, index):
+        return self.origin + index * self.sprint_length
+
+    def ticket(self, slot):
+        slot %= max(1, self.tickets)
+        sprint_start = self.sprint_start(slot // self.per_sprint)
+        return PlannedTicket(
+            slot=slot,
+            assignee=self.assignee[slot],
+            worklog_seconds=self.worklog_seconds[slot],
+            comments=tuple(column[slot] for column in self.comments),
+            blocked=bool(self.blocked[slot]),
+            follow_ups=tuple(column[slot] for column in self.follow_ups),
+            started=sprint_start + timedelta(seconds=self.start_offset[slot]),
+            done=sprint_start + timedelta(seconds=self.done_offset[slot])
+        )
+
+    def events(self, slot):
+        """The ticket's timeline as plain data, in the order the executor replays it"""
+        planned = self.ticket(slot)
+        events = [{'event': 'assign', 'member': planned.assignee},
+                  {'event': 'worklog', 'seconds': planned.worklog_seconds, 'at': self.start_offset[planned.slot]}]
+        for index, status in enumerate(STATUS_ORDER):
+            follow_up = 'blocked' if status == 'In Progress' and planned.blocked else 'review'
+            at = self.start_offset[planned.slot] if index == 0 else self.done_offset[planned.slot]
+            events.append({'event': 'transition', 'to': status, 'at': at, 'comment': planned.comments[index],
+                           'follow_up': follow_up, 'member': planned.follow_ups[index]})
+        return events
+
+    def status_time(self, planned, status):
+        """Simulated time the ticket moves to `status`"""
+        return planned.started if status == STATUS_ORDER[0] else planned.done
+
+    def dump(self, path):
+        """Write the plan as one JSON line per ticket, so two plans can be diffed"""
+        with open(path, 'w') as f:
+            f.write(json.dumps(self.settings()) + '\n')
+            for slot in range(self.tickets):
+                f.write(json.dumps({'slot': slot, 'events': self.events(slot)}) + '\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Plan a simulation without touching Jira")
+    parser.add_argument('--tickets', type=int, default=planned_ticket_count())
+    parser.add_argument('--team-size', type=int, default=9)
+    parser.add_argument('--seed', type=int, default=int(os.getenv('INPUT_SEED', 0)))
+    parser.add_argument('--block-chance', type=int, default=int(os.getenv('INPUT_BLOCK_CHANCE', 30)))
+    parser.add_argument('--per-sprint', type=int, default=tickets_per_sprint())
+    parser.add_argument('--sprint-length-days', type=int, default=int(os.getenv('INPUT_SPRINT_LENGTH_DAYS', 14)))
+    parser.add_argument('--output', help="write the plan as JSON lines")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    plan = SimulationPlan(args.seed, args.tickets, args.team_size, args.block_chance,
+                          per_sprint=args.per_sprint, sprint_length_days=args.sprint_length_days)
+    print(f"Planned {len(plan)} tickets in {time.perf_counter() - started:.3f}s")
+    if args.output:
+        plan.dump(args.output)
+        print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+import json
+import os
+
+from simulation_plan import STATUS_ORDER
+from ticket_generator import SPRINT_ASSIGN_LIMIT
+
+
+class SprintLifecycle:
+    """Run sprints in order: start, work, complete with carry-over.
+
+    Each sprint is started with its planned dates, its tickets are simulated
+    together, and at the end everything not done is moved to the next sprint
+    (one request per 50 issues) before the sprint is closed. A sprint's
+    deliberately incomplete tickets are only started in their own sprint and
+    finished in the next one, so every closed sprint carries work over. The
+    last sprint is left active. Each start, close and move is journaled, so a
+    resumed run continues with the sprint it stopped in.
+    """
+
+    def __init__(self, jira, generator, simulator, report_path=None):
+        self.jira = jira
+        self.generator = generator
+        self.simulator = simulator
+        self.journal = generator.journal
+        self.report_path = report_path
+        self.rows = []
+
+    @classmethod
+    def from_env(cls, jira, generator, simulator):
+        return cls(jira, generator, simulator, report_path=os.getenv('INPUT_SPRINT_REPORT'))
+
+    def run(self, sprints):
+        """Start, work and complete every sprint; returns one report row per sprint"""
+        store = self.generator.tickets
+        plan = self.simulator.plan
+        for index, sprint in enumerate(sprints):
+            self.start(sprint, index)
+            tickets = [ticket for ticket in store if ticket.sprint == sprint.id]
+            # On a resumed run, tickets this sprint already carried over have moved on; count them still
+            moved_on = sum(1 for ticket in store
+                           if ticket.slot // plan.per_sprint == index and ticket.sprint != sprint.id)
+            carried_in = sum(1 for ticket in tickets if ticket.slot // plan.per_sprint != index)
+
+            def statuses_of(ticket):
+                # Planned-incomplete tickets are started in their own sprint and finished in the next
+                if ticket.slot // plan.per_sprint == index and self.generator.carries_over(ticket.slot):
+                    return STATUS_ORDER[:1]
+                return STATUS_ORDER
+
+            self.simulator.tickets = tickets
+            self.simulator.simulate_work(statuses_of)
+
+            # simulate_ticket only marks a ticket complete once every transition went through,
+            # so tickets whose transitions failed stay open and are carried over
+            done, open_tickets = [], []
+            for ticket in tickets:
+                (done if ticket.complete else open_tickets).append(ticket)
+            last = index == len(sprints) - 1
+            if not last:
+                self.carry_over(open_tickets, sprints[index + 1])
+                self.close(sprint)
+            self.rows.append({
+                'sprint': sprint.name,
+                'state': 'active' if last else 'closed',
+                'committed': len(tickets) + moved_on,
+                'carried_in': carried_in,
+                'completed': len(done),
+                'carried_over': 0 if last else len(open_tickets) + moved_on,
+                'hours': round(sum(plan.ticket(ticket.slot).worklog_seconds for ticket in done) / 3600, 1)
+            })
+        self._write_report()
+        return self.rows
+
+    def _update_sprint(self, sprint, body):
+        # A partial update; PUT would need every field of the sprint
+        self.jira._session.post(f"{self.jira.server_url}/rest/agile/1.0/sprint/{sprint.id}", data=json.dumps(body))
+
+    def start(self, sprint, index):
+        if self.journal.get('sprint_state', sprint.id) in ('active', 'closed'):
+            return
+        plan = self.simulator.plan
+        start_date = plan.sprint_start(index)
+        try:
+            self._update_sprint(sprint, {
+                'state': 'active',
+                'startDate': start_date.isoformat(),
+                'endDate': (start_date + plan.sprint_length).isoformat()
+            })
+        except Exception as e:
+            print(f"Warning: Could not start sprint {sprint.name} - {str(e)}")
+            return
+        self.journal.record('sprint_state', sprint.id, 'active')
+        print(f"Started {sprint.name}")
+
+    def carry_over(self, tickets, next_sprint):
+        """Move unfinished tickets to the next sprint, 50 per request"""
+        issue_keys = [ticket.key for ticket in tickets
+                      if self.journal.get('sprint_issue', ticket.key) != next_sprint.id]
+        for start in range(0, len(issue_keys), SPRINT_ASSIGN_LIMIT):
+            batch = issue_keys[start:start + SPRINT_ASSIGN_LIMIT]
+            try:
+                self.jira.add_issues_to_sprint(next_sprint.id, batch)
+            except Exception as e:
+                print(f"Warning: Could not carry {len(batch)} tickets over to {next_sprint.name} - {str(e)}")
+                continue
+            for key in batch:
+                self.journal.record('sprint_issue', key, next_sprint.id)
+        for ticket in tickets:
+            if self.journal.get('sprint_issue', ticket.key) == next_sprint.id:
+                ticket.sprint = next_sprint.id
+        if tickets:
+            print(f"Carried {len(tickets)} tickets over to {next_sprint.name}")
+
+    def close(self, sprint):
+        if self.journal.get('sprint_state', sprint.id) == 'closed':
+            return
+        try:
+            self._update_sprint(sprint, {'state': 'closed'})
+        except Exception as e:
+            print(f"Warning: Could not complete sprint {sprint.name} - {str(e)}")
+            return
+        self.journal.record('sprint_state', sprint.id, 'closed')
+        print(f"Completed {sprint.name}")
+
+    def _write_report(self):
+        if not self.report_path:
+            return
+        with open(self.report_path, 'w') as f:
+            for row in self.rows:
+                f.write(json.dumps(row) + '\n')
+
+    def print_report(self):
+        if not self.rows:
+            return
+        print("\nSprints:")
+        print(f"  {'sprint':<24} {'state':<7} {'committed':>9} {'carried in':>10} {'completed':>9} "
+              f"{'carried over':>12} {'hours':>7}")
+        for row in self.rows:
+            print(f"  {row['sprint'][:24]:<24} {row['state']:<7} {row['committed']:>9} {row['carried_in']:>10} "
+                  f"{row['completed']:>9} {row['carried_over']:>12} {row['hours']:>7.1f}")
+        closed = [row for row in self.rows if row['state'] == 'closed']
+        if closed:
+            velocity = sum(row['completed'] for row in closed) / len(closed)
+            carry_over = sum(row['carried_over'] for row in closed) / (sum(row['committed'] for row in closed) or 1)
+            print(f"  Velocity: {velocity:.1f} tickets per closed sprint, {carry_over:.0%} carried over")
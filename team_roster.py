@@ -0,0 +1,138 @@
+import os
+import secrets
+from concurrent.futures import ThreadPoolExecutor
+
+from metadata_cache import get_metadata_cache
+
+# Roles in roster order, with the variable that sizes each
+TEAM_ROLES = [
+    ('Developer', 'INPUT_NUM_DEVELOPERS', 4),
+    ('QA Engineer', 'INPUT_NUM_QA', 2),
+    ('Tech Lead', 'INPUT_NUM_TECH_LEADS', 1),
+    ('Product Owner', 'INPUT_NUM_PRODUCT_OWNERS', 1),
+    ('Scrum Master', 'INPUT_NUM_SCRUM_MASTERS', 1)
+]
+
+
+def team_structure_from_env():
+    return [(role, int(os.getenv(variable, default))) for role, variable, default in TEAM_ROLES]
+
+
+def build_roster(structure, seed=0, domain='example.com'):
+    """The same people for the same seed and team sizes, so reruns reuse their accounts.
+
+    Growing a role only appends people; everyone already on the roster keeps their
+    name and email.
+    """
+    from faker import Faker
+
+    roster = []
+    emails = set()
+    for role, count in structure:
+        # Seeded per role so resizing one role doesn't rename the others
+        fake = Faker()
+        fake.seed_instance(f"{seed}:{role}")
+        for _ in range(count):
+            first_name, last_name = fake.first_name(), fake.last_name()
+            email = f"{first_name.lower()}.{last_name.lower()}@{domain}"
+            suffix = 2
+            while email in emails:
+                email = f"{first_name.lower()}.{last_name.lower()}{suffix}@{domain}"
+                suffix += 1
+            emails.add(email)
+            roster.append({'email': email, 'displayName': f"{first_name} {last_name}", 'role': role})
+    return roster
+
+
+def roster_from_env():
+    return build_roster(
+        team_structure_from_env(),
+        seed=os.getenv('INPUT_TEAM_SEED', '0'),
+        domain=os.getenv('INPUT_TEAM_EMAIL_DOMAIN', 'example.com')
+    )
+
+
+class TeamProvisioner:
+    """Resolve roster members to Jira accounts, creating the missing ones.
+
+    Each member costs at most one targeted user search and one create, run
+    concurrently across the roster; account IDs are kept in the metadata cache
+    (persisted with JIRA_METADATA_CACHE), so a warm run makes no user requests
+    at all. Nothing scans the whole user directory, so the cost depends on the
+    roster size only.
+    """
+
+    def __init__(self, jira, concurrency=None):
+        self.jira = jira
+        self.metadata = get_metadata_cache(jira)
+        self.concurrency = concurrency or max(1, int(os.getenv('INPUT_SIMULATION_CONCURRENCY', 4)))
+
+    def provision(self, roster):
+        """Roster members that have an account, each with its accountId"""
+        if not roster:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, len(roster))) as executor:
+            members = list(executor.map(self._provision_member, roster))
+        return [member for member in members if member is not None]
+
+    def _provision_member(self, member):
+        email = member['email']
+        try:
+            account_id = self._cached_lookup(email)
+            if account_id is None:
+                account_id = self._create(member)
+        except Exception as e:
+            print(f"Warning: Could not provision user {email}: {str(e)}")
+            return None
+        if account_id is None:
+            return None
+        # Server/DC addresses users by username (the email here), not accountId
+        return {'email': email, 'role': member['role'], 'accountId': account_id if self.jira._is_cloud else None}
+
+    def _cached_lookup(self, email):
+        key = f"user:{email}"
+        account_id = self.metadata.get(key, lambda: self._lookup(email))
+        if account_id is None:
+            # Don't cache a miss; the account is about to be created
+            self.metadata.invalidate(key)
+        return account_id
+
+    def _lookup(self, email):
+        """Account ID for an exact email match, from a search for that email only"""
+        if self.jira._is_cloud:
+            users = self.jira.search_users(query=email, maxResults=5)
+        else:
+            users = self.jira.search_users(user=email, maxResults=5)
+        for user in users:
+            if getattr(user, 'emailAddress', '').lower() == email.lower():
+                return getattr(user, 'accountId', None) or getattr(user, 'name', None)
+        return None
+
+    def _create(self, member):
+        from jira.exceptions import JIRAError
+
+        user_data = {
+            'displayName': member['displayName'],
+            'emailAddress': member['email'],
+            'name': member['email'],  # Using email as username
+            'password': secrets.token_urlsafe(16),
+            'notification': 'DONT_NOTIFY',
+            'applicationKeys': ['jira-software']  # Specify Jira Software access
+        }
+        try:
+            response = self.jira._session.post(f"{self.jira.server_url}/rest/api/2/user", json=user_data)
+        except JIRAError as e:
+            if e.status_code != 400:
+                raise
+            response = e.response
+        if response.status_code == 201:
+            created = response.json()
+            account_id = created.get('accountId') or created.get('name')
+        else:
+            # Another run sharing the tenant may have created the account since our lookup
+            account_id = self._lookup(member['email'])
+            if account_id is None:
+                print(f"Warning: Could not create user {member['email']}: {response.text}")
+                return None
+        self.metadata.set(f"user:{member['email']}", account_id)
+        return account_id
@@ -1,19 +1,148 @@
 import os
-from anthropic import Anthropic
-from faker import Faker
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 import random
+import json
+from types import SimpleNamespace
+from dataset import EPIC_DESCRIPTION, EPIC_SUMMARY
+from llm_pipeline import ContentPipeline, extract_json, parse_json_list
+from metadata_cache import get_metadata_cache
+from run_journal import RunJournal
+from simulation_plan import STATUS_ORDER, tickets_per_sprint
+from ticket_simulator import user_ref
+from ticket_store import COMPLETE, TicketStore
+
+# Jira rejects bulk-create and sprint-assign requests with more than 50 issues
+BULK_CREATE_LIMIT = 50
+SPRINT_ASSIGN_LIMIT = 50
+
+SPRINT_GOAL_PROMPT = """Generate a realistic sprint goal that's focused and achievable within 2 weeks.
+        Make it specific to software development."""
 
 class TicketGenerator:
-    def __init__(self, jira, project_key):
+    def __init__(self, jira, project_key, journal=None, team_members=None, plan=None, dataset=None):
         self.jira = jira
         self.project_key = project_key
-        self.anthropic = Anthropic(api_key=os.getenv('CLAUDE_API_KEY'))
-        self.fake = Faker()
+        self.journal = journal or RunJournal()
+        # When both are set, tickets are created already assigned to their planned member
+        self.team_members = team_members or []
+        self.plan = plan
+        # An imported dataset (INPUT_DATASET) replaces content generation and the sprint layout
+        self.dataset = dataset
+        self.seed = int(os.getenv('INPUT_SEED', 0))
+        self.random = random.Random(self.seed)
+        # No client when only generating content, as `python dataset.py export` does
+        self.metadata = get_metadata_cache(jira) if jira is not None else None
+        # Created tickets as compact states; the simulator works from the same store
+        self.tickets = TicketStore()
+        # Clients and content sources are built on first use, so a run only
+        # imports and sets up what its INPUT_CONTENT_SOURCE needs
+        self._anthropic = None
+        self._llm = None
+        self._fake = None
+        self._templates = None
+        self._router = None
+
+    @property
+    def anthropic(self):
+        if self._anthropic is None:
+            from anthropic import Anthropic
+            self._anthropic = Anthropic(api_key=os.getenv('CLAUDE_API_KEY'))
+        return self._anthropic
+
+    @property
+    def llm(self):
+        if self._llm is None:
+            self._llm = ContentPipeline(self.anthropic, instrumentation=getattr(self.jira, 'instrumentation', None))
+        return self._llm
+
+    @property
+    def fake(self):
+        if self._fake is None:
+            from faker import Faker
+            self._fake = Faker()
+            self._fake.seed_instance(self.seed)
+        return self._fake
         
+    @property
+    def templates(self):
+        """Compiled template engine for INPUT_CONTENT_SOURCE=template, built on first use"""
+        if self._templates is None:
+            from content_engine import ContentEngine
+            self._templates = ContentEngine.from_env(self.seed)
+        return self._templates
+
+    @property
+    def router(self):
+        """LLM seed plus template variant routing for INPUT_CONTENT_SOURCE=hybrid, built on first use"""
+        if self._router is None:
+            from content_router import ContentRouter
+            self._router = ContentRouter.from_env(self)
+        return self._router
+
+    def print_content_summary(self):
+        if self._router is not None:
+            self._router.print_summary()
+
     def generate_ticket_content(self, ticket_type="Task"):
-        prompt = f"""Generate a realistic Jira {ticket_type} with the following format:
+        prompt = self._ticket_prompt(ticket_type)
+        return self.llm.complete(prompt, 1000, parse=extract_json, index=self.llm.next_index(prompt))
+
+    def generate_ticket_contents(self, ticket_types):
+        """Generate content for many tickets at once, several per Claude call and several calls in flight"""
+        requests, chunks = self._ticket_batch_requests(ticket_types, self.llm)
+        contents = self._merge_ticket_batches(len(ticket_types), chunks, self.llm.map(requests))
+        
+        # Batches that came back short or unparseable are filled one ticket at a time
+        missing = [i for i, content in enumerate(contents) if content is None]
+        singles = self.llm.map(self._single_ticket_requests(ticket_types, missing, self.llm))
+        for i, content in zip(missing, singles):
+            contents[i] = content
+        return contents
+
+    async def generate_ticket_contents_async(self, ticket_types, llm):
+        """generate_ticket_contents on an AsyncContentPipeline"""
+        requests, chunks = self._ticket_batch_requests(ticket_types, llm)
+        contents = self._merge_ticket_batches(len(ticket_types), chunks, await llm.map(requests))
+        
+        missing = [i for i, content in enumerate(contents) if content is None]
+        singles = await llm.map(self._single_ticket_requests(ticket_types, missing, llm))
+        for i, content in zip(missing, singles):
+            contents[i] = content
+        return contents
+
+    def _ticket_batch_requests(self, ticket_types, llm):
+        """Batched requests grouped by type, and the ticket positions each one fills"""
+        batch_size = max(1, int(os.getenv('INPUT_LLM_BATCH_SIZE', 5)))
+        positions = {}
+        for i, ticket_type in enumerate(ticket_types):
+            positions.setdefault(ticket_type, []).append(i)
+        
+        requests = []
+        chunks = []
+        for ticket_type, indexes in positions.items():
+            for start in range(0, len(indexes), batch_size):
+                chunk = indexes[start:start + batch_size]
+                prompt = self._ticket_batch_prompt(ticket_type, len(chunk))
+                requests.append((prompt, 600 * len(chunk), parse_json_list, llm.next_index(prompt)))
+                chunks.append(chunk)
+        return requests, chunks
+
+    def _merge_ticket_batches(self, count, chunks, batches):
+        contents = [None] * count
+        for chunk, batch in zip(chunks, batches):
+            for i, item in zip(chunk, batch or []):
+                contents[i] = json.dumps(item)
+        return contents
+
+    def _single_ticket_requests(self, ticket_types, missing, llm):
+        return [
+            (self._ticket_prompt(ticket_types[i]), 1000, extract_json, llm.next_index(self._ticket_prompt(ticket_types[i])))
+            for i in missing
+        ]
+
+    def _ticket_prompt(self, ticket_type):
+        return f"""Generate a realistic Jira {ticket_type} with the following format:
         {{
             "summary": "Brief ticket title",
             "description": "Detailed description with acceptance criteria",
@@ -21,35 +150,24 @@ class TicketGenerator:
             "priority": "High/Medium/Low"
         }}
         Make it related to software development and be specific."""
-        
-        message = self.anthropic.messages.create(
-            max_tokens=1000,
-            messages=[{
-                "role": "user",
-                "content": prompt
-            }],
-            model="claude-3-sonnet-20240229"
-        )
-        
-        # Extract just the JSON part from the response
-        content = message.content[0].text
-        # Remove any markdown formatting if present
-        if content.startswith('```json'):
-            content = content[7:-3]  # Remove ```json and ``` markers
-        elif content.startswith('{'):
-            content = content  # Already clean JSON
-        else:
-            # Find the first { and last }
-            start = content.find('{')
-            end = content.rfind('}') + 1
-            if start >= 0 and end > 0:
-                content = content[start:end]
-            
-        return content
+
+    def _ticket_batch_prompt(self, ticket_type, count):
+        return f"""Generate {count} distinct, realistic Jira {ticket_type} tickets as a JSON array of objects with the following format:
+        [{{
+            "summary": "Brief ticket title",
+            "description": "Detailed description with acceptance criteria",
+            "story_points": number between 1-13,
+            "priority": "High/Medium/Low"
+        }}]
+        Make them related to software development and be specific. Reply with the JSON array only."""
         
     def generate_sprint_data(self, num_sprints=1):
         sprints = []
         start_date = datetime.now()
+        goals = self.llm.map([
+            (SPRINT_GOAL_PROMPT, 300, None, self.llm.next_index(SPRINT_GOAL_PROMPT))
+            for _ in range(num_sprints)
+        ])
         
         for i in range(num_sprints):
             end_date = start_date + timedelta(days=14)  # 2-week sprints
@@ -57,7 +175,7 @@ class TicketGenerator:
                 "name": f"Sprint {i + 1}",
                 "startDate": start_date.isoformat(),
                 "endDate": end_date.isoformat(),
-                "goal": self.generate_sprint_goal()
+                "goal": goals[i]
             }
             sprints.append(sprint)
             start_date = end_date + timedelta(days=1)  # 1 day between sprints
@@ -65,33 +183,28 @@ class TicketGenerator:
         return sprints
     
     def generate_sprint_goal(self):
-        prompt = """Generate a realistic sprint goal that's focused and achievable within 2 weeks.
-        Make it specific to software development."""
-        
-        message = self.anthropic.messages.create(
-            max_tokens=300,
-            messages=[{
-                "role": "user",
-                "content": prompt
-            }],
-            model="claude-3-sonnet-20240229"
-        )
-        
-        return message.content[0].text.strip()
+        return self.llm.complete(SPRINT_GOAL_PROMPT, 300, index=self.llm.next_index(SPRINT_GOAL_PROMPT))
     
     def create_epic(self):
         """Create an epic for the project"""
         print("\nGenerating Epic...")
         
+        recorded = self.journal.get('epic', self.project_key)
+        if recorded:
+            print(f"Reusing Epic from earlier attempt: {recorded['key']}")
+            return SimpleNamespace(**recorded)
+        
+        epic = self.dataset.epic if self.dataset is not None else {}
         epic_data = {
             'project': {'key': self.project_key},
-            'summary': 'Q2 2024 Development Initiative',
-            'description': 'Strategic development initiative for Q2 2024 focusing on core platform improvements and feature additions.',
+            'summary': epic.get('summary', EPIC_SUMMARY),
+            'description': epic.get('description', EPIC_DESCRIPTION),
             'issuetype': {'name': 'Epic'}
         }
         
         try:
             epic = self.jira.create_issue(**epic_data)
+            self.journal.record('epic', self.project_key, {'key': epic.key, 'id': epic.id})
             print(f"Created Epic: {epic.key}")
             return epic
         except Exception as e:
@@ -104,15 +217,26 @@ class TicketGenerator:
         sprints = []
         num_sprints = int(os.getenv('INPUT_NUM_SPRINTS', 2))
         sprint_length = int(os.getenv('INPUT_SPRINT_LENGTH_DAYS', 14))
+        if self.dataset is not None:
+            num_sprints = len(self.dataset.sprints)
+            sprint_length = self.dataset.header['plan']['sprint_length_days']
         
-        # Calculate sprint dates
+        # Calculate sprint dates; the simulation plan's clock may place them in the past
         current_date = datetime.now()
         
         for i in range(num_sprints):
-            start_date = current_date + timedelta(days=i * sprint_length)
+            if self.plan is not None:
+                start_date = self.plan.sprint_start(i)
+            else:
+                start_date = current_date + timedelta(days=i * sprint_length)
             end_date = start_date + timedelta(days=sprint_length)
             
-            sprint_name = f"Sprint {i + 1}"
+            sprint_name = self.dataset.sprints[i]['name'] if self.dataset is not None else f"Sprint {i + 1}"
+            recorded = self.journal.get('sprint', i)
+            if recorded:
+                print(f"Reusing Sprint from earlier attempt: {recorded['name']}")
+                sprints.append(SimpleNamespace(**recorded))
+                continue
             try:
                 sprint = self.jira.create_sprint(
                     name=sprint_name,
@@ -120,6 +244,7 @@ class TicketGenerator:
                     startDate=start_date.isoformat(),
                     endDate=end_date.isoformat()
                 )
+                self.journal.record('sprint', i, {'id': sprint.id, 'name': sprint.name})
                 print(f"Created Sprint: {sprint.name}")
                 sprints.append(sprint)
             except Exception as e:
@@ -130,67 +255,275 @@ class TicketGenerator:
     def generate_tickets(self, epic_key, sprints):
         """Generate tickets and assign them to sprints"""
         print("\nGenerating Tickets...")
+        epic_link_field = self._get_epic_link_field()
+        
+        if os.getenv('INPUT_BULK_CREATE', 'true').lower() == 'true':
+            return self._bulk_create_tickets(epic_key, sprints, epic_link_field)
+        
         created_tickets = []
+        for sprint, slot, label, ticket_data in self._sprint_payloads(epic_key, epic_link_field, sprints):
+            try:
+                ticket = self._recorded_ticket(slot) or self._create_ticket(sprint, slot, label, ticket_data)
+                if not self.journal.done('sprint_issue', ticket.key):
+                    self.jira.add_issues_to_sprint(sprint.id, [ticket.id])
+                    self.journal.record('sprint_issue', ticket.key, sprint.id)
+                created_tickets.append(ticket)
+            except Exception as e:
+                print(f"Error creating {label.lower()}: {str(e)}")
+        
+        return created_tickets
+
+    def _sprint_payloads(self, epic_key, epic_link_field, sprints, sprint_contents=None):
+        """(sprint, slot, label, fields) for every ticket.
+
+        The slot is the ticket's position in creation order; it names the ticket
+        across reruns and indexes its entry in the simulation plan. Pass
+        `sprint_contents` when the content was generated elsewhere.
+        """
+        if sprint_contents is None:
+            sprint_contents = self._generate_sprint_contents(len(sprints))
+        pending = []
+        for index, (sprint, contents) in enumerate(zip(sprints, sprint_contents)):
+            for label, ticket_data in self._sprint_tickets(epic_key, epic_link_field, index, contents):
+                slot = len(pending)
+                pending.append((sprint, slot, label, self._with_planned_assignee(slot, ticket_data)))
+        return pending
+
+    def _with_planned_assignee(self, slot, ticket_data):
+        # Setting the assignee on creation saves a request per ticket during simulation
+        if self.plan is not None and self.team_members:
+            member = self.team_members[self.plan.ticket(slot).assignee % len(self.team_members)]
+            ticket_data['assignee'] = user_ref(member)
+        return ticket_data
+
+    def _recorded_ticket(self, slot):
+        """The ticket an earlier attempt of this run already created for `slot`, if any"""
+        ticket = self.tickets.get(slot)
+        if ticket is not None:
+            return ticket
+        recorded = self.journal.get('ticket', slot)
+        if recorded is None:
+            return None
+        # Rebuild the ticket's state from what the journal says was done to it
+        key = recorded['key']
+        moved = [status for status in STATUS_ORDER if self.journal.done('simulation', f"{key}:{status}")]
+        # Carried-over tickets are journaled again under the sprint they moved to
+        sprint = self.journal.get('sprint_issue', key) or recorded.get('sprint')
+        ticket = self.tickets.add(slot, key, recorded['id'], recorded.get('type'), sprint,
+                                  self._member_index(self.journal.get('simulation', f"{key}:assignee")))
+        if moved:
+            ticket.moved(moved[-1])
+            ticket.progress = len(moved)
+        if self.journal.done('simulation', f"{key}:complete"):
+            ticket.progress = COMPLETE
+        return ticket
+
+    def _create_ticket(self, sprint, slot, label, ticket_data):
+        """Create one ticket with its own request and journal it"""
+        issue = self.jira.create_issue(**ticket_data)
+        ticket = self._record_ticket(slot, sprint, issue.key, issue.id, ticket_data)
+        print(f"Created {label}: {ticket.key}")
+        return ticket
+
+    def _record_ticket(self, slot, sprint, key, issue_id, ticket_data):
+        """Journal a newly created issue and keep only its state"""
+        issue_type = ticket_data['issuetype']['name']
+        self.metadata.note_issue(key, issue_type)
+        self.journal.record('ticket', slot, {'key': key, 'id': issue_id, 'type': issue_type, 'sprint': sprint.id})
+        assignee = self._member_index(ticket_data.get('assignee'))
+        if assignee is not None:
+            self.journal.record('simulation', f"{key}:assignee", self.team_members[assignee])
+        return self.tickets.add(slot, key, issue_id, issue_type, sprint.id, assignee)
+
+    def carries_over(self, slot):
+        """Whether `slot` is one of its sprint's incomplete tickets, which are finished a sprint late"""
+        if self.dataset is not None:
+            return self.dataset.ticket(slot)['label'] == 'Incomplete Ticket'
+        regular = int(os.getenv('INPUT_TICKETS_PER_SPRINT', 5))
+        return slot % tickets_per_sprint() >= regular
+
+    def _member_index(self, member):
+        """Index in team_members of a member (or user reference), or None"""
+        if not member:
+            return None
+        ref = user_ref(member) if 'email' in member else member
+        return next((i for i, m in enumerate(self.team_members) if user_ref(m) == ref), None)
+
+    def _get_epic_link_field(self):
+        """Find the ID of the Epic Link field, if the instance has one"""
+        return self.metadata.field_id('Epic Link')
+
+    def _generate_sprint_contents(self, num_sprints):
+        """(type, summary, description) for every regular ticket, grouped by sprint"""
+        if self.dataset is not None:
+            return [None] * num_sprints
+        chosen_types = self._choose_ticket_types(num_sprints)
+        generated = self.generate_ticket_contents(chosen_types) if self._uses_llm() else None
+        return self._sprint_contents(num_sprints, chosen_types, generated)
+
+    async def generate_sprint_contents_async(self, num_sprints, llm):
+        """_generate_sprint_contents with the LLM calls on an AsyncContentPipeline"""
+        chosen_types = self._choose_ticket_types(num_sprints)
+        generated = await self.generate_ticket_contents_async(chosen_types, llm) if self._uses_llm() else None
+        return self._sprint_contents(num_sprints, chosen_types, generated)
+
+    def _uses_llm(self):
+        return self.dataset is None and os.getenv('INPUT_CONTENT_SOURCE', 'faker').lower() == 'llm'
+
+    def _choose_ticket_types(self, num_sprints):
         tickets_per_sprint = int(os.getenv('INPUT_TICKETS_PER_SPRINT', 5))
-        incomplete_tickets_per_sprint = int(os.getenv('INPUT_INCOMPLETE_TICKETS_PER_SPRINT', 1))
         ticket_types = os.getenv('INPUT_TICKET_TYPES', 'Story,Task,Bug').split(',')
+        return [self.random.choice(ticket_types) for _ in range(num_sprints * tickets_per_sprint)]
+
+    def _sprint_contents(self, num_sprints, chosen_types, generated=None):
+        """Pair types with generated content (Faker where there is none) and split them by sprint"""
+        tickets_per_sprint = int(os.getenv('INPUT_TICKETS_PER_SPRINT', 5))
+        if generated is not None:
+            contents = []
+            for ticket_type, content in zip(chosen_types, generated):
+                try:
+                    ticket = json.loads(content)
+                    contents.append((ticket_type, ticket['summary'], ticket['description']))
+                except (TypeError, ValueError, KeyError):
+                    print(f"Warning: Could not parse generated {ticket_type}, using Faker content")
+                    contents.append((ticket_type, self.generate_ticket_summary(ticket_type), self.generate_ticket_description(ticket_type)))
+        elif os.getenv('INPUT_CONTENT_SOURCE', 'faker').lower() == 'hybrid':
+            contents = self.router.contents(chosen_types)
+        elif os.getenv('INPUT_CONTENT_SOURCE', 'faker').lower() == 'template':
+            contents = [(ticket_type,) + self.templates.ticket(ticket_type) for ticket_type in chosen_types]
+        else:
+            contents = [
+                (ticket_type, self.generate_ticket_summary(ticket_type), self.generate_ticket_description(ticket_type))
+                for ticket_type in chosen_types
+            ]
+        
+        return [contents[i * tickets_per_sprint:(i + 1) * tickets_per_sprint] for i in range(num_sprints)]
+
+    def _sprint_tickets(self, epic_key, epic_link_field, sprint_index, contents):
+        """(label, fields) payloads for one sprint, from the dataset when one was imported"""
+        if self.dataset is None:
+            return self._build_sprint_tickets(epic_key, epic_link_field, contents)
+        payloads = []
+        for ticket in self.dataset.sprint_tickets(sprint_index):
+            ticket_data = {
+                'project': {'key': self.project_key},
+                'summary': ticket['summary'],
+                'description': ticket['description'],
+                'issuetype': {'name': ticket['type']}
+            }
+            if epic_link_field:
+                ticket_data[epic_link_field] = epic_key
+            payloads.append((ticket['label'], ticket_data))
+        return payloads
+
+    def _build_sprint_tickets(self, epic_key, epic_link_field, contents):
+        """Build (label, fields) payloads for one sprint's regular and incomplete tickets"""
+        incomplete_tickets_per_sprint = int(os.getenv('INPUT_INCOMPLETE_TICKETS_PER_SPRINT', 1))
+        payloads = []
         
-        # Get all fields to find the Epic Link field
-        fields = self.jira.fields()
-        epic_link_field = None
-        for field in fields:
-            if field['name'] == 'Epic Link':
-                epic_link_field = field['id']
-                break
-        
-        for sprint in sprints:
-            # Create regular tickets
-            for _ in range(tickets_per_sprint):
-                ticket_type = random.choice(ticket_types)
-                summary = self.generate_ticket_summary(ticket_type)
-                description = self.generate_ticket_description(ticket_type)
-                
-                ticket_data = {
-                    'project': {'key': self.project_key},
-                    'summary': summary,
-                    'description': description,
-                    'issuetype': {'name': ticket_type}
-                }
-                
-                # Add Epic Link if available
-                if epic_link_field:
-                    ticket_data[epic_link_field] = epic_key
-                
+        # Create regular tickets
+        for ticket_type, summary, description in contents:
+            ticket_data = {
+                'project': {'key': self.project_key},
+                'summary': summary,
+                'description': description,
+                'issuetype': {'name': ticket_type}
+            }
+            if epic_link_field:
+                ticket_data[epic_link_field] = epic_key
+            payloads.append((ticket_type, ticket_data))
+        
+        # Create incomplete tickets per sprint
+        for _ in range(incomplete_tickets_per_sprint):
+            ticket_data = {
+                'project': {'key': self.project_key},
+                'summary': 'Incomplete ticket needs refinement',
+                'description': 'This ticket needs more information and refinement.',
+                'issuetype': {'name': 'Story'}
+            }
+            if epic_link_field:
+                ticket_data[epic_link_field] = epic_key
+            payloads.append(('Incomplete Ticket', ticket_data))
+        
+        return payloads
+
+    def _bulk_create_tickets(self, epic_key, sprints, epic_link_field):
+        """Create all tickets through the bulk endpoint, then fill each sprint in one call"""
+        # Build every payload up front so the network phase is pure batching
+        pending = self._sprint_payloads(epic_key, epic_link_field, sprints)
+        
+        created = []
+        for start in range(0, len(pending), BULK_CREATE_LIMIT):
+            created.extend(self.create_ticket_batch(pending[start:start + BULK_CREATE_LIMIT]))
+        self.assign_to_sprints(created)
+        
+        return [ticket for _, ticket in created]
+
+    def iter_ticket_payloads(self, epic_key, sprints):
+        """Yield (sprint, slot, label, fields) lazily, generating one sprint's content at a time"""
+        epic_link_field = self._get_epic_link_field()
+        slot = 0
+        for index, sprint in enumerate(sprints):
+            contents = self._generate_sprint_contents(1)[0]
+            for label, ticket_data in self._sprint_tickets(epic_key, epic_link_field, index, contents):
+                yield sprint, slot, label, self._with_planned_assignee(slot, ticket_data)
+                slot += 1
+
+    def create_ticket_batch(self, batch):
+        """Create up to 50 (sprint, slot, label, fields) tickets in one bulk call; returns (sprint, ticket) pairs.
+
+        Slots an earlier attempt of this run already created are returned without a
+        request. If the bulk call itself fails, the batch is created one ticket at a time.
+        """
+        created = []
+        to_create = []
+        for item in batch:
+            ticket = self._recorded_ticket(item[1])
+            if ticket is not None:
+                created.append((item[0], ticket))
+            else:
+                to_create.append(item)
+        if not to_create:
+            return created
+        
+        try:
+            results = self.jira.create_issues([ticket_data for _, _, _, ticket_data in to_create], prefetch=False)
+        except Exception as e:
+            print(f"Warning: Could not bulk create {len(to_create)} tickets, creating them one by one - {str(e)}")
+            for sprint, slot, label, ticket_data in to_create:
                 try:
-                    ticket = self.jira.create_issue(**ticket_data)
-                    self.jira.add_issues_to_sprint(sprint.id, [ticket.id])
-                    print(f"Created {ticket_type}: {ticket.key}")
-                    created_tickets.append(ticket)
+                    created.append((sprint, self._create_ticket(sprint, slot, label, ticket_data)))
                 except Exception as e:
-                    print(f"Error creating ticket: {str(e)}")
-            
-            # Create incomplete tickets per sprint
-            for _ in range(incomplete_tickets_per_sprint):
+                    print(f"Error creating {label.lower()} '{ticket_data['summary']}': {str(e)}")
+            return created
+        
+        # Results come back in input order, one entry per requested issue
+        for (sprint, slot, label, ticket_data), result in zip(to_create, results):
+            if result['status'] == 'Success':
+                issue = result['issue']
+                ticket = self._record_ticket(slot, sprint, issue.key, issue.id, ticket_data)
+                print(f"Created {label}: {ticket.key}")
+                created.append((sprint, ticket))
+            else:
+                print(f"Error creating {label.lower()} '{ticket_data['summary']}': {result['error']}")
+        return created
+
+    def assign_to_sprints(self, created):
+        """Add (sprint, ticket) pairs to their sprints with one call per sprint and 50 issues"""
+        sprint_issues = {}
+        for sprint, ticket in created:
+            if not self.journal.done('sprint_issue', ticket.key):
+                sprint_issues.setdefault(sprint.id, (sprint, []))[1].append(ticket.key)
+        
+        for sprint, issue_keys in sprint_issues.values():
+            for start in range(0, len(issue_keys), SPRINT_ASSIGN_LIMIT):
+                batch = issue_keys[start:start + SPRINT_ASSIGN_LIMIT]
                 try:
-                    ticket_data = {
-                        'project': {'key': self.project_key},
-                        'summary': 'Incomplete ticket needs refinement',
-                        'description': 'This ticket needs more information and refinement.',
-                        'issuetype': {'name': 'Story'}
-                    }
-                    
-                    # Add Epic Link if available
-                    if epic_link_field:
-                        ticket_data[epic_link_field] = epic_key
-                    
-                    ticket = self.jira.create_issue(**ticket_data)
-                    self.jira.add_issues_to_sprint(sprint.id, [ticket.id])
-                    print(f"Created Incomplete Ticket: {ticket.key}")
-                    created_tickets.append(ticket)
+                    self.jira.add_issues_to_sprint(sprint.id, batch)
+                    for key in batch:
+                        self.journal.record('sprint_issue', key, sprint.id)
                 except Exception as e:
-                    print(f"Error creating incomplete ticket: {str(e)}")
-        
-        return created_tickets
+                    print(f"Warning: Could not add {len(batch)} tickets to sprint {sprint.name} - {str(e)}")
 
     def generate_ticket_summary(self, ticket_type):
         """Generate a realistic ticket summary"""
@@ -235,5 +568,5 @@ Steps to Reproduce:
 2. {self.fake.sentence()}
 3. {self.fake.sentence()}
 
-Impact: {random.choice(['Low', 'Medium', 'High'])}
-Environment: {random.choice(['Development', 'Staging', 'Production'])}""" 
\ No newline at end of file
+Impact: {self.fake.random_element(['Low', 'Medium', 'High'])}
+Environment: {self.fake.random_element(['Development', 'Staging', 'Production'])}""" 
\ No newline at end of file
@@ -3,14 +3,39 @@ from datetime import datetime, timedelta
 import json
 import time
 import os
-from faker import Faker
+from concurrent.futures import ThreadPoolExecutor
+from jira.exceptions import JIRAError
+from metadata_cache import get_metadata_cache
+from run_journal import RunJournal
+from simulation_plan import STATUS_ORDER, WORKLOG_TIME_FORMAT, SimulationPlan
+from team_roster import TeamProvisioner, roster_from_env
+from ticket_store import COMPLETE
+from workflow_planner import get_workflow_planner
+
+
+def user_ref(member):
+    """Jira user reference for a team member: accountId on Cloud, username on Server/DC"""
+    if member.get('accountId'):
+        return {'accountId': member['accountId']}
+    return {'name': member['email']}
+
 
 class TicketSimulator:
-    def __init__(self, jira, tickets):
+    def __init__(self, jira, tickets, journal=None, plan=None, dataset=None):
         self.jira = jira
         self.tickets = tickets
-        self.fake = Faker()
+        self.journal = journal or RunJournal()
+        # Cleared the first time Jira refuses a worklog carried on a transition
+        self.fold_worklog = True
+        self.seed = int(os.getenv('INPUT_SEED', 0))
+        self._fake = None
+        self.metadata = get_metadata_cache(jira)
+        self.planner = get_workflow_planner(jira)
+        # An imported dataset (INPUT_DATASET) brings its own roster and plan
+        self.dataset = dataset
         self.team_members = self.create_or_get_team_members()
+        # Every random decision is drawn up front; simulate_ticket only replays it
+        self.plan = plan or self._plan_from_env()
         
         self.status_transitions = [
             "To Do",
@@ -30,62 +55,20 @@ class TicketSimulator:
             "Security review pending"
         ]
         
+    @property
+    def fake(self):
+        if self._fake is None:
+            from faker import Faker
+            self._fake = Faker()
+            self._fake.seed_instance(self.seed)
+        return self._fake
+
     def create_or_get_team_members(self):
         """Create or get team members for the simulation."""
-        team_members = []
-        
-        # Define team structure based on environment variables
-        team_structure = {
-            'Developer': int(os.getenv('INPUT_NUM_DEVELOPERS', 4)),
-            'QA Engineer': int(os.getenv('INPUT_NUM_QA', 2)),
-            'Tech Lead': int(os.getenv('INPUT_NUM_TECH_LEADS', 1)),
-            'Product Owner': int(os.getenv('INPUT_NUM_PRODUCT_OWNERS', 1)),
-            'Scrum Master': int(os.getenv('INPUT_NUM_SCRUM_MASTERS', 1))
-        }
-        
-        fake = Faker()
-        
         try:
-            # Get all existing users first
-            existing_users = self.jira.search_users(query='')
-            existing_emails = {user.emailAddress for user in existing_users}
-            
-            # Create users for each role
-            for role, count in team_structure.items():
-                for _ in range(count):
-                    first_name = fake.first_name()
-                    last_name = fake.last_name()
-                    email = f"{first_name.lower()}.{last_name.lower()}@example.com"
-                    
-                    # Skip if user already exists
-                    if email in existing_emails:
-                        continue
-                    
-                    try:
-                        # Create user with product access
-                        user_data = {
-                            'displayName': f"{first_name} {last_name}",
-                            'emailAddress': email,
-                            'name': email,  # Using email as username
-                            'password': fake.password(),
-                            'notification': 'DONT_NOTIFY',
-                            'applicationKeys': ['jira-software']  # Specify Jira Software access
-                        }
-                        
-                        new_user = self.jira._session.post(
-                            f"{self.jira.server_url}/rest/api/2/user",
-                            json=user_data
-                        )
-                        
-                        if new_user.status_code == 201:
-                            team_members.append({
-                                'email': email,
-                                'role': role
-                            })
-                        else:
-                            print(f"Warning: Could not create user {email}: {new_user.text}")
-                    except Exception as e:
-                        print(f"Warning: Could not create user {email}: {str(e)}")
+            # A stable roster (INPUT_TEAM_SEED) mapped onto existing accounts where possible
+            roster = self.dataset.roster if self.dataset is not None else roster_from_env()
+            team_members = TeamProvisioner(self.jira).provision(roster)
             
             if not team_members:
                 print("\nWarning: Using authenticated user as fallback")
@@ -93,7 +76,8 @@ class TicketSimulator:
                 myself = self.jira.myself()
                 team_members.append({
                     'email': myself['emailAddress'],
-                    'role': 'Developer'  # Default role
+                    'role': 'Developer',  # Default role
+                    'accountId': myself.get('accountId')
                 })
             
             return team_members
@@ -105,11 +89,29 @@ class TicketSimulator:
             myself = self.jira.myself()
             return [{
                 'email': myself['emailAddress'],
-                'role': 'Developer'  # Default role
+                'role': 'Developer',  # Default role
+                'accountId': myself.get('accountId')
             }]
 
-    def simulate_work(self):
-        """Simulate work being done on tickets."""
+    def _plan_from_env(self):
+        # The clock origin is journaled so a resumed run keeps the same simulated dates
+        origin = self.journal.get('plan', 'origin')
+        origin = origin and datetime.fromisoformat(origin)
+        if self.dataset is not None:
+            plan = self.dataset.plan(origin)
+        else:
+            plan = SimulationPlan.from_env(len(self.team_members), origin=origin)
+        if origin is None:
+            self.journal.record('plan', 'origin', plan.origin.isoformat())
+        return plan
+
+    def simulate_work(self, statuses_of=None):
+        """Simulate work being done on tickets.
+
+        `statuses_of(ticket)` limits a ticket to some of STATUS_ORDER, e.g. to
+        start it in this sprint and finish it in the next.
+        """
+        statuses_of = statuses_of or (lambda ticket: STATUS_ORDER)
         # Get all transitions
         transitions = {
             'To Do': 'Open',
@@ -127,66 +129,179 @@ class TicketSimulator:
             print("Error: No team members available for simulation")
             return
         
-        # Process each ticket
+        # Tickets run concurrently; each ticket's own steps stay in order and the
+        # client's shared throttle paces the requests
+        concurrency = max(1, int(os.getenv('INPUT_SIMULATION_CONCURRENCY', 4)))
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            if self.plan.backdate:
+                self._replay_by_day(executor, statuses_of)
+                return
+            for ticket in self.tickets:
+                executor.submit(self.simulate_ticket, ticket, statuses_of(ticket))
+
+    def _replay_by_day(self, executor, statuses_of):
+        """Replay transitions one simulated day at a time, in simulated-time order.
+
+        Days run in order; within a day tickets run concurrently, each ticket's
+        steps for that day in sequence. INPUT_TIME_SCALE sets how many simulated
+        seconds pass per real second (0, the default, doesn't wait at all).
+        """
+        time_scale = float(os.getenv('INPUT_TIME_SCALE', 0))
+        days = {}
         for ticket in self.tickets:
-            try:
-                # Get available transitions for this ticket
-                available_transitions = self.jira.transitions(ticket.key)
-                transition_ids = {t['name']: t['id'] for t in available_transitions}
-                
-                # Assign to random team member
-                assignee = random.choice(self.team_members)
-                self.jira.assign_issue(ticket.key, assignee['email'])
+            planned = self.plan.ticket(ticket.slot)
+            for status in statuses_of(ticket):
+                at = self.plan.status_time(planned, status)
+                days.setdefault(at.date(), {}).setdefault(ticket.key, (ticket, []))[1].append((at, status))
+        
+        for day in sorted(days):
+            started = time.monotonic()
+            futures = [
+                executor.submit(self.simulate_ticket, ticket, [status for _, status in sorted(steps)])
+                for ticket, steps in days[day].values()
+            ]
+            for future in futures:
+                future.result()
+            if time_scale > 0:
+                time.sleep(max(0, 86400 / time_scale - (time.monotonic() - started)))
+
+    def simulate_ticket(self, ticket, statuses=STATUS_ORDER):
+        """Run the assign, worklog, transition and comment steps for one ticket.
+
+        Steps are folded into as few requests as Jira allows: the assignee is
+        normally set when the generator creates the ticket, and each transition
+        carries its comments (and the first one the worklog) in its update block,
+        so a ticket usually costs one request per transition. Each request is
+        journaled once it succeeds, so a resumed run picks up at the first step
+        this ticket hasn't finished. Every choice comes from the ticket's slot in
+        the simulation plan. `statuses` limits the call to some of the ticket's
+        transitions, for replaying a ticket across simulated days. `ticket` is a
+        TicketState; its assignee, status and progress are kept current.
+        """
+        if ticket.complete:
+            return
+        planned = self.plan.ticket(ticket.slot)
+        try:
+            # Assign to the planned team member unless it was assigned on creation
+            if ticket.assignee is None:
+                member = planned.assignee % len(self.team_members)
+                self._assign(ticket.key, self.team_members[member])
+                self.journal.record('simulation', f"{ticket.key}:assignee", self.team_members[member])
+                ticket.assignee = member
+            assignee = self.team_members[ticket.assignee]
+            
+            # Work log with assignee's name, carried by the first transition
+            worklog = None
+            if not self.journal.done('simulation', f"{ticket.key}:worklog"):
+                worklog = {
+                    'timeSpentSeconds': planned.worklog_seconds,
+                    'comment': f"{assignee['email'].split('@')[0]} working on implementing the requested changes."
+                }
+                if self.plan.backdate:
+                    worklog['started'] = planned.started.strftime(WORKLOG_TIME_FORMAT)
+            
+            # Move through workflow states
+            for index, status in enumerate(STATUS_ORDER):
+                step = f"{ticket.key}:{status}"
+                if status not in statuses or self.journal.done('simulation', step):
+                    continue
                 
-                # Add work log with assignee's name
-                self.jira.add_worklog(
-                    ticket.key,
-                    timeSpentSeconds=random.randint(3600, 28800),  # 1-8 hours
-                    comment=f"{assignee['email'].split('@')[0]} working on implementing the requested changes."
-                )
+                # Status comment plus a blocker or review note
+                comments = [self._get_status_comment(status, assignee, planned.comments[index])]
+                follow_up = self._follow_up_comment(status, assignee, planned.blocked, planned.follow_ups[index])
+                if follow_up:
+                    comments.append(follow_up)
                 
-                # Move through workflow states
-                for status in ['In Progress', 'Done']:
-                    if status in transition_ids:
-                        try:
-                            self.jira.transition_issue(ticket.key, transition_ids[status])
-                            print(f"Moved {ticket.key} to {status.upper()} (Assignee: {assignee['email']})")
-                        except Exception as e:
-                            print(f"Warning: Could not find transition to {status.upper()} for {ticket.key}")
-                            continue
-                        
-                        # Add comments based on status
-                        comment = self._get_status_comment(status, assignee)
-                        self.jira.add_comment(ticket.key, comment)
-                        
-                        # Simulate work time
-                        time.sleep(0.5)  # Small delay to prevent rate limiting
-                        
-                        # Randomly decide if ticket gets blocked
-                        if status == 'In Progress' and random.randint(1, 100) <= int(os.getenv('INPUT_BLOCK_CHANCE', 30)):
-                            # Choose a random team member as blocker (not the assignee)
-                            other_members = [m for m in self.team_members if m['email'] != assignee['email']]
-                            if other_members:  # Only add blocker if there are other team members
-                                blocker = random.choice(other_members)
-                                self.jira.add_comment(
-                                    ticket.key,
-                                    f"Blocked: {blocker['email'].split('@')[0]} needs to complete dependent work first."
-                                )
-                        else:
-                            # Add code review comment
-                            other_members = [m for m in self.team_members if m['email'] != assignee['email']]
-                            if other_members:  # Only add review comment if there are other team members
-                                reviewer = random.choice(other_members)
-                                self.jira.add_comment(
-                                    ticket.key,
-                                    f"Implementation completed by {assignee['email'].split('@')[0]}, requesting review from {reviewer['email'].split('@')[0]}."
-                                )
-            except Exception as e:
-                print(f"Error simulating work on {ticket.key}: {str(e)}")
-                continue
+                try:
+                    carried_worklog = self._move_to(ticket, status, comments, worklog, assignee, planned.comments[index])
+                except LookupError:
+                    print(f"Warning: Could not find transition to {status.upper()} for {ticket.key}")
+                    continue
+                if carried_worklog:
+                    self.journal.record('simulation', f"{ticket.key}:worklog")
+                    worklog = None
+                self.journal.record('simulation', step)
+                ticket.progress += 1
+                print(f"Moved {ticket.key} to {status.upper()} (Assignee: {assignee['email']})")
+            
+            if STATUS_ORDER[-1] not in statuses:
+                return
+            
+            # No transition could carry the worklog
+            if worklog:
+                self.jira.add_worklog(ticket.key, timeSpentSeconds=worklog['timeSpentSeconds'], comment=worklog['comment'],
+                                      started=planned.started if self.plan.backdate else None)
+                self.journal.record('simulation', f"{ticket.key}:worklog")
+            
+            # A ticket with a missing transition stays unfinished and is retried on resume
+            if not all(self.journal.done('simulation', f"{ticket.key}:{status}") for status in STATUS_ORDER):
+                return
+            self.journal.record('simulation', f"{ticket.key}:complete")
+            ticket.progress = COMPLETE
+        except Exception as e:
+            print(f"Error simulating work on {ticket.key}: {str(e)}")
+
+    def _assign(self, issue_key, member):
+        """Set the assignee directly; jira.assign_issue would search for the user on every call"""
+        self.jira._session.put(
+            self.jira._get_url(f"issue/{issue_key}/assignee"),
+            data=json.dumps(user_ref(member))
+        )
+
+    def _move_to(self, ticket, status, comments, worklog, assignee, choice):
+        """Walk the workflow's shortest path to `status`; returns whether the worklog went with a transition.
+
+        `comments` and the worklog go with the transition that arrives, and
+        statuses passed on the way get their own status comment. Steps back
+        from a walk that couldn't reach `status` carry nothing.
+        """
+        carried = False
+        for transition, last in self.planner.walk(ticket.key, status):
+            if last is None:
+                hop_comments = []
+            else:
+                hop_comments = comments if last else [self._get_status_comment(transition['to'], assignee, choice)]
+            carried = self._transition_with_updates(ticket.key, transition, hop_comments,
+                                                    worklog if last and not carried else None) or carried
+            self.metadata.record_transition(ticket.key, transition)
+            ticket.moved(transition['to'])
+        return carried
+
+    def _transition_with_updates(self, issue_key, transition, comments, worklog=None):
+        """Transition, comment and optionally log work in one request; returns whether the worklog went with it"""
+        update = {'comment': [{'add': {'body': comment}} for comment in comments]}
+        fold = worklog is not None and self.fold_worklog
+        if fold:
+            update['worklog'] = [{'add': worklog}]
+        try:
+            self.jira._session.post(
+                self.jira._get_url(f"issue/{issue_key}/transitions"),
+                data=json.dumps({'transition': {'id': transition['id']}, 'update': update})
+            )
+        except JIRAError as e:
+            # Transitions whose screen lacks time tracking reject worklogs; log work separately from now on
+            if not fold or e.status_code != 400:
+                raise
+            self.fold_worklog = False
+            print("Warning: Jira refused a worklog on a transition; logging work with separate requests")
+            return self._transition_with_updates(issue_key, transition, comments)
+        return fold
+
+    def _follow_up_comment(self, status, assignee, blocked, member):
+        """Blocker note while in progress when the plan says so, otherwise a review request"""
+        other_members = [m for m in self.team_members if m['email'] != assignee['email']]
+        if status == 'In Progress' and blocked:
+            # The planned blocker is one of the other team members
+            if other_members:  # Only add blocker if there are other team members
+                blocker = other_members[member % len(other_members)]
+                return f"Blocked: {blocker['email'].split('@')[0]} needs to complete dependent work first."
+        elif other_members:  # Only add review comment if there are other team members
+            reviewer = other_members[member % len(other_members)]
+            return f"Implementation completed by {assignee['email'].split('@')[0]}, requesting review from {reviewer['email'].split('@')[0]}."
+        return None
 
-    def _get_status_comment(self, status, assignee):
-        """Get a random comment for the given status."""
+    def _get_status_comment(self, status, assignee, choice=None):
+        """Get a comment for the given status; `choice` picks one, otherwise it's random."""
         comments = {
             "In Progress": [
                 f"Starting work on this ticket. - {assignee['email'].split('@')[0]}",
@@ -210,7 +325,10 @@ class TicketSimulator:
             ]
         }
         
-        return random.choice(comments.get(status, [f"Moving to {status} - {assignee['email'].split('@')[0]}"]))
+        options = comments.get(status, [f"Moving to {status} - {assignee['email'].split('@')[0]}"])
+        if choice is None:
+            return random.choice(options)
+        return options[choice % len(options)]
 
     def create_incomplete_ticket(self, epic_key=None, sprint_id=None):
         """Create a ticket with missing or incomplete information"""
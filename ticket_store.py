@@ -0,0 +1,77 @@
+import sys
+import threading
+
+from simulation_plan import STATUS_ORDER
+
+# TicketState.progress once every transition and the closing worklog are done
+COMPLETE = len(STATUS_ORDER) + 1
+
+
+class TicketState:
+    """What a run needs to know about one created ticket, and nothing else.
+
+    jira.resources.Issue objects carry their raw JSON and a session reference;
+    a state is a few slots of ints and shared strings, so 100k tickets stay
+    small. `assignee` is an index into the simulator's team members (None until
+    known), `status` is the issue's current status and `progress` counts the
+    finished STATUS_ORDER steps, up to COMPLETE.
+    """
+
+    __slots__ = ('slot', 'key', 'id', 'type', 'sprint', 'assignee', 'status', 'progress')
+
+    def __init__(self, slot, key, id, type=None, sprint=None, assignee=None, status=None, progress=0):
+        self.slot = slot
+        self.key = key
+        self.id = id
+        self.type = type
+        self.sprint = sprint
+        self.assignee = assignee
+        self.status = status
+        self.progress = progress
+
+    def moved(self, status):
+        """Record a transition into `status`"""
+        # Statuses repeat across every ticket; keep one copy of each string
+        self.status = sys.intern(status)
+
+    @property
+    def complete(self):
+        return self.progress >= COMPLETE
+
+    def __repr__(self):
+        return f"TicketState({self.key}, slot={self.slot}, status={self.status!r}, progress={self.progress})"
+
+
+class TicketStore:
+    """Created tickets by slot (their position in creation order), shared by the generator and simulator"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.states = []
+
+    def add(self, slot, key, id, type=None, sprint=None, assignee=None):
+        state = TicketState(slot, key, str(id), type and sys.intern(type), sprint, assignee)
+        with self.lock:
+            if slot >= len(self.states):
+                self.states.extend([None] * (slot + 1 - len(self.states)))
+            self.states[slot] = state
+        return state
+
+    def get(self, slot):
+        with self.lock:
+            return self.states[slot] if slot < len(self.states) else None
+
+    def __iter__(self):
+        return (state for state in list(self.states) if state is not None)
+
+    def __len__(self):
+        return sum(1 for state in self.states if state is not None)
+
+    def counts(self):
+        """Tickets per current status ('created' before the first transition), and how many finished"""
+        counts = {'complete': 0}
+        for state in self:
+            status = state.status or 'created'
+            counts[status] = counts.get(status, 0) + 1
+            counts['complete'] += state.complete
+        return counts
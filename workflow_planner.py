@@ -0,0 +1,145 @@
+import threading
+from collections import deque
+
+from metadata_cache import get_metadata_cache
+
+
+class WorkflowPlanner:
+    """Shortest transition paths through a project's workflow, per issue type.
+
+    Jira only lists the transitions out of an issue's current status, so the
+    graph is discovered as issues move: the first time an issue of a type sits
+    in a status, that status's transitions are fetched once and kept in the
+    metadata cache (and persisted with it). Paths are breadth-first searches
+    over the known graph, cached per (project, type, from, to). When the target
+    isn't reachable yet, the issue is walked towards the nearest status whose
+    transitions are still unknown, which discovers them on arrival; that only
+    happens for a target the project lists among the issue type's statuses, and
+    a walk that still fails moves the issue back to where it started. Once every
+    status on the way has been seen, moving an issue costs one request per
+    transition and no lookups.
+    """
+
+    def __init__(self, metadata):
+        self.metadata = metadata
+        self.lock = threading.Lock()
+        self.paths = {}
+        # Known statuses per (project, type); the path cache is dropped whenever it grows
+        self.explored = {}
+
+    def next_step(self, issue_key, target):
+        """(transition, last) moving the issue one step towards `target`, or None if it is there.
+
+        Raises LookupError when the workflow has no way from the issue's status to `target`.
+        """
+        project = issue_key.rsplit('-', 1)[0]
+        issue_type, status = self.metadata.issue_state(issue_key)
+        if status.lower() == target.lower():
+            return None
+        # Discover the current status's transitions (one GET the first time per type and status)
+        self.metadata.transitions(issue_key)
+        self._learn(project, issue_type, status)
+
+        path = self.path(project, issue_type, status, target)
+        if path is None:
+            # Never walk an issue around looking for a status its workflow doesn't have
+            statuses = self.metadata.statuses(project, issue_type)
+            if statuses is not None and target.lower() not in {name.lower() for name in statuses}:
+                raise LookupError(f"{issue_type} in {project} has no {target} status")
+            path = self._path_to_unexplored(project, issue_type, status)
+            if path is None:
+                raise LookupError(f"No transition path from {status} to {target} for {issue_type} in {project}")
+            return path[0], False
+        return path[0], len(path) == 1
+
+    def walk(self, issue_key, target, limit=20):
+        """Yield (transition, last) until the issue reaches `target`; the caller applies each and records it.
+
+        Each step re-reads the issue's status from the metadata cache, so the
+        caller must call `metadata.record_transition` after applying a step.
+        When the target turns out to be unreachable, the steps back to the
+        starting status are yielded with `last` set to None (apply them without
+        comments or worklogs) before LookupError is raised.
+        """
+        _, origin = self.metadata.issue_state(issue_key)
+        try:
+            for _ in range(limit):
+                step = self.next_step(issue_key, target)
+                if step is None:
+                    return
+                yield step
+                if step[1]:
+                    return
+            raise LookupError(f"{issue_key} did not reach {target} within {limit} transitions")
+        except LookupError:
+            for transition in self.path_back(issue_key, origin):
+                yield transition, None
+            raise
+
+    def path_back(self, issue_key, origin):
+        """Transitions returning the issue to `origin` after a failed walk ([] if it never left)"""
+        project = issue_key.rsplit('-', 1)[0]
+        issue_type, status = self.metadata.issue_state(issue_key)
+        if status == origin:
+            return []
+        self.metadata.transitions(issue_key)
+        self._learn(project, issue_type, status)
+        path = self.path(project, issue_type, status, origin)
+        if path is None:
+            raise LookupError(f"{issue_key} is stuck in {status}: no known way back to {origin}")
+        return path
+
+    def path(self, project, issue_type, source, target):
+        """Shortest known list of transitions from `source` to `target`, or None"""
+        key = (project, issue_type, source, target.lower())
+        with self.lock:
+            if key in self.paths:
+                return self.paths[key]
+        path = self._search(project, issue_type, source, lambda status: status.lower() == target.lower())
+        # Misses aren't cached: discovering more of the graph can make the target reachable
+        if path is not None:
+            with self.lock:
+                self.paths[key] = path
+        return path
+
+    def _path_to_unexplored(self, project, issue_type, source):
+        def unexplored(status):
+            return self.metadata.known_transitions(project, issue_type, status) is None
+        return self._search(project, issue_type, source, unexplored)
+
+    def _search(self, project, issue_type, source, is_goal):
+        """Breadth-first search over discovered transitions"""
+        previous = {source: None}
+        queue = deque([source])
+        while queue:
+            status = queue.popleft()
+            for transition in self.metadata.known_transitions(project, issue_type, status) or []:
+                to = transition.get('to')
+                if not to or to in previous:
+                    continue
+                previous[to] = (status, transition)
+                if is_goal(to):
+                    path = []
+                    while previous[to] is not None:
+                        to, transition = previous[to]
+                        path.append(transition)
+                    return path[::-1]
+                queue.append(to)
+        return None
+
+    def _learn(self, project, issue_type, status):
+        with self.lock:
+            known = self.explored.setdefault((project, issue_type), set())
+            if status not in known:
+                known.add(status)
+                self.paths = {}
+
+
+def get_workflow_planner(jira):
+    """Return the planner shared by every module using this client"""
+    metadata = get_metadata_cache(jira)
+    with metadata.lock:
+        planner = getattr(metadata, 'planner', None)
+        if planner is None:
+            planner = metadata.planner = WorkflowPlanner(metadata)
+        return planner